@@ -178,6 +178,38 @@ try:
 except Exception as e:
     print(f"Error registering blueprints: {e}")
 
+# Share parsed resumes and GitHub data across workers through MongoDB
+if db is not None:
+    try:
+        from models.metis import parse_cache
+        parse_cache.cache.attach_collection(db.resume_parse_cache)
+    except Exception as e:
+        print(f"⚠️ Parse cache Mongo tier unavailable: {e}")
+    try:
+        from models.metis import response_cache
+        response_cache.cache.attach_collection(db.github_response_cache)
+    except Exception as e:
+        print(f"⚠️ GitHub response cache Mongo tier unavailable: {e}")
+    try:
+        from models.metis import github_snapshots
+        github_snapshots.store.attach_collection(db.github_snapshots)
+    except Exception as e:
+        print(f"⚠️ GitHub snapshot Mongo tier unavailable: {e}")
+
+# Pooled HTTP clients for GitHub/portfolio enrichment, closed at shutdown
+try:
+    import atexit
+    from models.metis import http_clients
+    http_clients.registry.configure(
+        max_connections=int(os.getenv('METIS_HTTP_MAX_CONNECTIONS', http_clients.DEFAULT_MAX_CONNECTIONS)),
+        max_keepalive=int(os.getenv('METIS_HTTP_MAX_KEEPALIVE', http_clients.DEFAULT_MAX_KEEPALIVE)),
+        keepalive_expiry=float(os.getenv('METIS_HTTP_KEEPALIVE_EXPIRY', http_clients.DEFAULT_KEEPALIVE_EXPIRY)),
+        http2=os.getenv('METIS_HTTP2') == '1',
+    )
+    atexit.register(http_clients.registry.close)
+except Exception as e:
+    print(f"⚠️ HTTP client pool configuration failed: {e}")
+
 # Initialize SocketIO handlers only when not on Vercel
 if not IS_VERCEL and socketio is not None:
     try:
@@ -0,0 +1,5 @@
+"""
+Benchmarks for METIS models.
+
+Run from the backend directory, e.g. ``python -m benchmarks.bench_resume_parser``.
+"""
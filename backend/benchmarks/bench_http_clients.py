@@ -0,0 +1,244 @@
+"""
+HTTP Client Pooling Benchmark
+
+Analyzes a run of GitHub profiles one after another against a local
+stand-in for the GitHub API (bypassing the snapshot store), once with a
+fresh client per profile (what asyncio.run(...) does) and once through the
+pooled http_clients registry, and reports wall time and connections opened.
+Every profile must come out identical both ways. --cache then re-analyzes the
+profiles through the GitHub response cache (cold, fresh and stale) and
+reports how many requests would count against the rate limit.
+
+The stand-in server speaks plain HTTP/1.1, so opening a connection is much
+cheaper than a TCP+TLS handshake to api.github.com; --handshake-ms delays
+every new connection to stand in for that cost, and --latency-ms delays
+every request to stand in for the round trip. Even without a handshake
+delay a fresh client is expensive: each one loads the CA bundle into a new
+SSL context.
+
+Usage (from backend/):
+    python -m benchmarks.bench_http_clients
+    python -m benchmarks.bench_http_clients --profiles 200 --handshake-ms 60
+    python -m benchmarks.bench_http_clients --latency-ms 30
+    python -m benchmarks.bench_http_clients --cache
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import socket
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+from models.metis import github_analyzer
+from models.metis import http_clients
+from models.metis import response_cache
+
+
+REPOS_PER_USER = 8  # default; --repos sets it
+FORK_EVERY = 3  # every third repository is a fork
+LANGUAGES = ["Python", "TypeScript", "Go", "Rust", "Java"]
+
+
+def user_payload(username: str, repos: int) -> dict:
+    return {
+        "login": username,
+        "name": username.title(),
+        "bio": "Builds things",
+        "followers": len(username) * 7,
+        "following": 3,
+        "public_repos": repos,
+        "created_at": "2019-04-01T00:00:00Z",
+    }
+
+
+def repo_payload(username: str, i: int) -> dict:
+    return {
+        "name": f"{username}-project-{i}",
+        "description": f"Project {i}",
+        "language": LANGUAGES[i % len(LANGUAGES)],
+        "stargazers_count": i * 3,
+        "forks_count": i,
+        "size": 100 + i * 50,
+        "fork": i % FORK_EVERY == FORK_EVERY - 1,
+        "created_at": "2021-01-01T00:00:00Z",
+        "updated_at": f"2024-0{1 + i % 9}-01T00:00:00Z",
+        "topics": ["demo"],
+    }
+
+
+def commit_total(repo_name: str) -> int:
+    return 1 + int(repo_name.rsplit("-", 1)[-1]) * 7
+
+
+def commit_payload(i: int) -> dict:
+    return {"sha": f"{i:040x}", "commit": {"message": f"Commit {i}"}}
+
+
+class StandInServer(ThreadingHTTPServer):
+    """Threaded stand-in for the GitHub REST API that counts connections."""
+    
+    daemon_threads = True
+    
+    def __init__(self, handshake: float, latency: float = 0.0, repos: int = REPOS_PER_USER):
+        super().__init__(("127.0.0.1", 0), StandInHandler)
+        self.handshake = handshake
+        self.latency = latency
+        self.repos = repos
+        self.connections = 0
+        self.requests = 0
+        self.not_modified = 0
+        self.lock = threading.Lock()
+    
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive
+    
+    def setup(self):
+        super().setup()
+        # Headers and body go out in separate writes; without this, Nagle's
+        # algorithm holds the body back for a delayed ACK on every request
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        with self.server.lock:
+            self.server.connections += 1
+        time.sleep(self.server.handshake)
+    
+    def do_GET(self):
+        with self.server.lock:
+            self.server.requests += 1
+        time.sleep(self.server.latency)
+        url = urlparse(self.path)
+        query = {key: int(values[0]) for key, values in parse_qs(url.query).items() if values[0].isdigit()}
+        parts = url.path.strip("/").split("/")
+        if parts[0] == "users" and len(parts) == 2:
+            self.send_json(user_payload(parts[1], self.server.repos))
+        elif parts[0] == "users" and parts[2:] == ["repos"]:
+            self.send_page(url.path, query, self.server.repos, lambda i: repo_payload(parts[1], i))
+        elif parts[0] == "repos" and parts[3:] == ["commits"]:
+            self.send_page(url.path, query, commit_total(parts[2]), commit_payload)
+        else:
+            self.send_json({"message": "Not Found"}, status=404)
+    
+    def send_page(self, path: str, query: dict, total: int, item):
+        """Send one page of total items with GitHub-style next/last links."""
+        per_page = query.get("per_page", 30)
+        page = query.get("page", 1)
+        last = max(1, -(-total // per_page))
+        links = []
+        if page < last:
+            links.append(f'<{self.server.url}{path}?per_page={per_page}&page={page + 1}>; rel="next"')
+            links.append(f'<{self.server.url}{path}?per_page={per_page}&page={last}>; rel="last"')
+        first = (page - 1) * per_page
+        items = [item(i) for i in range(first, min(first + per_page, total))]
+        self.send_json(items, headers={"Link": ", ".join(links)} if links else None)
+    
+    def send_json(self, payload, status: int = 200, headers: dict | None = None):
+        body = json.dumps(payload).encode()
+        etag = f'"{hashlib.sha1(body).hexdigest()}"'
+        if status == 200 and self.headers.get("If-None-Match") == etag:
+            with self.server.lock:
+                self.server.not_modified += 1
+            status, body = 304, b""
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        if status != 404:
+            self.send_header("ETag", etag)
+        # An authenticated-sized budget, so the rate limit scheduler never waits
+        self.send_header("X-RateLimit-Limit", "5000")
+        self.send_header("X-RateLimit-Remaining", "5000")
+        self.send_header("X-RateLimit-Reset", str(int(time.time()) + 3600))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def log_message(self, format, *args):
+        pass
+
+
+def analyze_per_call(username: str) -> dict:
+    return asyncio.run(github_analyzer.analyze_fresh(username))
+
+
+def analyze_pooled(username: str) -> dict:
+    return http_clients.registry.run(github_analyzer.analyze_fresh(username))
+
+
+def run_profiles(server: StandInServer, usernames: list[str], analyze) -> tuple[float, int, list[dict]]:
+    """Analyze every username in turn; return (seconds, connections opened, results)."""
+    connections = server.connections
+    start = time.perf_counter()
+    results = [analyze(username) for username in usernames]
+    return time.perf_counter() - start, server.connections - connections, results
+
+
+def check_cache(server: StandInServer, usernames: list[str], expected: list[dict]) -> int:
+    """
+    Re-analyze the profiles through a response cache three times: cold,
+    while every entry is fresh, and with every entry stale. Return the
+    number of results that differ from the uncached ones.
+    """
+    cache = response_cache.cache = response_cache.ResponseCache()
+    mismatches = 0
+    for label, fresh_seconds in (("cold", cache.fresh_seconds), ("fresh", cache.fresh_seconds), ("stale", 0)):
+        cache.fresh_seconds = fresh_seconds
+        requests, not_modified = server.requests, server.not_modified
+        seconds, _, results = run_profiles(server, usernames, analyze_pooled)
+        requests, not_modified = server.requests - requests, server.not_modified - not_modified
+        print(f"{label} cache: {seconds:.3f}s, {requests - not_modified} counted requests, "
+              f"{not_modified} not modified")
+        mismatches += sum(result != reference for result, reference in zip(results, expected))
+    return mismatches
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--profiles", type=int, default=120, help="number of sequential profiles")
+    parser.add_argument("--handshake-ms", type=float, default=20.0, help="delay per new connection")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="delay per request")
+    parser.add_argument("--repos", type=int, default=REPOS_PER_USER, help="repositories per profile")
+    parser.add_argument("--cache", action="store_true", help="also re-analyze through the response cache")
+    args = parser.parse_args(argv)
+    
+    server = StandInServer(args.handshake_ms / 1000, args.latency_ms / 1000, args.repos)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    github_analyzer.GITHUB_API_URL = server.url
+    usernames = [f"candidate{i}" for i in range(args.profiles)]
+    
+    try:
+        # Keep the response cache out of the pooling comparison
+        response_cache.cache = response_cache.ResponseCache(max_entries=0)
+        per_call, per_call_connections, expected = run_profiles(server, usernames, analyze_per_call)
+        pooled, pooled_connections, results = run_profiles(server, usernames, analyze_pooled)
+        
+        print(f"{args.profiles} profiles, {server.requests // 2} requests each run, "
+              f"{args.handshake_ms:.0f} ms per new connection, {args.latency_ms:.0f} ms per request")
+        print(f"client per profile: {per_call:.3f}s  ({per_call / args.profiles * 1000:.1f} ms/profile, "
+              f"{per_call_connections} connections)")
+        print(f"pooled client:      {pooled:.3f}s  ({pooled / args.profiles * 1000:.1f} ms/profile, "
+              f"{pooled_connections} connections)")
+        mismatches = sum(result != reference for result, reference in zip(results, expected))
+        print(f"speedup: {per_call / pooled:.2f}x, result mismatches: {mismatches}")
+        
+        if args.cache:
+            cache_mismatches = check_cache(server, usernames, expected)
+            print(f"cached result mismatches: {cache_mismatches}")
+            mismatches += cache_mismatches
+    finally:
+        http_clients.registry.close()
+        server.shutdown()
+    
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,130 @@
+"""
+Resume Parser Worst-Case Benchmark
+
+Feeds resume_parser.parse pathological and fuzzed input and reports the
+slowest parses. Exits non-zero when any single parse exceeds --limit
+seconds, so it can guard the parsing budget (input caps, whitespace
+normalization, line wrapping and per-section deadlines) against regressions.
+
+Normalization and contact extraction have no deadline; their cost is bounded
+by MAX_RAW_CHARS, MAX_RESUME_CHARS and MAX_LINE_CHARS, and the worst input
+here takes ~0.15s. The default --limit leaves room for a loaded machine.
+
+Usage (from backend/):
+    python -m benchmarks.bench_parse_budget
+    python -m benchmarks.bench_parse_budget --fuzz 500 --limit 0.5
+"""
+
+import argparse
+import random
+import sys
+import time
+
+from models.metis import resume_parser
+
+from .resume_corpus import generate_corpus
+
+
+SECTION_HEADERS = ["", "EXPERIENCE", "EDUCATION", "PROJECTS", "CERTIFICATIONS", "SKILLS", "SUMMARY"]
+
+# Short seeds that each stress one family of patterns when repeated
+PATHOLOGICAL_UNITS = {
+    "letters": "a",
+    "capitals": "A",
+    "digits": "1",
+    "dotted_digits": "1.",
+    "month_prefixes": "Jan",
+    "spaces": " ",
+    "tabs": "\t",
+    "blank_lines": "\n",
+    "space_lines": " \n",
+    "pipes": "a |",
+    "dashes": "a -",
+    "at_words": "Aaaaaaaaaaaa at ",
+    "degree_words": "Bachelor ",
+    "header_lines": "skills\n",
+    "comma_names": ", Aaaa",
+    "url_labels": "http://a.",
+    "linkedin_labels": "LinkedIn: x",
+    "percent_digits": "9.9.9",
+    "caps_lines": "A" * 90 + "\n",
+}
+
+
+def pathological_cases(size: int):
+    """Yield (label, text) pairs built from each unit repeated to size chars."""
+    for name, unit in PATHOLOGICAL_UNITS.items():
+        payload = unit * (size // len(unit) + 1)
+        for header in SECTION_HEADERS:
+            label = f"{name}/{header.lower() or 'none'}"
+            yield label, f"John Smith\njohn.smith@mail.dev\n{header}\n{payload[:size]}\n"
+
+
+def mutate(rng: random.Random, text: str) -> str:
+    """Apply a few random structure-breaking edits to a resume."""
+    for _ in range(rng.randint(1, 4)):
+        op = rng.randrange(5)
+        i = rng.randrange(len(text) + 1)
+        if op == 0:  # repeat a slice many times
+            j = min(len(text), i + rng.randint(1, 200))
+            text = text[:i] + text[i:j] * rng.randint(10, 500) + text[j:]
+        elif op == 1:  # splice in a pathological run
+            unit = rng.choice(list(PATHOLOGICAL_UNITS.values()))
+            text = text[:i] + unit * rng.randint(100, 5000) + text[i:]
+        elif op == 2:  # join lines into one long line
+            text = text.replace("\n", " ")
+        elif op == 3:  # drop a chunk
+            text = text[:i] + text[i + rng.randint(1, 2000):]
+        else:  # duplicate the whole resume
+            text = text * rng.randint(2, 8)
+    return text
+
+
+def time_parse(text: str) -> tuple[float, dict]:
+    start = time.perf_counter()
+    result = resume_parser.parse(text, use_cache=False)
+    return time.perf_counter() - start, result
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size", type=int, default=resume_parser.MAX_RESUME_CHARS * 2,
+                        help="characters per pathological input (default: twice the input cap)")
+    parser.add_argument("--fuzz", type=int, default=200, help="number of fuzzed resumes")
+    parser.add_argument("--seed", type=int, default=1337)
+    parser.add_argument("--limit", type=float, default=0.25, help="fail if any parse takes longer (seconds)")
+    parser.add_argument("--top", type=int, default=10, help="slowest inputs to list")
+    args = parser.parse_args(argv)
+
+    timings = []
+    partial = 0
+
+    for label, text in pathological_cases(args.size):
+        elapsed, result = time_parse(text)
+        partial += result["partial"]
+        timings.append((elapsed, label, result["partial_sections"]))
+
+    rng = random.Random(args.seed)
+    corpus = generate_corpus(max(1, args.fuzz // 4), seed=args.seed)
+    for n in range(args.fuzz):
+        elapsed, result = time_parse(mutate(rng, rng.choice(corpus)))
+        partial += result["partial"]
+        timings.append((elapsed, f"fuzz#{n}", result["partial_sections"]))
+
+    timings.sort(reverse=True)
+    total = len(timings)
+    print(f"Inputs: {total} ({total - args.fuzz} pathological, {args.fuzz} fuzzed), "
+          f"{partial} flagged partial")
+    print(f"budget: {resume_parser.MAX_RESUME_CHARS} chars, {resume_parser.MAX_LINE_CHARS} chars/line, "
+          f"{resume_parser.SECTION_TIME_BUDGET:.2f}s/section")
+    for elapsed, label, sections in timings[:args.top]:
+        cut = f"  partial: {', '.join(sections)}" if sections else ""
+        print(f"  {elapsed * 1000:8.1f} ms  {label}{cut}")
+
+    worst = timings[0][0]
+    print(f"worst: {worst:.3f}s (limit {args.limit:.2f}s)")
+    return 1 if worst > args.limit else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,77 @@
+"""
+PDF/DOCX Extraction Benchmark
+
+Times each available PDF engine on real PDF files, with and without the
+page/character budget, to check the engine order in PDF_ENGINE_ORDER.
+DOCX files are timed through the streaming extractor with and without its
+character budget, along with peak traced memory.
+
+Usage (from backend/):
+    python -m benchmarks.bench_pdf_extraction resume1.pdf resume2.pdf resume3.docx
+"""
+
+import argparse
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+from models.metis import resume_parser
+
+
+def time_engine(engine, data: bytes, max_pages: int | None) -> tuple[float, int]:
+    """Return (seconds, characters) for one engine over one PDF."""
+    start = time.perf_counter()
+    chars = 0
+    for index, text in enumerate(engine(data, 0)):
+        if max_pages is not None and index >= max_pages:
+            break
+        chars += len(text)
+    return time.perf_counter() - start, chars
+
+
+def time_docx(data: bytes, max_chars: int | None) -> tuple[float, int, int]:
+    """Return (seconds, characters, peak traced bytes) for one DOCX."""
+    tracemalloc.start()
+    try:
+        start = time.perf_counter()
+        chars = len(resume_parser.extract_text_from_docx(data, max_chars=max_chars))
+        elapsed = time.perf_counter() - start
+        return elapsed, chars, tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("files", nargs="+", help="PDF files to extract")
+    args = parser.parse_args(argv)
+    
+    engines = resume_parser._pdf_engines()
+    
+    for path in args.files:
+        data = Path(path).read_bytes()
+        print(f"{path} ({len(data) / 1024:.0f} KB)")
+        if path.lower().endswith(".docx"):
+            for budget in (None, resume_parser.MAX_DOCX_CHARS):
+                seconds, chars, peak = time_docx(data, budget)
+                print(f"  {'docx':<10} chars<={budget}: {seconds * 1000:8.1f} ms, {chars} chars, "
+                      f"peak {peak / 1024:.0f} KiB")
+            continue
+        if not engines:
+            print("  no PDF library available. Install pdfplumber or pypdf")
+            continue
+        for name, engine in engines:
+            for budget in (None, resume_parser.MAX_PDF_PAGES):
+                try:
+                    seconds, chars = time_engine(engine, data, budget)
+                except Exception as e:
+                    print(f"  {name:<10} pages<={budget}: failed ({e})")
+                    continue
+                print(f"  {name:<10} pages<={budget}: {seconds * 1000:8.1f} ms, {chars} chars")
+    
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
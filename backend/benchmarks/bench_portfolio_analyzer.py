@@ -0,0 +1,137 @@
+"""
+Portfolio Analyzer Benchmark
+
+Serves a synthetic portfolio corpus from a local HTTP server and runs
+portfolio_analyzer.analyze_portfolio over it through the pooled client,
+reporting wall time and the peak traced memory of a single analysis. With
+--against, the analyzer from another git revision analyzes the same pages
+in the same process and the results are compared field by field.
+
+Usage (from backend/):
+    python -m benchmarks.bench_portfolio_analyzer
+    python -m benchmarks.bench_portfolio_analyzer --against HEAD~1
+    python -m benchmarks.bench_portfolio_analyzer --count 40 --sizes 1,64,256
+"""
+
+import argparse
+import socket
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from models.metis import http_clients
+from models.metis import portfolio_analyzer
+
+from .bench_resume_parser import load_module_at
+from .portfolio_corpus import generate_pages
+
+
+ANALYZER_PATH = "backend/models/metis/portfolio_analyzer.py"
+
+
+class PageServer(ThreadingHTTPServer):
+    """Serves pages[i] at /page/i."""
+    
+    daemon_threads = True
+    
+    def __init__(self, pages: list[str]):
+        super().__init__(("127.0.0.1", 0), PageHandler)
+        self.pages = [page.encode() for page in pages]
+    
+    def url(self, index: int) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}/page/{index}"
+
+
+class PageHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive
+    
+    def setup(self):
+        super().setup()
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    
+    def do_GET(self):
+        body = self.server.pages[int(self.path.rsplit("/", 1)[-1])]
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def log_message(self, format, *args):
+        pass
+
+
+def run_analyzer(analyzer, urls: list[str], repeat: int) -> tuple[float, int, list[dict]]:
+    """Return (best total seconds, largest per-page peak bytes, results)."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for url in urls:
+            http_clients.registry.run(analyzer.analyze_portfolio(url))
+        best = min(best, time.perf_counter() - start)
+    
+    peak = 0
+    results = []
+    tracemalloc.start()
+    try:
+        for url in urls:
+            current, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            results.append(http_clients.registry.run(analyzer.analyze_portfolio(url)).to_dict())
+            peak = max(peak, tracemalloc.get_traced_memory()[1] - current)
+    finally:
+        tracemalloc.stop()
+    return best, peak, results
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=40, help="number of pages")
+    parser.add_argument("--sizes", default="1,4,16,64", help="comma-separated page size factors")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per analyzer; best is reported")
+    parser.add_argument("--seed", type=int, default=1337)
+    parser.add_argument("--against", help="git revision to compare with (e.g. HEAD~1)")
+    args = parser.parse_args(argv)
+    
+    pages = generate_pages(args.count, seed=args.seed, sizes=tuple(int(s) for s in args.sizes.split(",")))
+    server = PageServer(pages)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    urls = [server.url(i) for i in range(len(pages))]
+    print(f"Corpus: {len(pages)} pages, {sum(map(len, pages)) / len(pages) / 1024:.0f} KiB average, "
+          f"{max(map(len, pages)) / 1024:.0f} KiB largest")
+    
+    try:
+        current, current_peak, results = run_analyzer(portfolio_analyzer, urls, args.repeat)
+        print(f"current: {current:.3f}s  ({current / len(urls) * 1000:.2f} ms/page, "
+              f"peak {current_peak / 1024:.0f} KiB)")
+        
+        if args.against:
+            baseline = load_module_at(args.against, ANALYZER_PATH, portfolio_analyzer.__package__)
+            before, before_peak, expected = run_analyzer(baseline, urls, args.repeat)
+            print(f"{args.against}: {before:.3f}s  ({before / len(urls) * 1000:.2f} ms/page, "
+                  f"peak {before_peak / 1024:.0f} KiB)")
+            fields = Counter(
+                key
+                for result, reference in zip(results, expected)
+                for key in reference
+                if result.get(key) != reference[key]
+            )
+            mismatches = sum(result != reference for result, reference in zip(results, expected))
+            print(f"speedup: {before / current:.2f}x, peak memory {before_peak / max(current_peak, 1):.2f}x lower, "
+                  f"result mismatches: {mismatches}")
+            for key, count in fields.most_common():
+                print(f"  {key}: {count} pages differ")
+            if mismatches:
+                return 1
+    finally:
+        http_clients.registry.close()
+        server.shutdown()
+    
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
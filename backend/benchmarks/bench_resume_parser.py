@@ -0,0 +1,141 @@
+"""
+Resume Parser Benchmark
+
+Times resume_parser.parse over a synthetic corpus. With --against, the
+parser module from another git revision is loaded side by side so the
+before/after numbers come from the same corpus and process.
+
+Usage (from backend/):
+    python -m benchmarks.bench_resume_parser
+    python -m benchmarks.bench_resume_parser --against HEAD~1
+    python -m benchmarks.bench_resume_parser --count 2000 --workers 1,2,4,8
+"""
+
+import argparse
+import inspect
+import subprocess
+import sys
+import time
+import types
+from pathlib import Path
+
+from models.metis import parse_cache, resume_parser
+
+from .resume_corpus import generate_corpus
+
+
+PARSER_PATH = "backend/models/metis/resume_parser.py"
+
+
+def load_module_at(rev: str, path: str, package: str) -> types.ModuleType:
+    """Load a module file (repo-relative path) as it exists at a git revision."""
+    repo_root = Path(__file__).resolve().parents[2]
+    source = subprocess.run(
+        ["git", "show", f"{rev}:{path}"],
+        cwd=repo_root, check=True, capture_output=True, text=True,
+    ).stdout
+    module = types.ModuleType(f"{Path(path).stem}_{rev}")
+    # Resolve relative imports against the current package
+    module.__package__ = package
+    exec(compile(source, f"{rev}:{path}", "exec"), module.__dict__)
+    return module
+
+
+def load_parser_at(rev: str) -> types.ModuleType:
+    """Load resume_parser.py as it exists at a git revision."""
+    return load_module_at(rev, PARSER_PATH, resume_parser.__package__)
+
+
+def comparable(result: dict, legacy: bool = False) -> dict:
+    """
+    Normalize a parse result for cross-revision comparison.
+    
+    When comparing against a legacy (v1) result that carries alias keys, the
+    compact result is expanded through ResumeView first. Lists of strings
+    built from sets have no stable order and are sorted.
+    """
+    def canon(value):
+        if isinstance(value, dict):
+            return {k: canon(v) for k, v in value.items()}
+        if isinstance(value, list):
+            value = [canon(v) for v in value]
+            return sorted(value) if all(isinstance(v, str) for v in value) else value
+        return value
+    
+    if legacy and "work_experience" not in result:
+        result = resume_parser.ResumeView(result).to_dict()
+    return canon(result)
+
+
+def time_parser(parse, corpus: list[str], repeat: int) -> float:
+    """Return the best total wall time (seconds) over repeat runs."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for text in corpus:
+            parse(text)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def time_parse_many(corpus: list[str], workers: int) -> float:
+    """Return wall time (seconds) for parse_many on a cold cache."""
+    parse_cache.cache.clear()
+    start = time.perf_counter()
+    resume_parser.parse_many(corpus, workers=workers)
+    elapsed = time.perf_counter() - start
+    parse_cache.cache.clear()
+    return elapsed
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=300, help="number of synthetic resumes")
+    parser.add_argument("--repeat", type=int, default=5, help="runs per parser; best is reported")
+    parser.add_argument("--seed", type=int, default=1337)
+    parser.add_argument("--against", help="git revision to compare with (e.g. HEAD~1)")
+    parser.add_argument("--workers", help="comma-separated worker counts for parse_many, e.g. 1,2,4")
+    args = parser.parse_args(argv)
+    
+    corpus = generate_corpus(args.count, seed=args.seed)
+    total_kb = sum(len(t) for t in corpus) / 1024
+    print(f"Corpus: {len(corpus)} resumes, {total_kb:.0f} KB")
+    
+    # Time the parser itself, not the cache
+    parse = lambda text: resume_parser.parse(text, use_cache=False)
+    current = time_parser(parse, corpus, args.repeat)
+    print(f"current: {current:.3f}s  ({current / len(corpus) * 1000:.2f} ms/resume)")
+    
+    if args.against:
+        baseline = load_parser_at(args.against)
+        baseline_parse = baseline.parse
+        if "use_cache" in inspect.signature(baseline.parse).parameters:
+            baseline_parse = lambda text: baseline.parse(text, use_cache=False)
+        
+        mismatches = 0
+        for text in corpus:
+            before_result = baseline_parse(text)
+            legacy = "work_experience" in before_result
+            after_result = comparable(parse(text), legacy)
+            # Keys added since the baseline revision are not mismatches
+            after_result = {k: after_result.get(k) for k in before_result}
+            mismatches += comparable(before_result) != after_result
+        before = time_parser(baseline_parse, corpus, args.repeat)
+        print(f"{args.against}: {before:.3f}s  ({before / len(corpus) * 1000:.2f} ms/resume)")
+        print(f"speedup: {before / current:.2f}x, output mismatches: {mismatches}")
+        if mismatches:
+            return 1
+    
+    if args.workers:
+        base = None
+        for workers in (int(w) for w in args.workers.split(",")):
+            elapsed = time_parse_many(corpus, workers)
+            base = base or elapsed * workers
+            print(f"parse_many workers={workers}: {elapsed:.3f}s  "
+                  f"({len(corpus) / elapsed:.0f} resumes/s, efficiency {base / (elapsed * workers):.0%})")
+    
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
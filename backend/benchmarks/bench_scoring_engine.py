@@ -0,0 +1,113 @@
+"""
+Scoring Engine Benchmark
+
+Times scoring_engine.evaluate over a synthetic candidate corpus. With
+--against, the engine from another git revision scores the same corpus in
+the same process and every result must match exactly, so the run doubles as
+a score regression check for engine refactors. --batch times evaluate_batch
+(feature extraction and vectorized scoring separately), checks its scores
+against evaluate, and checks that rescore_batch over the feature records
+after a JSON round trip (as stored in metisFeatures) reproduces every full
+result.
+
+Usage (from backend/):
+    python -m benchmarks.bench_scoring_engine
+    python -m benchmarks.bench_scoring_engine --against HEAD~1
+    python -m benchmarks.bench_scoring_engine --batch --count 2000
+"""
+
+import argparse
+import json
+import sys
+import time
+
+from models.metis import scoring_engine
+
+from .bench_resume_parser import load_module_at
+from .scoring_corpus import generate_candidates
+
+
+ENGINE_PATH = "backend/models/metis/scoring_engine.py"
+
+
+def time_engine(evaluate, candidates: list, repeat: int) -> float:
+    """Return the best total wall time (seconds) over repeat runs."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for resume_data, github_data, portfolio_data in candidates:
+            evaluate(resume_data, github_data, portfolio_data)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def check_batch(candidates: list, repeat: int) -> int:
+    """Time evaluate_batch and return the number of rows whose scores differ from evaluate."""
+    columns = [list(column) for column in zip(*candidates)]
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        batch = scoring_engine.evaluate_batch(*columns)
+        best = min(best, time.perf_counter() - start)
+    
+    start = time.perf_counter()
+    scoring_engine.score_features(batch.features)
+    rubric = time.perf_counter() - start
+    print(f"evaluate_batch: {best:.3f}s  ({best / len(candidates) * 1e6:.0f} us/candidate, "
+          f"vectorized scoring {rubric * 1000:.2f} ms)")
+    
+    stored = json.loads(json.dumps(batch.records))
+    start = time.perf_counter()
+    rescored = scoring_engine.rescore_batch(stored)
+    rescore = time.perf_counter() - start
+    print(f"rescore_batch from stored features: {rescore * 1000:.2f} ms")
+    
+    mismatches = 0
+    for row, candidate in enumerate(candidates):
+        expected = scoring_engine.evaluate(*candidate)
+        mismatches += batch.scores(row) != {
+            "overall_score": expected["overall_score"],
+            "section_scores": expected["section_scores"],
+        }
+        mismatches += rescored.result(row) != expected
+    return mismatches
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=300, help="number of synthetic candidates")
+    parser.add_argument("--repeat", type=int, default=5, help="runs per engine; best is reported")
+    parser.add_argument("--seed", type=int, default=1337)
+    parser.add_argument("--against", help="git revision to compare with (e.g. HEAD~1)")
+    parser.add_argument("--batch", action="store_true", help="also time evaluate_batch")
+    args = parser.parse_args(argv)
+    
+    candidates = generate_candidates(args.count, seed=args.seed)
+    print(f"Corpus: {len(candidates)} candidates")
+    
+    current = time_engine(scoring_engine.evaluate, candidates, args.repeat)
+    print(f"current: {current:.3f}s  ({current / len(candidates) * 1e6:.0f} us/candidate)")
+    
+    if args.against:
+        baseline = load_module_at(args.against, ENGINE_PATH, scoring_engine.__package__)
+        mismatches = sum(
+            baseline.evaluate(*candidate) != scoring_engine.evaluate(*candidate)
+            for candidate in candidates
+        )
+        before = time_engine(baseline.evaluate, candidates, args.repeat)
+        print(f"{args.against}: {before:.3f}s  ({before / len(candidates) * 1e6:.0f} us/candidate)")
+        print(f"speedup: {before / current:.2f}x, result mismatches: {mismatches}")
+        if mismatches:
+            return 1
+    
+    if args.batch:
+        mismatches = check_batch(candidates, args.repeat)
+        print(f"batch score mismatches: {mismatches}")
+        if mismatches:
+            return 1
+    
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,311 @@
+"""
+Resume Section Parser Benchmark
+
+Runs each stage of resume_parser over a synthetic corpus and reports
+throughput, p50/p99 latency and peak traced memory per stage. Results can be
+saved as a baseline and later checked against it; the run fails when a
+stage's p50, p99 or peak memory grows past --threshold and by more than the
+absolute noise floor (--min-delta-us, --min-delta-kib). Latency is compared
+relative to a fixed calibration workload timed in the same process, so the
+stored baseline survives moving between machines. Each latency metric is
+the median over --rounds independent rounds, each with its own calibration,
+so one slow stretch on a shared machine does not decide the result.
+
+Usage (from backend/):
+    python -m benchmarks.bench_section_parsers
+    python -m benchmarks.bench_section_parsers --save-baseline
+    python -m benchmarks.bench_section_parsers --check --threshold 0.3 --rounds 9
+"""
+
+import argparse
+import gc
+import json
+import platform
+import re
+import statistics
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+from models.metis import resume_parser as rp
+
+from .resume_corpus import generate_corpus
+
+
+DEFAULT_BASELINE = Path(__file__).resolve().parent / "baselines" / "section_parsers.json"
+
+# Metrics where a larger value is a regression; latency is checked relative
+# to the calibration workload rather than in absolute microseconds
+CHECKED_METRICS = ("p50_rel", "p99_rel", "peak_kib")
+
+# Growth below these is noise however large it is in relative terms; a
+# relative latency metric is converted to microseconds with the current
+# calibration before the floor is applied
+DEFAULT_MIN_DELTA_US = 50.0
+DEFAULT_MIN_DELTA_KIB = 4.0
+
+CALIBRATION_RE = re.compile(r"\b[A-Za-z][a-z]+\b")
+
+
+def _contact(doc: dict):
+    text = doc["text"]
+    rp.extract_name(text)
+    rp.extract_email(text)
+    rp.extract_phone(text)
+    rp.extract_location(text)
+    rp.extract_links(text)
+
+
+# Stage name -> callable over a prepared document (raw, normalized text, sections)
+STAGES = {
+    "normalize_text": lambda doc: rp.normalize_text(doc["raw"]),
+    "contact": _contact,
+    "segment_sections": lambda doc: rp.segment_sections(doc["text"]),
+    "extract_skills_section": lambda doc: rp.extract_skills_section(doc["text"]),
+    "parse_experience_section": lambda doc: rp.parse_experience_section(doc["text"], doc["sections"]),
+    "parse_education_section": lambda doc: rp.parse_education_section(doc["text"], doc["sections"]),
+    "parse_projects_section": lambda doc: rp.parse_projects_section(doc["text"], doc["sections"]),
+    "parse_certifications_section": lambda doc: rp.parse_certifications_section(doc["text"], doc["sections"]),
+    "parse": lambda doc: rp.parse(doc["raw"], use_cache=False),
+}
+
+
+def prepare(corpus: list[str]) -> list[dict]:
+    """Normalize and segment each resume once, as _parse_normalized does."""
+    docs = []
+    for raw in corpus:
+        text = rp.normalize_text(raw)
+        docs.append({"raw": raw, "text": text, "sections": rp.segment_sections(text)})
+    return docs
+
+
+def percentile(sorted_values: list[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    index = max(0, min(len(sorted_values) - 1, round(pct / 100 * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def calibrate(rounds: int = 5) -> float:
+    """
+    Best time (seconds) of a fixed regex-and-dict workload.
+    
+    Timings are stored relative to this, so a baseline recorded on one
+    machine (or on a busy moment of a shared runner) still applies to
+    another.
+    """
+    text = "Senior Engineer | Acme Corp\nJan 2020 - Present\n- Built APIs using Python\n" * 50
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for _ in range(20):
+            words = {}
+            for word in CALIBRATION_RE.findall(text):
+                words[word.lower()] = words.get(word.lower(), 0) + 1
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def time_stages(stages: dict, docs: list[dict], repeat: int) -> dict:
+    """
+    Best latency (seconds) per stage per document.
+    
+    Repeat rounds are interleaved across stages so a slow stretch on a
+    shared machine hits every stage alike, and the garbage collector is
+    paused while timing.
+    """
+    for stage in stages.values():  # warm caches and lazily compiled patterns
+        for doc in docs:
+            stage(doc)
+    
+    best = {name: [float("inf")] * len(docs) for name in stages}
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            for name, stage in stages.items():
+                row = best[name]
+                for i, doc in enumerate(docs):
+                    start = time.perf_counter()
+                    stage(doc)
+                    row[i] = min(row[i], time.perf_counter() - start)
+    finally:
+        gc.enable()
+    return best
+
+
+def peak_memory(stage, docs: list[dict]) -> int:
+    """Largest traced allocation peak (bytes) of a single call, in its own pass."""
+    peak = 0
+    tracemalloc.start()
+    try:
+        for doc in docs:
+            tracemalloc.reset_peak()
+            base = tracemalloc.get_traced_memory()[0]
+            stage(doc)
+            peak = max(peak, tracemalloc.get_traced_memory()[1] - base)
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+def summarize(latencies: list[float], peak: int, unit: float) -> dict:
+    """
+    Reduce per-document latencies to the reported metrics.
+    
+    Returns:
+        Dict with throughput (docs/s), p50_us, p99_us, mean_us, peak_kib and
+        p50/p99 relative to the calibration workload (p50_rel, p99_rel)
+    """
+    latencies = sorted(latencies)
+    p50, p99 = percentile(latencies, 50), percentile(latencies, 99)
+    return {
+        "throughput": round(len(latencies) / sum(latencies), 1),
+        "p50_us": round(p50 * 1e6, 1),
+        "p99_us": round(p99 * 1e6, 1),
+        "mean_us": round(statistics.fmean(latencies) * 1e6, 1),
+        "peak_kib": round(peak / 1024, 1),
+        "p50_rel": round(p50 / unit, 5),
+        "p99_rel": round(p99 / unit, 5),
+    }
+
+
+def measure(stages: dict, docs: list[dict], repeat: int, rounds: int) -> tuple[dict, float]:
+    """
+    Metrics per stage, each the median over independent timing rounds.
+    
+    Every round is bracketed by calibration runs and converted to relative
+    latency with its own calibration, so machine speed drifting between
+    rounds cancels out instead of landing in one round's numbers.
+    
+    Returns:
+        (stage name -> metrics dict as from summarize, median calibration seconds)
+    """
+    peaks = {name: peak_memory(stage, docs) for name, stage in stages.items()}
+    units = []
+    per_round = []
+    for _ in range(rounds):
+        unit = calibrate()
+        timings = time_stages(stages, docs, repeat)
+        unit = min(unit, calibrate())
+        units.append(unit)
+        per_round.append({name: summarize(timings[name], peaks[name], unit) for name in stages})
+    
+    results = {
+        name: {
+            metric: statistics.median(r[name][metric] for r in per_round)
+            for metric in per_round[0][name]
+        }
+        for name in stages
+    }
+    return results, statistics.median(units)
+
+
+def compare(
+    results: dict,
+    baseline: dict,
+    threshold: float,
+    unit: float,
+    min_delta_us: float = DEFAULT_MIN_DELTA_US,
+    min_delta_kib: float = DEFAULT_MIN_DELTA_KIB,
+) -> list[str]:
+    """
+    Return a description of every checked metric that regressed.
+    
+    A metric regresses when it grew past threshold (relative) and by more
+    than the noise floor (absolute; unit converts relative latency back to
+    seconds).
+    """
+    regressions = []
+    for stage, metrics in results.items():
+        before = baseline.get(stage)
+        if not before:
+            continue
+        for metric in CHECKED_METRICS:
+            old, new = before.get(metric), metrics[metric]
+            if not old or new <= old * (1 + threshold):
+                continue
+            if metric == "peak_kib":
+                if new - old <= min_delta_kib:
+                    continue
+            elif (new - old) * unit * 1e6 <= min_delta_us:
+                continue
+            regressions.append(f"{stage}.{metric}: {old} -> {new} (+{new / old - 1:.0%})")
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=200, help="number of synthetic resumes")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per resume per round; best is kept")
+    parser.add_argument("--rounds", type=int, default=5, help="timing rounds; the median of each metric is kept")
+    parser.add_argument("--seed", type=int, default=1337)
+    parser.add_argument("--stages", help="comma-separated subset of: " + ", ".join(STAGES))
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE, help="baseline JSON file")
+    parser.add_argument("--save-baseline", action="store_true", help="write results to --baseline")
+    parser.add_argument("--check", action="store_true", help="fail on regression against --baseline")
+    parser.add_argument("--threshold", type=float, default=0.5,
+                        help="allowed relative growth of p50, p99 and peak memory (default: 0.5)")
+    parser.add_argument("--min-delta-us", type=float, default=DEFAULT_MIN_DELTA_US,
+                        help="ignore latency growth below this many microseconds")
+    parser.add_argument("--min-delta-kib", type=float, default=DEFAULT_MIN_DELTA_KIB,
+                        help="ignore peak memory growth below this many KiB")
+    args = parser.parse_args(argv)
+    
+    names = args.stages.split(",") if args.stages else list(STAGES)
+    unknown = [n for n in names if n not in STAGES]
+    if unknown:
+        parser.error(f"unknown stage(s): {', '.join(unknown)}")
+    
+    corpus = generate_corpus(args.count, seed=args.seed)
+    docs = prepare(corpus)
+    total_kb = sum(len(t) for t in corpus) / 1024
+    print(f"Corpus: {len(corpus)} resumes, {total_kb:.0f} KB, repeat={args.repeat}, rounds={args.rounds}")
+    
+    stages = {name: STAGES[name] for name in names}
+    results, unit = measure(stages, docs, args.repeat, args.rounds)
+    print(f"calibration: {unit * 1e3:.2f} ms")
+    
+    print(f"{'stage':<30} {'docs/s':>10} {'p50 us':>10} {'p99 us':>10} {'peak KiB':>10}")
+    for name, metrics in results.items():
+        print(f"{name:<30} {metrics['throughput']:>10.0f} {metrics['p50_us']:>10.1f} "
+              f"{metrics['p99_us']:>10.1f} {metrics['peak_kib']:>10.1f}")
+    
+    if args.save_baseline:
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        payload = {
+            "parser_version": rp.PARSER_VERSION,
+            "python": platform.python_version(),
+            "count": args.count,
+            "seed": args.seed,
+            "repeat": args.repeat,
+            "rounds": args.rounds,
+            "calibration_us": round(unit * 1e6, 1),
+            "stages": results,
+        }
+        args.baseline.write_text(json.dumps(payload, indent=2) + "\n")
+        print(f"baseline saved to {args.baseline}")
+    
+    if args.check:
+        if not args.baseline.exists():
+            print(f"no baseline at {args.baseline}; run with --save-baseline first")
+            return 1
+        stored = json.loads(args.baseline.read_text())
+        if (stored.get("count"), stored.get("seed")) != (args.count, args.seed):
+            print(f"warning: baseline corpus was count={stored.get('count')} seed={stored.get('seed')}")
+        regressions = compare(
+            results, stored.get("stages", {}), args.threshold, unit,
+            min_delta_us=args.min_delta_us, min_delta_kib=args.min_delta_kib,
+        )
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        print(f"{len(regressions)} regression(s) past {args.threshold:.0%} and "
+              f"{args.min_delta_us:g} us / {args.min_delta_kib:g} KiB "
+              f"against parser v{stored.get('parser_version')}")
+        if regressions:
+            return 1
+    
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
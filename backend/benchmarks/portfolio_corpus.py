@@ -0,0 +1,90 @@
+"""
+Synthetic portfolio pages for benchmarking portfolio_analyzer.
+
+Pages mix the markup real portfolio sites use: an inline script bundle and
+stylesheet, a hero with an about line, project cards (class, id and
+<article> based, some with nested markup), demo/source links, a skills
+list and a contact footer. size scales the bundle and the number of cards.
+"""
+
+import random
+
+
+NAMES = ["Aarav Sharma", "Priya Patel", "John Smith", "Maria Garcia", "Wei Chen", "Sofia Rossi"]
+ROLES = ["full-stack developer", "frontend engineer", "ML engineer", "backend developer"]
+TECH = ["React", "Node.js", "Python", "Django", "TypeScript", "PostgreSQL", "Docker", "AWS", "Tailwind", "GraphQL"]
+PROJECT_NAMES = ["Pulse Dashboard", "Recipe Finder", "Chatterbox", "Ledger Lite", "TrailMap", "Snippet Vault", "Focus Timer"]
+VERBS = ["Built", "Designed", "Shipped", "Implemented", "Created"]
+
+
+def _bundle(rng: random.Random, kilobytes: int) -> str:
+    """Minified-looking JavaScript of roughly the given size."""
+    chunks = []
+    size = 0
+    while size < kilobytes * 1024:
+        name = "".join(rng.choice("abcdefghij") for _ in range(6))
+        chunk = f"function {name}(e,t){{return e&&t?e.map(function(n){{return n*{rng.randint(2, 99)}}}):[]}};"
+        chunks.append(chunk)
+        size += len(chunk)
+    return "".join(chunks)
+
+
+def _card(rng: random.Random, index: int, handle: str) -> str:
+    name = f"{rng.choice(PROJECT_NAMES)} {index}"
+    tech = rng.sample(TECH, 2)
+    desc = f"{rng.choice(VERBS)} a tool for teams using {tech[0]} and {tech[1]}."
+    links = (
+        f'<a href="https://github.com/{handle}/project-{index}">Source</a> '
+        f'<a href="https://project-{index}-demo.vercel.app">Live demo</a>'
+    )
+    style = index % 4
+    if style == 0:
+        return f'<div class="project-card">{name}\n        {desc}\n        Used by 100+ people</div>\n{links}'
+    if style == 1:
+        return f'<article>{name}: {desc} Deployed on Vercel.</article>\n{links}'
+    if style == 2:
+        return f'<div id="project-{index}" class="card">{name}\n        {desc}</div>\n{links}'
+    return f'<div class="project-card"><h3>{name}</h3><p>{desc}</p>{links}</div>'
+
+
+def generate_page(rng: random.Random, size: int = 1) -> str:
+    """Build one portfolio page; size scales the script bundle and card count."""
+    name = rng.choice(NAMES)
+    handle = name.split()[0].lower()
+    cards = "\n".join(_card(rng, i, handle) for i in range(2 + size))
+    skills = "".join(f"<li>{tech}</li>" for tech in rng.sample(TECH, 5))
+    return f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+  <meta charset="utf-8">
+  <title>{name} | Portfolio</title>
+  <style>body {{ font-family: sans-serif; }} .project-card {{ padding: 1rem; }}</style>
+  <script>{_bundle(rng, 20 * size)}</script>
+</head>
+<body>
+  <nav><a href="#projects">Projects</a> <a href="#contact">Contact</a></nav>
+  <header>
+    <h1>Hi, I'm {name}</h1>
+    <p>I am a {rng.choice(ROLES)} who enjoys turning ideas into fast, accessible products with {rng.choice(TECH)}.</p>
+  </header>
+  <section id="work">
+    <h2>Selected work &amp; experiments</h2>
+    {cards}
+  </section>
+  <section><h2>Skills</h2><ul>{skills}</ul></section>
+  <footer id="contact">
+    Get in touch:&nbsp;<a href="mailto:{handle}@example.com">{handle}@example.com</a>
+    <a href="https://www.linkedin.com/in/{handle}-dev">LinkedIn</a>
+    <a href="https://github.com/{handle}">GitHub</a>
+  </footer>
+  <!-- analytics -->
+  <script src="/static/app.js"></script>
+</body>
+</html>
+"""
+
+
+def generate_pages(count: int = 100, seed: int = 1337, sizes: tuple = (1, 4, 16, 64)) -> list[str]:
+    """Deterministic corpus of pages spread across sizes."""
+    rng = random.Random(seed)
+    return [generate_page(rng, sizes[i % len(sizes)]) for i in range(count)]
@@ -0,0 +1,164 @@
+"""
+Synthetic Resume Corpus
+
+Deterministic generator of resume texts for benchmarking the resume parser.
+The same seed always yields the same corpus, so timings are comparable
+across runs and machines.
+"""
+
+import random
+
+
+FIRST_NAMES = ["Aarav", "Priya", "John", "Maria", "Wei", "Fatima", "Lucas", "Ananya", "Omar", "Sofia"]
+LAST_NAMES = ["Sharma", "Patel", "Smith", "Garcia", "Chen", "Khan", "Silva", "Iyer", "Haddad", "Rossi"]
+CITIES = ["Bangalore, Karnataka, India", "Austin, TX 73301", "Pune, Maharashtra, India", "Berlin, Brandenburg, Germany"]
+COMPANIES = ["Acme Corp", "Globex", "Initech", "Umbrella Labs", "Stark Industries", "Wayne Tech", "Hooli"]
+TITLES = ["Software Engineer", "Senior Backend Developer", "Data Scientist", "Frontend Engineer", "ML Engineer", "DevOps Engineer"]
+SKILLS = [
+    "Python", "JavaScript", "TypeScript", "React", "Node.js", "Django", "Flask", "FastAPI",
+    "PostgreSQL", "MongoDB", "Redis", "Docker", "Kubernetes", "AWS", "GCP", "TensorFlow",
+    "PyTorch", "Pandas", "NumPy", "GraphQL", "Go", "Rust", "Java", "C++", "Git", "Linux",
+]
+VERBS = ["Built", "Developed", "Designed", "Implemented", "Led", "Optimized", "Reduced", "Scaled", "Migrated"]
+OBJECTS = [
+    "a real-time analytics pipeline", "the payments service", "an internal CI/CD platform",
+    "a recommendation engine", "customer-facing dashboards", "the search API", "various tools",
+]
+OUTCOMES = [
+    "reducing latency by 40%", "serving 10000+ users", "saving $120K annually",
+    "improving throughput 3x throughput", "cutting build times by 25%", "", "etc.",
+]
+DEGREES = ["Bachelor of Technology in Computer Science", "Master of Science in Data Science", "B.Tech in Information Technology"]
+SCHOOLS = ["Indian Institute of Technology Delhi", "Stanford University", "Pune Institute of Computer Technology"]
+CERTS = [
+    "AWS Certified Solutions Architect - Amazon Web Services",
+    "Certified Kubernetes Administrator - CNCF",
+    "TensorFlow Developer Certificate - Google",
+]
+MONTHS = ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]
+
+# Header styles seen in real uploads
+LAYOUTS = {
+    "plain": lambda h: h.title(),
+    "upper": lambda h: h.upper(),
+    "colon": lambda h: f"{h.title()}:",
+    "markdown": lambda h: f"### {h.title()}",
+    # PDF extraction output: spaced-out uppercase headers, CRLF line endings
+    "pdf": lambda h: f"{h.upper()}  ",
+}
+
+BULLETS = ["-", "•", "*"]
+
+# Sections after the skills block; real resumes order these differently
+BODY_SECTIONS = ["experience", "education", "projects", "certifications"]
+
+
+def _bullet(rng: random.Random, marker: str = "-") -> str:
+    outcome = rng.choice(OUTCOMES)
+    line = f"{marker} {rng.choice(VERBS)} {rng.choice(OBJECTS)} using {rng.choice(SKILLS)}"
+    return f"{line}, {outcome}" if outcome else line
+
+
+def _experience(rng: random.Random, size: int, marker: str) -> list[str]:
+    lines = []
+    for _ in range(2 * size):
+        start = rng.randint(2012, 2021)
+        lines.append(f"{rng.choice(TITLES)} | {rng.choice(COMPANIES)}")
+        lines.append(f"{rng.choice(MONTHS)} {start} - {rng.choice(MONTHS)} {start + rng.randint(1, 3)}")
+        lines.extend(_bullet(rng, marker) for _ in range(rng.randint(2, 4)))
+        lines.append("")
+    return lines
+
+
+def _education(rng: random.Random, size: int) -> list[str]:
+    lines = []
+    for _ in range(max(1, size // 2)):
+        start = rng.randint(2008, 2018)
+        lines.append(rng.choice(DEGREES))
+        lines.append(f"{rng.choice(SCHOOLS)}, {start} - {start + 4}")
+        lines.append(f"CGPA: {rng.randint(70, 99) / 10}/10")
+        lines.append("")
+    return lines
+
+
+def _projects(rng: random.Random, size: int, marker: str, handle: str) -> list[str]:
+    lines = []
+    for i in range(2 * size):
+        tech = rng.sample(SKILLS, 3)
+        lines.append(f"Project {chr(65 + i % 26)}{i} - {rng.choice(MONTHS)} {rng.randint(2018, 2023)} - Present")
+        lines.append(f"Tech: {', '.join(tech)}")
+        lines.append(_bullet(rng, marker))
+        lines.append(f"https://github.com/{handle}/project-{i}")
+        lines.append("")
+    return lines
+
+
+def _certifications(rng: random.Random, size: int, marker: str) -> list[str]:
+    lines = []
+    for cert in rng.sample(CERTS, min(len(CERTS), size)):
+        lines.append(f"{marker} {cert}")
+        lines.append(f"Issued: {rng.choice(MONTHS)} {rng.randint(2019, 2024)}")
+    lines.append("")
+    return lines
+
+
+def generate_resume(rng: random.Random, size: int = 1, layout: str = "plain") -> str:
+    """
+    Generate one synthetic resume.
+    
+    Bullet style, the order of the sections after experience, and whether
+    projects and certifications appear at all vary per resume.
+    
+    Args:
+        rng: Seeded random generator
+        size: Scale factor for the number of entries per section
+        layout: Header style, one of LAYOUTS
+        
+    Returns:
+        Resume text
+    """
+    header = LAYOUTS[layout]
+    name = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+    handle = name.lower().replace(" ", "")
+    marker = rng.choice(BULLETS)
+    lines = [
+        name,
+        f"Email: {handle}@mail.dev | Phone: +91 98{rng.randint(10000000, 99999999)}",
+        f"Location: {rng.choice(CITIES)}",
+        f"https://linkedin.com/in/{handle} | https://github.com/{handle} | https://{handle}.vercel.app",
+        "",
+        header("summary"),
+        f"{rng.choice(TITLES)} with {rng.randint(1, 12)} years of experience building scalable systems.",
+        "",
+        header("technical skills"),
+        ", ".join(rng.sample(SKILLS, min(len(SKILLS), 6 + 3 * size))),
+        "",
+    ]
+    
+    # Experience always comes first; the rest is shuffled and may be missing
+    rest = BODY_SECTIONS[1:]
+    rng.shuffle(rest)
+    sections = ["experience"] + [s for s in rest if s == "education" or rng.random() < 0.85]
+    for section in sections:
+        lines.append(header(section))
+        if section == "experience":
+            lines.extend(_experience(rng, size, marker))
+        elif section == "education":
+            lines.extend(_education(rng, size))
+        elif section == "projects":
+            lines.extend(_projects(rng, size, marker, handle))
+        else:
+            lines.extend(_certifications(rng, size, marker))
+    
+    newline = "\r\n" if layout == "pdf" else "\n"
+    return newline.join(lines)
+
+
+def generate_corpus(count: int = 200, seed: int = 1337, sizes: tuple = (1, 2, 4, 8)) -> list[str]:
+    """Generate a deterministic corpus of resumes across layouts and sizes."""
+    rng = random.Random(seed)
+    layouts = list(LAYOUTS)
+    return [
+        generate_resume(rng, size=sizes[i % len(sizes)], layout=layouts[i % len(layouts)])
+        for i in range(count)
+    ]
@@ -256,7 +256,7 @@ async def build_profile_async(
     if resume_text:
         try:
             from . import resume_parser
-            resume_data = resume_parser.parse_resume(resume_text)
+            resume_data = resume_parser.parse(resume_text)
         except Exception as e:
             print(f"Resume parse error: {e}")
     
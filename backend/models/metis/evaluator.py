@@ -5,16 +5,92 @@ Main orchestrator that combines parsers and analyzers to produce
 METIS-CORE evaluation output.
 """
 
+import asyncio
+import hashlib
 import json
+from collections.abc import Callable
+from concurrent import futures
 from dataclasses import dataclass, field
 
+from . import http_clients
 from . import jd_parser
 from . import resume_parser
 from . import github_analyzer
 from . import portfolio_analyzer
+from . import rate_limit
 from . import scoring_engine
 
 
+# Evaluation budget (seconds) for requests a user is waiting on; batch
+# evaluation passes no deadline and waits for every source
+INTERACTIVE_DEADLINE = 3.0
+
+# Submissions scoring below this are rejected (see check_eligibility)
+MIN_ELIGIBLE_SCORE = 20
+
+# Further seconds a submission that would be rejected on partial data waits
+# for enrichment; past that it is accepted provisionally and re-checked
+# when enrichment lands
+ENRICHMENT_GRACE = 5.0
+
+
+def engine_version(rubric: dict | None = None) -> str:
+    """
+    Everything besides the inputs that decides an evaluation under rubric.
+    
+    Part of every input fingerprint so engine, parser or rubric changes
+    invalidate them. A rubric equal to DEFAULT_RUBRIC gives ENGINE_VERSION.
+    """
+    return hashlib.sha256(json.dumps([
+        resume_parser.PARSER_VERSION,
+        scoring_engine.FEATURES_VERSION,
+        rubric or scoring_engine.DEFAULT_RUBRIC,
+    ], sort_keys=True).encode()).hexdigest()[:16]
+
+
+# Engine version under the default rubric
+ENGINE_VERSION = engine_version()
+
+
+def job_rubric(job: dict | None) -> dict:
+    """
+    Rubric a job's applications are scored under.
+    
+    Jobs store rubric overrides as metisRubric (set by /rescore); a job
+    without them, or with overrides this version does not accept, is
+    scored under DEFAULT_RUBRIC.
+    """
+    try:
+        return scoring_engine.rubric_with((job or {}).get("metisRubric"))
+    except ValueError as e:
+        print(f"⚠️ Ignoring stored rubric of job {(job or {}).get('_id')}: {e}")
+        return scoring_engine.rubric_with()
+
+
+def check_eligibility(evaluation: dict) -> str | None:
+    """
+    Rejection reason for an evaluation, or None when the candidate is eligible.
+    
+    The score must reach MIN_ELIGIBLE_SCORE, and at most two risk signals
+    may flag the profile as irrelevant to the job.
+    """
+    score = evaluation.get("overall_score", 0)
+    if score < MIN_ELIGIBLE_SCORE:
+        return (
+            f"Resume score ({score}/100) is below the minimum threshold of {MIN_ELIGIBLE_SCORE}. "
+            "Your qualifications do not meet the job requirements."
+        )
+    
+    risk_signals = evaluation.get("risk_signals", [])
+    critical_risks = [r for r in risk_signals if "irrelevant" in r.lower() or "mismatch" in r.lower()]
+    if len(critical_risks) > 2:
+        return (
+            "Your profile does not align with the job requirements. Please review the job "
+            "description and apply for positions that better match your experience."
+        )
+    return None
+
+
 @dataclass
 class CandidateInput:
     """Input data for candidate evaluation."""
@@ -30,6 +106,7 @@ class EvaluationContext:
     resume_data: dict = field(default_factory=dict)
     github_data: dict = field(default_factory=dict)
     portfolio_data: dict = field(default_factory=dict)
+    features: dict = field(default_factory=dict)  # Feature record the score came from
     errors: list[str] = field(default_factory=list)
 
 
@@ -41,8 +118,10 @@ class MetisEvaluator:
     Returns strict JSON matching METIS output contract.
     """
     
-    def __init__(self):
+    def __init__(self, rubric: dict | None = None):
+        self.rubric = rubric  # None: DEFAULT_RUBRIC
         self.context = EvaluationContext()
+        self._enrichment: futures.Future | None = None
     
     def parse_resume(self, resume_text: str) -> dict:
         """Parse resume text and store in context."""
@@ -55,12 +134,23 @@ class MetisEvaluator:
     
     def analyze_github(self, github_url: str) -> dict:
         """Analyze GitHub profile and store in context."""
+        return http_clients.registry.run(self.analyze_github_async(github_url))
+    
+    async def analyze_github_async(self, github_url: str) -> dict:
+        """Analyze GitHub profile on the running event loop and store in context."""
         if not github_url:
             return {}
         
         try:
-            self.context.github_data = github_analyzer.analyze(github_url)
+            self.context.github_data = await github_analyzer.analyze_async(github_url)
             return self.context.github_data
+        except rate_limit.RateLimited as e:
+            if rate_limit.current_priority() == rate_limit.BATCH:
+                # A batch stops here and resumes later rather than storing
+                # a score without the GitHub section
+                raise
+            self.context.errors.append(f"GitHub analysis failed: {str(e)}")
+            return {}
         except ValueError as e:
             self.context.errors.append(f"GitHub error: {str(e)}")
             return {}
@@ -70,30 +160,61 @@ class MetisEvaluator:
     
     def analyze_portfolio(self, portfolio_url: str) -> dict:
         """Analyze portfolio website and store in context."""
+        return http_clients.registry.run(self.analyze_portfolio_async(portfolio_url))
+    
+    async def analyze_portfolio_async(self, portfolio_url: str) -> dict:
+        """Analyze portfolio website on the running event loop and store in context."""
         if not portfolio_url:
             return {}
         
         try:
-            self.context.portfolio_data = portfolio_analyzer.analyze(portfolio_url)
+            self.context.portfolio_data = await portfolio_analyzer.analyze_async(portfolio_url)
             return self.context.portfolio_data
         except Exception as e:
             self.context.errors.append(f"Portfolio analysis failed: {str(e)}")
             return {}
     
-    def evaluate(self, candidate: CandidateInput) -> dict:
+    def evaluate(self, candidate: CandidateInput, deadline: float | None = None) -> dict:
         """
         Run METIS-CORE evaluation for a candidate.
         
         Args:
             candidate: CandidateInput with resume and optional URLs
-            
+            deadline: Seconds to wait for GitHub/portfolio enrichment (None: no limit)
+        
+        Returns:
+            Strict JSON matching METIS output contract
+        """
+        return asyncio.run(self.evaluate_async(candidate, deadline))
+    
+    async def evaluate_async(self, candidate: CandidateInput, deadline: float | None = None) -> dict:
+        """
+        Run METIS-CORE evaluation for a candidate on the running event loop.
+        
+        GitHub and portfolio enrichment run concurrently, and the resume is
+        parsed in a worker thread while their requests are in flight, so the
+        evaluation takes about as long as the slowest source instead of the
+        sum of all three.
+        
+        Enrichment runs on the http_clients network loop so connections are
+        reused across evaluations. With a deadline, if enrichment has not
+        finished in time the candidate is scored with what is available,
+        confidence_level is "low" and enrichment_pending is set; the
+        enrichment keeps running and when_enriched() delivers the full
+        result once it lands.
+        
+        Args:
+            candidate: CandidateInput with resume and optional URLs
+            deadline: Seconds to wait for GitHub/portfolio enrichment (None: no limit)
+        
         Returns:
             Strict JSON matching METIS output contract
+        
+        Raises:
+            RateLimited: Inside rate_limit.batch_priority(), if GitHub's rate
+                limit would hold the evaluation past the batch's wait limit
         """
-        # Parse resume
-        if candidate.resume_text:
-            self.parse_resume(candidate.resume_text)
-        else:
+        if not candidate.resume_text:
             self.context.errors.append("Resume text is required")
             return {
                 "model": "metis_core_v1",
@@ -106,22 +227,86 @@ class MetisEvaluator:
                 "final_reasoning": "Cannot evaluate without resume."
             }
         
-        # Analyze GitHub if provided
-        if candidate.github_url:
-            self.analyze_github(candidate.github_url)
+        # Enrichment runs on the shared network loop, where the pooled HTTP
+        # clients live; the resume is parsed while its requests are in flight
+        started = asyncio.get_running_loop().time()
+        self._enrichment = http_clients.registry.submit(self._enrich(candidate))
+        await asyncio.to_thread(self.parse_resume, candidate.resume_text)
         
-        # Analyze portfolio if provided
-        if candidate.portfolio_url:
-            self.analyze_portfolio(candidate.portfolio_url)
+        remaining = None
+        if deadline is not None:
+            remaining = max(0.0, deadline - (asyncio.get_running_loop().time() - started))
+        await asyncio.to_thread(futures.wait, [self._enrichment], remaining)
+        if self._enrichment.done():
+            enrichment, self._enrichment = self._enrichment, None
+            enrichment.result()  # Raises RateLimited for batch work
+            return self._score()
         
-        # Run METIS-CORE scoring engine
-        result = scoring_engine.evaluate(
+        # Score with what we have; when_enriched() patches it later
+        result = self._score()
+        result["confidence_level"] = "low"
+        result["enrichment_pending"] = True
+        return result
+    
+    async def _enrich(self, candidate: CandidateInput) -> None:
+        """Run GitHub and portfolio enrichment concurrently (each skips a missing URL)."""
+        await asyncio.gather(
+            self.analyze_github_async(candidate.github_url),
+            self.analyze_portfolio_async(candidate.portfolio_url),
+        )
+    
+    def _score(self) -> dict:
+        """Score the current context and keep the feature record it came from."""
+        # Keep the feature record so the candidate can be re-scored later
+        # without re-fetching anything
+        result, self.context.features = scoring_engine.evaluate_with_features(
             resume_data=self.context.resume_data,
             github_data=self.context.github_data if self.context.github_data else None,
             portfolio_data=self.context.portfolio_data if self.context.portfolio_data else None,
+            rubric=self.rubric,
         )
-        
         return result
+    
+    @property
+    def enrichment_pending(self) -> bool:
+        """Whether enrichment missed the deadline of the last evaluate call."""
+        return self._enrichment is not None
+    
+    def finish_enrichment(self, timeout: float | None = None) -> dict:
+        """
+        Wait for pending enrichment and return the full evaluation.
+        
+        Raises:
+            TimeoutError: If enrichment is still running after timeout
+        """
+        if self._enrichment is not None:
+            futures.wait([self._enrichment], timeout)
+            if not self._enrichment.done():
+                raise TimeoutError("Enrichment still running")
+            self._enrichment = None
+        return self._score()
+    
+    def when_enriched(self, callback: Callable[[dict, dict], None]) -> None:
+        """
+        Call callback(evaluation, features) once pending enrichment finishes.
+        
+        The callback runs on a worker thread of the network loop, so it may
+        block (e.g. on a database write). Nothing happens when no enrichment
+        is pending.
+        """
+        if self._enrichment is None:
+            return
+        loop = http_clients.registry.loop
+        
+        def deliver():
+            try:
+                callback(self._score(), self.context.features)
+            except Exception as e:
+                print(f"Enrichment update failed: {e}")
+        
+        self._enrichment.add_done_callback(
+            lambda _: loop.call_soon_threadsafe(loop.run_in_executor, None, deliver)
+        )
 
 
 def evaluate_candidate(
@@ -130,7 +315,9 @@ def evaluate_candidate(
     linkedin_url: str | None = None,
     portfolio_url: str | None = None,
     jd_text: str | None = None,  # Ignored per spec unless explicitly provided
-) -> dict:
+    with_features: bool = False,
+    rubric: dict | None = None,
+) -> dict | tuple[dict, dict]:
     """
     Convenience function for single candidate evaluation.
     
@@ -140,11 +327,15 @@ def evaluate_candidate(
         linkedin_url: Optional LinkedIn profile URL (not implemented)
         portfolio_url: Optional portfolio website URL
         jd_text: Job description (ignored unless explicitly needed)
-        
+        with_features: Also return the feature record that was scored
+        rubric: Thresholds and points (default: DEFAULT_RUBRIC; see job_rubric)
+    
     Returns:
-        Strict METIS JSON output
+        Strict METIS JSON output, or (output, feature record) when
+        with_features is set; store the record as metisFeatures so the
+        application can be re-scored under a new rubric
     """
-    evaluator = MetisEvaluator()
+    evaluator = MetisEvaluator(rubric)
     
     candidate = CandidateInput(
         resume_text=resume_text,
@@ -153,7 +344,55 @@ def evaluate_candidate(
         portfolio_url=portfolio_url,
     )
     
-    return evaluator.evaluate(candidate)
+    result = evaluator.evaluate(candidate)
+    if with_features:
+        return result, evaluator.context.features
+    return result
+
+
+async def evaluate_candidate_async(
+    resume_text: str,
+    github_url: str | None = None,
+    linkedin_url: str | None = None,
+    portfolio_url: str | None = None,
+    jd_text: str | None = None,
+    with_features: bool = False,
+    rubric: dict | None = None,
+) -> dict | tuple[dict, dict]:
+    """evaluate_candidate for callers already running an event loop."""
+    evaluator = MetisEvaluator(rubric)
+    
+    candidate = CandidateInput(
+        resume_text=resume_text,
+        github_url=github_url,
+        linkedin_url=linkedin_url,
+        portfolio_url=portfolio_url,
+    )
+    
+    result = await evaluator.evaluate_async(candidate)
+    if with_features:
+        return result, evaluator.context.features
+    return result
+
+
+def input_fingerprint(
+    resume_text: str,
+    github_url: str | None = None,
+    portfolio_url: str | None = None,
+    rubric: dict | None = None,
+) -> str:
+    """
+    Fingerprint of everything an evaluation depends on.
+    
+    Equal fingerprints mean re-evaluating would repeat the same work; stored
+    as metisInputFingerprint so batch evaluation can skip unchanged
+    applications. The rubric is part of it, so a job whose rubric changed
+    is re-evaluated. GitHub and portfolio content can change behind an
+    unchanged URL, which is what force re-evaluation is for.
+    """
+    version = ENGINE_VERSION if rubric is None else engine_version(rubric)
+    payload = json.dumps([version, resume_text or "", github_url or "", portfolio_url or ""])
+    return hashlib.sha256(payload.encode()).hexdigest()[:32]
 
 
 def format_result_json(result: dict, indent: int = 2) -> str:
@@ -2,15 +2,43 @@
 GitHub Profile Analyzer
 
 Fetches and analyzes GitHub profiles via REST API to assess project depth,
-commit activity, and contribution patterns.
+commit activity, and contribution patterns. API reads go through
+response_cache, so re-analyzing a profile mostly costs no rate limit, and
+the requests that do reach GitHub are paced by rate_limit.scheduler.
+analyze() and analyze_async() serve github_snapshots, refreshing old ones.
 """
 
+import asyncio
 import re
+from collections.abc import AsyncIterator
+from contextlib import aclosing
 from dataclasses import dataclass, field
 from datetime import datetime
+from urllib.parse import parse_qs, urlparse
 
 import httpx
 
+from . import github_snapshots
+from . import http_clients
+from . import rate_limit
+from . import response_cache
+
+
+# Base URL of the GitHub REST API
+GITHUB_API_URL = "https://api.github.com"
+
+# Commit counts are probed for the original repos among the first
+# COMMIT_PROBE_REPOS, at most COMMIT_PROBE_CONCURRENCY requests at a time
+COMMIT_PROBE_REPOS = 5
+COMMIT_PROBE_CONCURRENCY = 5
+
+# Repository enumeration walks pages of REPOS_PER_PAGE (the API maximum),
+# most recently updated first, and stops after MAX_REPOS repositories or
+# MAX_ORIGINAL_REPOS non-fork ones
+REPOS_PER_PAGE = 100
+MAX_REPOS = 300
+MAX_ORIGINAL_REPOS = 100
+
 
 @dataclass
 class Repository:
@@ -64,6 +92,19 @@ class GitHubProfile:
     languages: dict[str, int] = field(default_factory=dict)  # language -> repo count
     recent_activity_days: int = 0  # Days since last commit
     
+    def add_repository(self, repo: Repository) -> None:
+        """Add a repository and update the aggregate metrics."""
+        self.repositories.append(repo)
+        self.total_stars += repo.stars
+        
+        if repo.is_fork:
+            self.forked_repos += 1
+        else:
+            self.original_repos += 1
+        
+        if repo.language and repo.language != "Unknown":
+            self.languages[repo.language] = self.languages.get(repo.language, 0) + 1
+    
     def to_dict(self) -> dict:
         return {
             "username": self.username,
@@ -93,10 +134,15 @@ def extract_username(github_url: str) -> str:
     return github_url.strip().strip("/")
 
 
+async def api_get(client: httpx.AsyncClient, url: str, params: dict | None = None) -> httpx.Response:
+    """GET a GitHub API URL through the response cache and the rate limit scheduler."""
+    return await response_cache.cache.get(client, url, params, send=rate_limit.scheduler.send)
+
+
 async def fetch_user_data(client: httpx.AsyncClient, username: str) -> dict:
     """Fetch user profile data from GitHub API."""
-    url = f"https://api.github.com/users/{username}"
-    response = await client.get(url)
+    url = f"{GITHUB_API_URL}/users/{username}"
+    response = await api_get(client, url)
     
     if response.status_code == 404:
         raise ValueError(f"GitHub user '{username}' not found")
@@ -105,29 +151,51 @@ async def fetch_user_data(client: httpx.AsyncClient, username: str) -> dict:
     return response.json()
 
 
-async def fetch_repos(client: httpx.AsyncClient, username: str, limit: int = 30) -> list[dict]:
-    """Fetch user repositories from GitHub API."""
-    url = f"https://api.github.com/users/{username}/repos"
-    params = {"sort": "updated", "per_page": limit}
+async def iter_repos(
+    client: httpx.AsyncClient,
+    username: str,
+    per_page: int = REPOS_PER_PAGE,
+) -> AsyncIterator[dict]:
+    """
+    Yield a user's repositories, most recently updated first.
     
-    response = await client.get(url, params=params)
-    response.raise_for_status()
-    return response.json()
+    Pages are requested one at a time by following the Link header, so a
+    consumer that stops early never fetches the pages it does not need.
+    """
+    url = f"{GITHUB_API_URL}/users/{username}/repos"
+    params = {"sort": "updated", "per_page": per_page}
+    
+    while url:
+        response = await api_get(client, url, params)
+        response.raise_for_status()
+        for repo_data in response.json():
+            yield repo_data
+        
+        # The next link carries its own query string
+        url = response.links.get("next", {}).get("url")
+        params = None
 
 
-async def fetch_recent_commits(client: httpx.AsyncClient, username: str, repo_name: str, limit: int = 5) -> list[dict]:
-    """Fetch recent commits for a repository."""
-    url = f"https://api.github.com/repos/{username}/{repo_name}/commits"
-    params = {"per_page": limit}
+async def fetch_commit_count(client: httpx.AsyncClient, username: str, repo_name: str) -> int:
+    """
+    Count a repository's commits with a single one-commit page.
+    
+    With per_page=1 the page number of the Link header's "last" relation is
+    the commit count; without a Link header there is at most one commit.
+    """
+    url = f"{GITHUB_API_URL}/repos/{username}/{repo_name}/commits"
     
     try:
-        response = await client.get(url, params=params)
+        response = await api_get(client, url, {"per_page": 1})
         if response.status_code == 200:
-            return response.json()
+            last = response.links.get("last", {}).get("url")
+            if last:
+                return int(parse_qs(urlparse(last).query)["page"][0])
+            return len(response.json())
     except Exception:
         pass
     
-    return []
+    return 0
 
 
 def parse_repository(repo_data: dict) -> Repository:
@@ -160,23 +228,27 @@ def calculate_days_since(date_string: str) -> int:
         return 999
 
 
-async def analyze_github_profile(github_url: str, fetch_commits: bool = True) -> GitHubProfile:
+async def analyze_github_profile(
+    github_url: str,
+    fetch_commits: bool = True,
+    max_repos: int = MAX_REPOS,
+    max_original_repos: int = MAX_ORIGINAL_REPOS,
+) -> GitHubProfile:
     """
     Analyze a GitHub profile and return structured data.
     
     Args:
         github_url: GitHub profile URL or username
         fetch_commits: Whether to fetch commit data (slower but more accurate)
-        
+        max_repos: Stop enumerating after this many repositories
+        max_original_repos: Stop enumerating after this many non-fork repositories
+    
     Returns:
         GitHubProfile object with analysis results
     """
     username = extract_username(github_url)
     
-    async with httpx.AsyncClient(
-        headers={"Accept": "application/vnd.github.v3+json"},
-        timeout=30.0
-    ) as client:
+    async with http_clients.registry.client("github") as client:
         # Fetch user data
         user_data = await fetch_user_data(client, username)
         
@@ -190,49 +262,59 @@ async def analyze_github_profile(github_url: str, fetch_commits: bool = True) ->
             created_at=user_data.get("created_at", ""),
         )
         
-        # Fetch repositories
-        repos_data = await fetch_repos(client, username)
-        
-        languages: dict[str, int] = {}
+        # Walk the repositories page by page, aggregating as they arrive; the
+        # commit counts of the top original repos are probed concurrently
+        # while later pages are still loading
+        semaphore = asyncio.Semaphore(COMMIT_PROBE_CONCURRENCY)
+        probes = []
         most_recent_update = ""
         
-        for repo_data in repos_data:
-            repo = parse_repository(repo_data)
-            
-            # Fetch commit count for top repos (if enabled)
-            if fetch_commits and not repo.is_fork and len(profile.repositories) < 5:
-                commits = await fetch_recent_commits(client, username, repo.name)
-                repo.commit_count = len(commits)
-            
-            profile.repositories.append(repo)
-            
-            # Aggregate metrics
-            profile.total_stars += repo.stars
-            
-            if repo.is_fork:
-                profile.forked_repos += 1
-            else:
-                profile.original_repos += 1
-            
-            if repo.language and repo.language != "Unknown":
-                languages[repo.language] = languages.get(repo.language, 0) + 1
-            
-            # Track most recent activity
-            if repo.updated_at > most_recent_update:
-                most_recent_update = repo.updated_at
+        async def probe(repo: Repository) -> None:
+            async with semaphore:
+                repo.commit_count = await fetch_commit_count(client, username, repo.name)
+        
+        try:
+            async with aclosing(iter_repos(client, username)) as repos:
+                async for repo_data in repos:
+                    repo = parse_repository(repo_data)
+                    
+                    if fetch_commits and not repo.is_fork and len(profile.repositories) < COMMIT_PROBE_REPOS:
+                        probes.append(asyncio.create_task(probe(repo)))
+                    
+                    profile.add_repository(repo)
+                    
+                    # Track most recent activity
+                    if repo.updated_at > most_recent_update:
+                        most_recent_update = repo.updated_at
+                    
+                    if len(profile.repositories) >= max_repos or profile.original_repos >= max_original_repos:
+                        break
+        except BaseException:
+            for task in probes:
+                task.cancel()
+            raise
         
-        profile.languages = languages
+        await asyncio.gather(*probes)
         profile.recent_activity_days = calculate_days_since(most_recent_update)
         
         return profile
 
 
 def analyze_sync(github_url: str, fetch_commits: bool = True) -> GitHubProfile:
-    """Synchronous wrapper for analyze_github_profile."""
-    import asyncio
-    return asyncio.run(analyze_github_profile(github_url, fetch_commits))
+    """Synchronous wrapper for analyze_github_profile (uses the pooled client)."""
+    return http_clients.registry.run(analyze_github_profile(github_url, fetch_commits))
 
 
 def analyze(github_url: str) -> dict:
-    """Analyze GitHub profile and return as dictionary."""
-    return analyze_sync(github_url).to_dict()
+    """Analyze GitHub profile and return as dictionary (through the snapshot store)."""
+    return http_clients.registry.run(analyze_async(github_url))
+
+
+async def analyze_async(github_url: str) -> dict:
+    """Async analyze for callers already running an event loop."""
+    return await github_snapshots.store.get(extract_username(github_url), analyze_fresh)
+
+
+async def analyze_fresh(username: str) -> dict:
+    """Analyze a profile from the API, bypassing the snapshot store."""
+    return (await analyze_github_profile(username)).to_dict()
@@ -0,0 +1,210 @@
+"""
+GitHub Profile Snapshots
+
+Analyzed GitHub profiles (GitHubProfile.to_dict()) keyed by lowercase
+username, so a candidate who applies to several jobs is analyzed once.
+Reads are stale-while-revalidate: a snapshot younger than fresh_seconds is
+returned as is, an older one is returned too while a background refresh
+replaces it for the next reader. Only a username with no snapshot waits for
+an analysis, and concurrent readers of one username share it.
+
+Two tiers, like the parse cache:
+- In-process LRU (always on, per worker)
+- MongoDB collection (optional, shared across workers and restarts)
+"""
+
+import asyncio
+import json
+import threading
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from concurrent import futures
+from dataclasses import dataclass
+from datetime import datetime, timezone
+
+from . import http_clients
+from . import rate_limit
+
+
+DEFAULT_MAX_ENTRIES = 1024
+
+# Snapshots older than this are refreshed in the background
+DEFAULT_FRESH_SECONDS = 6 * 3600
+
+# Mongo snapshots expire after this many seconds without a refresh
+# (TTL index on analyzedAt)
+MONGO_TTL_SECONDS = 30 * 24 * 3600
+
+
+def _as_utc(value: datetime) -> datetime:
+    """PyMongo returns naive datetimes that hold UTC; attach the zone so ages compare."""
+    return value if value.tzinfo is not None else value.replace(tzinfo=timezone.utc)
+
+
+@dataclass
+class SnapshotStats:
+    """Counters for the snapshot store."""
+    fresh_hits: int = 0
+    stale_hits: int = 0
+    misses: int = 0
+    refreshes: int = 0
+
+    @property
+    def hits(self) -> int:
+        return self.fresh_hits + self.stale_hits
+
+    def to_dict(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "fresh_hits": self.fresh_hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "refreshes": self.refreshes,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+
+class SnapshotStore:
+    """
+    Two-tier store of analyzed GitHub profiles.
+
+    Analyses run on the http_clients network loop, so a background refresh
+    outlives the evaluation that started it.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        fresh_seconds: float = DEFAULT_FRESH_SECONDS,
+        collection=None,
+    ):
+        self.max_entries = max_entries
+        self.fresh_seconds = fresh_seconds
+        self.collection = collection
+        self.stats = SnapshotStats()
+        self._entries: OrderedDict[str, dict] = OrderedDict()
+        self._pending: dict[str, futures.Future] = {}
+        self._lock = threading.Lock()
+
+    def attach_collection(self, collection) -> None:
+        """Enable the MongoDB tier using the given collection."""
+        self.collection = collection
+        try:
+            collection.create_index("analyzedAt", expireAfterSeconds=MONGO_TTL_SECONDS)
+        except Exception as e:
+            print(f"GitHub snapshot index creation failed: {e}")
+
+    async def get(self, username: str, analyze: Callable[[str], Awaitable[dict]]) -> dict:
+        """
+        Return the snapshot for username.
+
+        Args:
+            username: GitHub username (any case)
+            analyze: Coroutine function producing a fresh snapshot for a username
+
+        Returns:
+            Profile dictionary; a fresh copy the caller may mutate
+        """
+        key = username.lower()
+        entry = await self._lookup(key)
+
+        if entry is None:
+            with self._lock:
+                self.stats.misses += 1
+            payload = await asyncio.wrap_future(self._analyze(key, username, analyze))
+            return json.loads(payload)
+
+        age = (datetime.now(timezone.utc) - entry["analyzedAt"]).total_seconds()
+        if age < self.fresh_seconds:
+            with self._lock:
+                self.stats.fresh_hits += 1
+        else:
+            with self._lock:
+                self.stats.stale_hits += 1
+            # Nobody waits for the refresh, so it yields to interactive requests
+            with rate_limit.batch_priority():
+                self._analyze(key, username, analyze).add_done_callback(self._report_failure)
+        return json.loads(entry["payload"])
+
+    def _analyze(self, key: str, username: str, analyze: Callable[[str], Awaitable[dict]]) -> futures.Future:
+        """Start the analysis of username on the network loop, or join the running one."""
+        with self._lock:
+            future = self._pending.get(key)
+            if future is None:
+                future = http_clients.registry.submit(self._refresh(key, username, analyze))
+                self._pending[key] = future
+                future.add_done_callback(lambda _: self._pending.pop(key, None))
+        return future
+
+    async def _refresh(self, key: str, username: str, analyze: Callable[[str], Awaitable[dict]]) -> str:
+        profile = await analyze(username)
+        payload = json.dumps(profile)
+        self._remember(key, {"payload": payload, "analyzedAt": datetime.now(timezone.utc)})
+        with self._lock:
+            self.stats.refreshes += 1
+
+        if self.collection is not None:
+            try:
+                await asyncio.to_thread(
+                    self.collection.update_one,
+                    {"_id": key},
+                    {"$set": {"profile": profile, "analyzedAt": datetime.now(timezone.utc)}},
+                    upsert=True,
+                )
+            except Exception as e:
+                print(f"GitHub snapshot write failed: {e}")
+        return payload
+
+    @staticmethod
+    def _report_failure(future: futures.Future) -> None:
+        if not future.cancelled() and future.exception() is not None:
+            print(f"GitHub snapshot refresh failed: {future.exception()}")
+
+    async def _lookup(self, key: str) -> dict | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                return entry
+
+        if self.collection is None:
+            return None
+        try:
+            doc = await asyncio.to_thread(self.collection.find_one, {"_id": key})
+        except Exception as e:
+            print(f"GitHub snapshot lookup failed: {e}")
+            return None
+        if not doc or doc.get("profile") is None:
+            return None
+        entry = {"payload": json.dumps(doc["profile"]), "analyzedAt": _as_utc(doc["analyzedAt"])}
+        self._remember(key, entry)
+        return entry
+
+    def _remember(self, key: str, entry: dict) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop the memory tier and reset counters (Mongo snapshots are kept)."""
+        with self._lock:
+            self._entries.clear()
+            self.stats = SnapshotStats()
+
+    def info(self) -> dict:
+        """Counters plus tier sizes, for diagnostics endpoints."""
+        with self._lock:
+            size = len(self._entries)
+        return {
+            **self.stats.to_dict(),
+            "entries": size,
+            "max_entries": self.max_entries,
+            "fresh_seconds": self.fresh_seconds,
+            "mongo_enabled": self.collection is not None,
+        }
+
+
+# Process-wide store used by github_analyzer.analyze
+store = SnapshotStore()
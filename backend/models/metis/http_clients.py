@@ -0,0 +1,176 @@
+"""
+Shared HTTP Clients
+
+Process-wide pool of httpx.AsyncClient instances for the GitHub and
+portfolio analyzers. A client per candidate means a fresh TCP+TLS handshake
+for every request chain; pooled clients keep connections alive across
+evaluations, and multiplex requests over HTTP/2 when it is enabled.
+
+An AsyncClient is bound to the event loop it first runs on, so pooled
+clients live on one persistent network loop running on a daemon thread.
+run() and submit() execute coroutines there from synchronous code; code on
+any other loop gets a one-off client that is closed when it is done.
+"""
+
+import asyncio
+import threading
+from collections.abc import AsyncIterator, Coroutine
+from concurrent import futures
+from contextlib import asynccontextmanager
+
+import httpx
+
+try:
+    import h2
+except ImportError:
+    h2 = None
+
+
+DEFAULT_MAX_CONNECTIONS = 20
+DEFAULT_MAX_KEEPALIVE = 10
+DEFAULT_KEEPALIVE_EXPIRY = 30.0  # seconds an idle connection stays open
+
+# Settings of each named client
+CLIENT_SETTINGS = {
+    "github": {
+        "headers": {"Accept": "application/vnd.github.v3+json"},
+        "timeout": 30.0,
+    },
+    "portfolio": {
+        "headers": {
+            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+            "Accept-Language": "en-US,en;q=0.5",
+        },
+        "timeout": 30.0,
+        "follow_redirects": True,
+    },
+}
+
+
+class ClientRegistry:
+    """
+    Named, pooled AsyncClients on a persistent network loop.
+    
+    Args:
+        max_connections: Open connections allowed per client
+        max_keepalive: Idle connections kept per client
+        keepalive_expiry: Seconds an idle connection is kept
+        http2: Negotiate HTTP/2 where the server supports it (needs h2)
+    """
+    
+    def __init__(
+        self,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        max_keepalive: int = DEFAULT_MAX_KEEPALIVE,
+        keepalive_expiry: float = DEFAULT_KEEPALIVE_EXPIRY,
+        http2: bool = False,
+    ):
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.http2 = False
+        self._clients: dict[str, httpx.AsyncClient] = {}
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._lock = threading.Lock()
+        if http2:
+            self.configure(http2=True)
+    
+    def configure(
+        self,
+        max_connections: int | None = None,
+        max_keepalive: int | None = None,
+        keepalive_expiry: float | None = None,
+        http2: bool | None = None,
+    ) -> None:
+        """
+        Change pool settings.
+        
+        Applies to clients created afterwards, so call it at startup or
+        after close().
+        """
+        self.limits = httpx.Limits(
+            max_connections=max_connections if max_connections is not None else self.limits.max_connections,
+            max_keepalive_connections=(
+                max_keepalive if max_keepalive is not None else self.limits.max_keepalive_connections
+            ),
+            keepalive_expiry=keepalive_expiry if keepalive_expiry is not None else self.limits.keepalive_expiry,
+        )
+        if http2 is not None:
+            if http2 and h2 is None:
+                print("Warning: HTTP/2 needs the h2 package (pip install httpx[http2]); using HTTP/1.1")
+            self.http2 = http2 and h2 is not None
+    
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """The network loop, started on first use."""
+        with self._lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(target=loop.run_forever, name="metis-http", daemon=True).start()
+                self._loop = loop
+            return self._loop
+    
+    def submit(self, coro: Coroutine) -> futures.Future:
+        """Schedule a coroutine on the network loop."""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+    
+    def run(self, coro: Coroutine, timeout: float | None = None):
+        """Run a coroutine on the network loop and wait for its result."""
+        return self.submit(coro).result(timeout)
+    
+    def _new_client(self, name: str) -> httpx.AsyncClient:
+        return httpx.AsyncClient(limits=self.limits, http2=self.http2, **CLIENT_SETTINGS[name])
+    
+    @asynccontextmanager
+    async def client(self, name: str) -> AsyncIterator[httpx.AsyncClient]:
+        """
+        Client for one request chain.
+        
+        On the network loop this is the pooled client, left open on exit;
+        elsewhere a one-off client that is closed on exit.
+        """
+        if asyncio.get_running_loop() is not self._loop:
+            async with self._new_client(name) as client:
+                yield client
+            return
+        
+        client = self._clients.get(name)
+        if client is None or client.is_closed:
+            client = self._clients[name] = self._new_client(name)
+        yield client
+    
+    def close(self, timeout: float = 5.0) -> None:
+        """Close every pooled client and stop the network loop."""
+        with self._lock:
+            loop, self._loop = self._loop, None
+        if loop is None:
+            return
+        
+        async def close_clients():
+            clients = list(self._clients.values())
+            self._clients.clear()
+            for client in clients:
+                await client.aclose()
+        
+        try:
+            asyncio.run_coroutine_threadsafe(close_clients(), loop).result(timeout)
+        except Exception as e:
+            print(f"HTTP client shutdown failed: {e}")
+        loop.call_soon_threadsafe(loop.stop)
+    
+    def info(self) -> dict:
+        """Pool settings and open clients, for diagnostics."""
+        return {
+            "clients": sorted(name for name, client in self._clients.items() if not client.is_closed),
+            "max_connections": self.limits.max_connections,
+            "max_keepalive": self.limits.max_keepalive_connections,
+            "keepalive_expiry": self.limits.keepalive_expiry,
+            "http2": self.http2,
+        }
+
+
+# Process-wide registry used by github_analyzer and portfolio_analyzer
+registry = ClientRegistry()
@@ -7,82 +7,87 @@ Extracts skills, seniority level, domain context, and requirements from job desc
 import re
 from dataclasses import dataclass, field
 
+from .keyword_matcher import KeywordMatcher
 
-# Common tech skills by category
-SKILL_PATTERNS = {
+
+# Common tech skills by category: canonical name -> surface forms.
+# Forms are matched as whole words, ignoring case and spacing.
+SKILL_KEYWORDS = {
     # Programming Languages
-    "python": r"\bpython\b",
-    "java": r"\bjava\b(?!script)",
-    "javascript": r"\b(javascript|js)\b",
-    "typescript": r"\b(typescript|ts)\b",
-    "go": r"\b(golang|go\s+lang)\b",
-    "rust": r"\brust\b",
-    "c++": r"\b(c\+\+|cpp)\b",
-    "c#": r"\b(c#|csharp|c\s+sharp)\b",
-    "ruby": r"\bruby\b",
-    "php": r"\bphp\b",
-    "swift": r"\bswift\b",
-    "kotlin": r"\bkotlin\b",
-    "dart": r"\bdart\b",
-    "sql": r"\bsql\b",
+    "python": ["python"],
+    "java": ["java"],
+    "javascript": ["javascript", "js"],
+    "typescript": ["typescript", "ts"],
+    "go": ["golang", "go lang"],
+    "rust": ["rust"],
+    "c++": ["c++", "cpp"],
+    "c#": ["c#", "csharp", "c sharp"],
+    "ruby": ["ruby"],
+    "php": ["php"],
+    "swift": ["swift"],
+    "kotlin": ["kotlin"],
+    "dart": ["dart"],
+    "sql": ["sql"],
     
     # Frontend
-    "react": r"\breact(\.?js)?\b",
-    "angular": r"\bangular(\.?js)?\b",
-    "vue": r"\bvue(\.?js)?\b",
-    "next.js": r"\bnext\.?js\b",
-    "html": r"\bhtml5?\b",
-    "css": r"\bcss3?\b",
-    "tailwind": r"\btailwind\b",
+    "react": ["react", "reactjs", "react.js"],
+    "angular": ["angular", "angularjs", "angular.js"],
+    "vue": ["vue", "vuejs", "vue.js"],
+    "next.js": ["next.js", "nextjs"],
+    "html": ["html", "html5"],
+    "css": ["css", "css3"],
+    "tailwind": ["tailwind"],
     
     # Backend/Frameworks
-    "node.js": r"\bnode(\.?js)?\b",
-    "django": r"\bdjango\b",
-    "flask": r"\bflask\b",
-    "fastapi": r"\bfastapi\b",
-    "spring": r"\bspring\s*(boot)?\b",
-    "express": r"\bexpress(\.?js)?\b",
+    "node.js": ["node", "nodejs", "node.js"],
+    "django": ["django"],
+    "flask": ["flask"],
+    "fastapi": ["fastapi"],
+    "spring": ["spring", "springboot"],
+    "express": ["express", "expressjs", "express.js"],
     
     # Mobile
-    "flutter": r"\bflutter\b",
-    "react native": r"\breact\s+native\b",
-    "android": r"\bandroid\b",
-    "ios": r"\bios\b",
+    "flutter": ["flutter"],
+    "react native": ["react native"],
+    "android": ["android"],
+    "ios": ["ios"],
     
     # Cloud & DevOps
-    "aws": r"\b(aws|amazon\s+web\s+services)\b",
-    "gcp": r"\b(gcp|google\s+cloud)\b",
-    "azure": r"\bazure\b",
-    "docker": r"\bdocker\b",
-    "kubernetes": r"\b(kubernetes|k8s)\b",
-    "terraform": r"\bterraform\b",
-    "ci/cd": r"\b(ci/?cd|jenkins|github\s+actions)\b",
+    "aws": ["aws", "amazon web services"],
+    "gcp": ["gcp", "google cloud"],
+    "azure": ["azure"],
+    "docker": ["docker"],
+    "kubernetes": ["kubernetes", "k8s"],
+    "terraform": ["terraform"],
+    "ci/cd": ["ci/cd", "cicd", "jenkins", "github actions"],
     
     # Databases
-    "postgresql": r"\b(postgresql|postgres)\b",
-    "mysql": r"\bmysql\b",
-    "mongodb": r"\bmongo(db)?\b",
-    "redis": r"\bredis\b",
-    "elasticsearch": r"\belasticsearch\b",
-    "firebase": r"\bfirebase\b",
+    "postgresql": ["postgresql", "postgres"],
+    "mysql": ["mysql"],
+    "mongodb": ["mongo", "mongodb"],
+    "redis": ["redis"],
+    "elasticsearch": ["elasticsearch"],
+    "firebase": ["firebase"],
     
     # AI/ML
-    "machine learning": r"\b(machine\s+learning|ml)\b",
-    "deep learning": r"\b(deep\s+learning|dl)\b",
-    "tensorflow": r"\btensorflow\b",
-    "pytorch": r"\bpytorch\b",
-    "llm": r"\b(llm|large\s+language\s+model)\b",
-    "nlp": r"\b(nlp|natural\s+language)\b",
+    "machine learning": ["machine learning", "ml"],
+    "deep learning": ["deep learning", "dl"],
+    "tensorflow": ["tensorflow"],
+    "pytorch": ["pytorch"],
+    "llm": ["llm", "large language model"],
+    "nlp": ["nlp", "natural language"],
     
     # Concepts
-    "system design": r"\bsystem\s+design\b",
-    "microservices": r"\bmicroservices?\b",
-    "rest api": r"\b(rest|restful)\s*(api)?\b",
-    "graphql": r"\bgraphql\b",
-    "agile": r"\b(agile|scrum)\b",
-    "git": r"\bgit(hub|lab)?\b",
+    "system design": ["system design"],
+    "microservices": ["microservice", "microservices"],
+    "rest api": ["rest", "restful", "restapi", "restfulapi"],
+    "graphql": ["graphql"],
+    "agile": ["agile", "scrum"],
+    "git": ["git", "github", "gitlab"],
 }
 
+SKILL_MATCHER = KeywordMatcher(SKILL_KEYWORDS)
+
 # Seniority keywords
 SENIORITY_PATTERNS = {
     "intern": (r"\b(intern|internship)\b", 0),
@@ -135,15 +140,8 @@ class ParsedJD:
 
 
 def extract_skills(text: str) -> list[str]:
-    """Extract technical skills from text using pattern matching."""
-    text_lower = text.lower()
-    found_skills = []
-    
-    for skill, pattern in SKILL_PATTERNS.items():
-        if re.search(pattern, text_lower, re.IGNORECASE):
-            found_skills.append(skill)
-    
-    return found_skills
+    """Extract technical skills from text in one keyword-matcher pass."""
+    return SKILL_MATCHER.find_all(text)
 
 
 def extract_seniority(text: str) -> tuple[str, int]:
@@ -0,0 +1,124 @@
+"""
+Keyword Matcher
+
+Multi-keyword scanner shared by the resume, JD and portfolio parsers.
+
+Keywords are matched on whole tokens (runs of word characters, or single
+punctuation marks), which gives the same word-boundary semantics as
+wrapping each keyword in \\b...\\b, and case and whitespace differences are
+ignored. All keywords are compiled into one Aho-Corasick automaton over
+tokens, so scanning a text is a single linear pass no matter how large the
+vocabulary is, and overlapping hits (e.g. "react" and "react native") are
+all reported.
+"""
+
+import re
+from collections import deque
+from collections.abc import Iterable, Mapping
+
+
+TOKEN_RE = re.compile(r"\w+|[^\w\s]")
+
+
+def tokenize(text: str) -> list[str]:
+    """Split text into lowercase word and punctuation tokens."""
+    return TOKEN_RE.findall(text.lower())
+
+
+class KeywordMatcher:
+    """
+    Aho-Corasick automaton mapping surface forms to canonical names.
+    
+    Args:
+        vocabulary: Canonical name -> surface forms that should report it.
+            Names are returned in the order they appear here.
+    """
+    
+    def __init__(self, vocabulary: Mapping[str, Iterable[str]]):
+        self.names: list[str] = []
+        name_ids: dict[str, int] = {}
+        
+        # Trie over tokens; outputs are bitmasks of canonical name ids
+        self._goto: list[dict[str, int]] = [{}]
+        self._outputs: list[int] = [0]
+        
+        for name, forms in vocabulary.items():
+            if name not in name_ids:
+                name_ids[name] = len(self.names)
+                self.names.append(name)
+            bit = 1 << name_ids[name]
+            
+            for form in forms:
+                tokens = tokenize(form)
+                if not tokens:
+                    continue
+                state = 0
+                for token in tokens:
+                    nxt = self._goto[state].get(token)
+                    if nxt is None:
+                        nxt = len(self._goto)
+                        self._goto.append({})
+                        self._outputs.append(0)
+                        self._goto[state][token] = nxt
+                    state = nxt
+                self._outputs[state] |= bit
+        
+        self._fail = self._build_failure_links()
+        
+        # Tokens that occur in some form; any other token sends the scan to the root
+        self._alphabet = frozenset(token for edges in self._goto for token in edges)
+    
+    @classmethod
+    def from_keywords(cls, keywords: Iterable[str], aliases: Mapping[str, str] | None = None) -> "KeywordMatcher":
+        """
+        Build a matcher from a flat keyword list.
+        
+        Each keyword reports itself unless aliases maps it to another
+        canonical name (e.g. {"nodejs": "node.js"}).
+        """
+        aliases = aliases or {}
+        vocabulary: dict[str, list[str]] = {}
+        for keyword in keywords:
+            vocabulary.setdefault(aliases.get(keyword, keyword), []).append(keyword)
+        return cls(vocabulary)
+    
+    def _build_failure_links(self) -> list[int]:
+        """Breadth-first pass linking each state to its longest proper suffix state."""
+        goto, outputs = self._goto, self._outputs
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        
+        while queue:
+            state = queue.popleft()
+            for token, nxt in goto[state].items():
+                queue.append(nxt)
+                f = fail[state]
+                while f and token not in goto[f]:
+                    f = fail[f]
+                fail[nxt] = goto[f].get(token, 0)
+                outputs[nxt] |= outputs[fail[nxt]]
+        
+        return fail
+    
+    def scan_tokens(self, tokens: Iterable[str]) -> int:
+        """Return the bitmask of canonical name ids found in a token stream."""
+        goto, fail, outputs, alphabet = self._goto, self._fail, self._outputs, self._alphabet
+        state = 0
+        found = 0
+        for token in tokens:
+            if token not in alphabet:
+                state = 0
+                continue
+            while state and token not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(token, 0)
+            found |= outputs[state]
+        return found
+    
+    def find_all(self, text: str) -> list[str]:
+        """Canonical names mentioned in text, in vocabulary order."""
+        found = self.scan_tokens(tokenize(text))
+        return [name for i, name in enumerate(self.names) if found >> i & 1]
+    
+    def __len__(self) -> int:
+        return len(self.names)
@@ -0,0 +1,144 @@
+"""
+Resume Parse Cache
+
+Content-addressed cache for parsed resumes. Entries are keyed by a hash of
+the normalized resume text plus the parser version, so a parser change
+invalidates every old entry without any explicit flush.
+
+Two tiers:
+- In-process LRU (always on, per worker)
+- MongoDB collection (optional, shared across workers and restarts)
+"""
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, timezone
+
+
+DEFAULT_MAX_ENTRIES = 1024
+
+# Mongo entries expire after this many seconds (TTL index on createdAt)
+MONGO_TTL_SECONDS = 30 * 24 * 3600
+
+
+@dataclass
+class CacheStats:
+    """Hit/miss counters for the parse cache."""
+    memory_hits: int = 0
+    mongo_hits: int = 0
+    misses: int = 0
+
+    @property
+    def hits(self) -> int:
+        return self.memory_hits + self.mongo_hits
+
+    def to_dict(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "memory_hits": self.memory_hits,
+            "mongo_hits": self.mongo_hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+
+def make_key(normalized_text: str, version: str) -> str:
+    """Build the cache key for normalized resume text at a parser version."""
+    digest = hashlib.sha256(normalized_text.encode("utf-8")).hexdigest()
+    return f"{version}:{digest}"
+
+
+class ParseCache:
+    """
+    Two-tier cache of parsed resume dictionaries.
+
+    Values are stored as JSON in the memory tier, so every hit hands the
+    caller a fresh copy that is safe to mutate.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, collection=None):
+        self.max_entries = max_entries
+        self.collection = collection
+        self.stats = CacheStats()
+        self._entries: OrderedDict[str, str] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def attach_collection(self, collection) -> None:
+        """Enable the MongoDB tier using the given collection."""
+        self.collection = collection
+        try:
+            collection.create_index("createdAt", expireAfterSeconds=MONGO_TTL_SECONDS)
+        except Exception as e:
+            print(f"Parse cache index creation failed: {e}")
+
+    def get(self, key: str) -> dict | None:
+        """Return the cached value for key, or None on a miss."""
+        with self._lock:
+            payload = self._entries.get(key)
+            if payload is not None:
+                self._entries.move_to_end(key)
+                self.stats.memory_hits += 1
+        if payload is not None:
+            return json.loads(payload)
+
+        if self.collection is not None:
+            try:
+                doc = self.collection.find_one({"_id": key}, {"data": 1})
+            except Exception as e:
+                print(f"Parse cache lookup failed: {e}")
+                doc = None
+            if doc and doc.get("data") is not None:
+                self._remember(key, json.dumps(doc["data"]))
+                with self._lock:
+                    self.stats.mongo_hits += 1
+                return doc["data"]
+
+        with self._lock:
+            self.stats.misses += 1
+        return None
+
+    def put(self, key: str, value: dict) -> None:
+        """Store value under key in every enabled tier."""
+        self._remember(key, json.dumps(value))
+
+        if self.collection is not None:
+            try:
+                self.collection.update_one(
+                    {"_id": key},
+                    {"$set": {"data": value, "createdAt": datetime.now(timezone.utc)}},
+                    upsert=True,
+                )
+            except Exception as e:
+                print(f"Parse cache write failed: {e}")
+
+    def _remember(self, key: str, payload: str) -> None:
+        with self._lock:
+            self._entries[key] = payload
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop the memory tier and reset counters (Mongo entries are kept)."""
+        with self._lock:
+            self._entries.clear()
+            self.stats = CacheStats()
+
+    def info(self) -> dict:
+        """Counters plus tier sizes, for diagnostics endpoints."""
+        with self._lock:
+            size = len(self._entries)
+        return {
+            **self.stats.to_dict(),
+            "entries": size,
+            "max_entries": self.max_entries,
+            "mongo_enabled": self.collection is not None,
+        }
+
+
+# Process-wide cache used by resume_parser.parse
+cache = ParseCache()
@@ -8,12 +8,18 @@ Uses httpx for simple HTML sites. For JavaScript-rendered sites,
 will return limited data.
 """
 
+import asyncio
+import codecs
 import re
 from dataclasses import dataclass, field
+from html.parser import HTMLParser
 from urllib.parse import urlparse
 
 import httpx
 
+from . import http_clients
+from .keyword_matcher import KeywordMatcher
+
 
 @dataclass
 class Project:
@@ -61,6 +67,167 @@ class PortfolioData:
         }
 
 
+@dataclass
+class PortfolioPage:
+    """What one parsing pass extracts from a portfolio page."""
+    text: str = ""  # Visible text, whitespace collapsed
+    title: str = ""
+    links: list[str] = field(default_factory=list)  # href values in document order
+    project_blocks: list[str] = field(default_factory=list)  # Raw text of candidate project cards
+
+
+# Portfolio fetches read at most MAX_PAGE_BYTES of a page and stop waiting
+# for the rest after FETCH_DEADLINE seconds; what arrived is analyzed
+MAX_PAGE_BYTES = 2 * 1024 * 1024
+FETCH_DEADLINE = 10.0
+
+# Media types analyzed as pages (a response without Content-Type is tried too)
+HTML_CONTENT_TYPES = ("text/html", "application/xhtml+xml")
+
+# Project card sources, in the order their blocks are reported, with the
+# shortest text that counts as a card
+PROJECT_BLOCK_MIN_LENGTHS = {"class": 10, "article": 20, "id": 10}
+PROJECT_BLOCKS_PER_SOURCE = 5
+PROJECT_BLOCK_MAX_LENGTH = 500
+
+# Script and style contents are dropped, but HTMLParser buffers them until
+# their end tag arrives and rescans the buffer on every feed. The parser
+# holds them back instead, keeping only the last HIDDEN_EDGE characters in
+# case an end tag is split across chunks.
+HIDDEN_EDGE = 256
+HIDDEN_END_TAGS = {tag: re.compile(rf"</\s*{tag}", re.I) for tag in ("script", "style")}
+
+
+class PortfolioPageParser(HTMLParser):
+    """
+    Single streaming pass over a portfolio page.
+    
+    Collects visible text (script and style contents dropped), the first
+    title, href values and candidate project blocks: the text directly
+    inside an element whose class or id mentions "project", or inside an
+    <article>. Only the extracted pieces are kept, so the page can be fed in
+    chunks and never held whole.
+    """
+    
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self._text: list[str] = []  # whitespace-collapsed runs
+        self._title: list[str] | None = None
+        self._title_done = False
+        self._links: list[str] = []
+        self._blocks: dict[str, list[str]] = {source: [] for source in PROJECT_BLOCK_MIN_LENGTHS}
+        self._hidden = False  # inside <script> or <style>
+        self._hidden_end: re.Pattern | None = None  # its end tag, until one may have arrived
+        self._held = ""  # tail of the contents seen so far
+        self._block_sources: list[str] = []  # sources of the tag whose text comes next
+        self._run: list[str] = []  # text since the last tag, possibly split across feeds
+    
+    def feed(self, data):
+        if self._hidden_end is not None:
+            data = self._held + data
+            match = self._hidden_end.search(data)
+            if match is None:
+                self._held = data[-HIDDEN_EDGE:]
+                return
+            # Let HTMLParser decide from here (a piece of the end tag it
+            # already has may be fed twice, as dropped contents); if this is
+            # not the end tag after all, the rest is fed as is
+            data = data[match.start():]
+            self._hidden_end = None
+        super().feed(data)
+        if self._hidden_end is not None:
+            # Contents started in this chunk and HTMLParser has the rest of
+            # it, possibly ending in part of the end tag (the start tag
+            # itself may have begun in the previous chunk)
+            start_tag = self.get_starttag_text()
+            start = data.rfind(start_tag)
+            start = start + len(start_tag) if start >= 0 else data.find(">") + 1
+            self._held = data[max(start, len(data) - HIDDEN_EDGE):]
+    
+    def handle_starttag(self, tag, attrs):
+        self._end_run()
+        self._block_sources = []
+        if tag in ("script", "style"):
+            self._hidden = True
+            self._hidden_end = HIDDEN_END_TAGS[tag]
+            return
+        if tag == "title" and not self._title_done:
+            self._title = []
+        
+        attributes = dict(attrs)
+        if attributes.get("href"):
+            self._links.append(attributes["href"])
+        if "project" in (attributes.get("class") or "").lower():
+            self._block_sources.append("class")
+        if tag == "article":
+            self._block_sources.append("article")
+        if "project" in (attributes.get("id") or "").lower():
+            self._block_sources.append("id")
+    
+    def handle_startendtag(self, tag, attrs):
+        # Text after <img ... /> follows it just as text after <img ...>
+        # does; a self-closing <script/> has no contents to hide
+        if tag in ("script", "style"):
+            self._end_run()
+            self._block_sources = []
+        else:
+            self.handle_starttag(tag, attrs)
+    
+    def handle_endtag(self, tag):
+        self._end_run()
+        self._block_sources = []
+        if tag in ("script", "style"):
+            self._hidden = False
+            self._hidden_end = None
+        elif tag == "title" and self._title is not None:
+            self._title_done = True
+    
+    def handle_comment(self, data):
+        self._end_run()
+        self._block_sources = []
+    
+    def handle_data(self, data):
+        # Text cut by a chunk boundary arrives in several calls; it is
+        # handled as one run when the next tag (or the end) is reached
+        if not self._hidden:
+            self._run.append(data)
+    
+    def _end_run(self):
+        if not self._run:
+            return
+        data = "".join(self._run)
+        self._run = []
+        words = " ".join(data.split())
+        if words:
+            self._text.append(words)
+        if self._title is not None and not self._title_done:
+            self._title.append(data)
+        
+        for source in self._block_sources:
+            blocks = self._blocks[source]
+            if len(data) >= PROJECT_BLOCK_MIN_LENGTHS[source] and len(blocks) < PROJECT_BLOCKS_PER_SOURCE:
+                blocks.append(data[:PROJECT_BLOCK_MAX_LENGTH])
+        self._block_sources = []
+    
+    def page(self) -> PortfolioPage:
+        """Finish parsing and return the extracted page."""
+        self.close()
+        self._end_run()
+        return PortfolioPage(
+            text=" ".join(self._text),
+            title="".join(self._title or []).strip(),
+            links=self._links,
+            project_blocks=[block for blocks in self._blocks.values() for block in blocks],
+        )
+
+
+def extract_page(html: str) -> PortfolioPage:
+    """Parse a whole portfolio page in one pass."""
+    parser = PortfolioPageParser()
+    parser.feed(html)
+    return parser.page()
+
+
 # Tech keywords to look for
 TECH_KEYWORDS = [
     "react", "vue", "angular", "next.js", "nextjs", "nuxt", "svelte",
@@ -74,21 +241,15 @@ TECH_KEYWORDS = [
     "git", "github", "graphql", "rest", "api",
 ]
 
+# Spellings reported under another name
+TECH_ALIASES = {"nodejs": "node.js", "nextjs": "next.js"}
+
+TECH_MATCHER = KeywordMatcher.from_keywords(TECH_KEYWORDS, TECH_ALIASES)
+
 
 def extract_technologies(text: str) -> list[str]:
     """Extract technology mentions from text."""
-    text_lower = text.lower()
-    found = []
-    
-    for tech in TECH_KEYWORDS:
-        pattern = rf"\b{re.escape(tech)}\b"
-        if re.search(pattern, text_lower):
-            # Normalize tech names
-            normalized = tech.replace("nodejs", "node.js").replace("nextjs", "next.js")
-            if normalized not in found:
-                found.append(normalized)
-    
-    return found
+    return TECH_MATCHER.find_all(text)
 
 
 def extract_social_links(text: str, html: str = "") -> dict[str, str]:
@@ -111,34 +272,26 @@ def extract_social_links(text: str, html: str = "") -> dict[str, str]:
     return social
 
 
-def parse_projects_from_html(html: str, text: str) -> list[Project]:
-    """Extract projects from HTML content."""
+def parse_projects(page: PortfolioPage) -> list[Project]:
+    """Extract projects from a parsed portfolio page."""
     projects = []
+    text = page.text
     
-    # Look for common project card patterns in HTML
-    # Pattern 1: divs/sections with project-related classes
-    project_patterns = [
-        r'class="[^"]*project[^"]*"[^>]*>([^<]{10,500})',
-        r'<article[^>]*>([^<]{20,500})',
-        r'id="[^"]*project[^"]*"[^>]*>([^<]{10,500})',
-    ]
-    
-    for pattern in project_patterns:
-        matches = re.findall(pattern, html, re.IGNORECASE | re.DOTALL)
-        for match in matches[:5]:
-            clean_text = re.sub(r'<[^>]+>', ' ', match).strip()
-            if len(clean_text) > 20:
-                # Extract title (first line or first sentence)
-                lines = clean_text.split('\n')
-                title = lines[0].strip()[:80]
-                desc = ' '.join(lines[1:3]).strip()[:200] if len(lines) > 1 else ""
-                
-                if title and len(title) > 3:
-                    projects.append(Project(
-                        name=title,
-                        description=desc,
-                        technologies=extract_technologies(clean_text),
-                    ))
+    # Pattern 1: project cards found by the parser
+    for block in page.project_blocks:
+        clean_text = block.strip()
+        if len(clean_text) > 20:
+            # Extract title (first line or first sentence)
+            lines = clean_text.split('\n')
+            title = lines[0].strip()[:80]
+            desc = ' '.join(lines[1:3]).strip()[:200] if len(lines) > 1 else ""
+            
+            if title and len(title) > 3:
+                projects.append(Project(
+                    name=title,
+                    description=desc,
+                    technologies=extract_technologies(clean_text),
+                ))
     
     # Pattern 2: Look for "Projects" section in text
     projects_section = re.search(
@@ -175,35 +328,55 @@ def parse_projects_from_html(html: str, text: str) -> list[Project]:
     return unique[:10]
 
 
-async def fetch_portfolio(url: str) -> tuple[str, str]:
-    """Fetch portfolio page content."""
+async def fetch_portfolio(
+    url: str,
+    max_bytes: int = MAX_PAGE_BYTES,
+    deadline: float = FETCH_DEADLINE,
+) -> PortfolioPage:
+    """
+    Fetch and parse a portfolio page.
+    
+    The body is streamed: Content-Type is checked before any of it is read,
+    chunks are decoded incrementally and fed to the parser as they arrive,
+    and reading stops after max_bytes or deadline seconds. Whatever arrived
+    by then is analyzed; only the extracted output is kept in memory.
+    
+    Raises:
+        ValueError: If the response is not an HTML page
+        TimeoutError: If no response arrived within deadline
+    """
     if not url.startswith(("http://", "https://")):
         url = "https://" + url
     
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-        "Accept-Language": "en-US,en;q=0.5",
-    }
+    parser = PortfolioPageParser()
+    decoder = None
+    try:
+        async with asyncio.timeout(deadline):
+            async with http_clients.registry.client("portfolio") as client:
+                async with client.stream("GET", url) as response:
+                    response.raise_for_status()
+                    media_type = response.headers.get("content-type", "").split(";")[0].strip().lower()
+                    if media_type and media_type not in HTML_CONTENT_TYPES:
+                        raise ValueError(f"Not an HTML page ({media_type})")
+                    
+                    try:
+                        decoder = codecs.getincrementaldecoder(response.charset_encoding or "utf-8")(errors="replace")
+                    except LookupError:
+                        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+                    
+                    received = 0
+                    async for chunk in response.aiter_bytes():
+                        chunk = chunk[:max_bytes - received]
+                        received += len(chunk)
+                        parser.feed(decoder.decode(chunk))
+                        if received >= max_bytes:
+                            break
+    except TimeoutError:
+        if decoder is None:
+            raise TimeoutError(f"No response within {deadline:.0f}s") from None
     
-    async with httpx.AsyncClient(
-        timeout=30.0,
-        follow_redirects=True,
-        headers=headers
-    ) as client:
-        response = await client.get(url)
-        response.raise_for_status()
-        html = response.text
-        
-        # Convert HTML to text
-        text = html
-        text = re.sub(r"<script[^>]*>.*?</script>", "", text, flags=re.DOTALL | re.IGNORECASE)
-        text = re.sub(r"<style[^>]*>.*?</style>", "", text, flags=re.DOTALL | re.IGNORECASE)
-        text = re.sub(r"<[^>]+>", " ", text)
-        text = re.sub(r"\s+", " ", text)
-        text = text.replace("&nbsp;", " ").replace("&amp;", "&")
-        
-        return text.strip(), html
+    parser.feed(decoder.decode(b"", final=True))
+    return parser.page()
 
 
 async def analyze_portfolio(portfolio_url: str) -> PortfolioData:
@@ -211,19 +384,19 @@ async def analyze_portfolio(portfolio_url: str) -> PortfolioData:
     data = PortfolioData(url=portfolio_url)
     
     try:
-        text, html = await fetch_portfolio(portfolio_url)
+        page = await fetch_portfolio(portfolio_url)
+        text = page.text
         data.page_text = text[:5000]
         
         # Extract title/name
-        title_match = re.search(r"<title>([^<]+)</title>", html, re.IGNORECASE)
-        if title_match:
-            data.name = title_match.group(1).strip()[:100]
+        if page.title:
+            data.name = page.title[:100]
         
         # Extract skills
         data.skills = extract_technologies(text)
         
-        # Extract social links
-        data.social_links = extract_social_links(text, html)
+        # Extract social links (mailto: and profile links count too)
+        data.social_links = extract_social_links(text, " ".join(page.links))
         
         # Check for contact
         data.has_contact = bool(re.search(
@@ -242,18 +415,19 @@ async def analyze_portfolio(portfolio_url: str) -> PortfolioData:
             data.about = about_match.group(1).strip()[:300]
         
         # Extract projects
-        data.projects = parse_projects_from_html(html, text)
+        data.projects = parse_projects(page)
         
-        # Extract links from HTML
-        links = re.findall(r'href="(https?://[^"]+)"', html)
-        for proj in data.projects:
-            for link in links:
+        # Attach the first two demo/source links to every project
+        project_links = []
+        for link in page.links:
+            if link.startswith(("http://", "https://")) and link not in project_links:
                 if any(kw in link.lower() for kw in ['github.com', 'demo', 'live', 'deploy']):
-                    if link not in proj.links:
-                        proj.links.append(link)
-                        if len(proj.links) >= 2:
-                            break
-        
+                    project_links.append(link)
+                    if len(project_links) >= 2:
+                        break
+        for proj in data.projects:
+            proj.links = list(project_links)
+    
     except httpx.HTTPStatusError as e:
         data.error = f"HTTP {e.response.status_code}"
     except httpx.ConnectError:
@@ -265,9 +439,8 @@ async def analyze_portfolio(portfolio_url: str) -> PortfolioData:
 
 
 def analyze_sync(portfolio_url: str) -> PortfolioData:
-    """Synchronous wrapper."""
-    import asyncio
-    return asyncio.run(analyze_portfolio(portfolio_url))
+    """Synchronous wrapper (uses the pooled client)."""
+    return http_clients.registry.run(analyze_portfolio(portfolio_url))
 
 
 def analyze(portfolio_url: str) -> dict:
@@ -275,3 +448,9 @@ def analyze(portfolio_url: str) -> dict:
     result = analyze_sync(portfolio_url).to_dict()
     # Remove None values
     return {k: v for k, v in result.items() if v is not None}
+
+
+async def analyze_async(portfolio_url: str) -> dict:
+    """Async analyze for callers already running an event loop."""
+    result = (await analyze_portfolio(portfolio_url)).to_dict()
+    return {k: v for k, v in result.items() if v is not None}
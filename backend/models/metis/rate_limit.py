@@ -0,0 +1,238 @@
+"""
+GitHub Rate Limit Scheduler
+
+Process-wide scheduler for GitHub API requests. It tracks the budget from
+the X-RateLimit-* headers of every response and decides when each request
+may go out:
+
+- Interactive requests (a user is waiting) may spend the whole remaining
+  budget. When it is gone they wait for the reset only if it is close,
+  otherwise they fail fast with RateLimited.
+- Batch requests leave INTERACTIVE_RESERVE requests untouched and are paced
+  by a token bucket that spreads the rest of the budget over the time left
+  until the reset. When the budget is spent, or GitHub answers with a rate
+  limit error anyway, they wait for the reset if it is within
+  BATCH_MAX_WAIT (and the block's deadline), otherwise they fail with
+  RateLimited so a synchronous batch can stop and report its progress.
+
+Requests are batch inside a batch_priority() block, interactive otherwise.
+The state is guarded by a thread lock and waiting is done with
+asyncio.sleep, so requests from any event loop share one budget.
+"""
+
+import asyncio
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+import httpx
+
+
+INTERACTIVE = "interactive"
+BATCH = "batch"
+
+# Unauthenticated GitHub core limit, assumed until a response says otherwise
+DEFAULT_LIMIT = 60
+DEFAULT_WINDOW_SECONDS = 3600
+
+# Requests batch work leaves for interactive evaluations
+INTERACTIVE_RESERVE = 10
+
+# Batch requests that may go out back to back before pacing applies
+BATCH_BURST = 10
+
+# Longest wait for a reset an interactive request accepts
+INTERACTIVE_MAX_WAIT = 5.0
+
+# Longest single wait a batch request accepts; batches run inside a web
+# request, which the worker timeout (120s) would kill long before a reset
+BATCH_MAX_WAIT = 30.0
+
+# Allowance for clock skew when waiting for GitHub's reset time
+RESET_MARGIN = 1.0
+
+_priority: ContextVar[str] = ContextVar("github_priority", default=INTERACTIVE)
+_deadline: ContextVar[float | None] = ContextVar("github_deadline", default=None)
+
+
+@contextmanager
+def batch_priority(deadline: float | None = None):
+    """
+    Schedule GitHub requests made inside the block as batch work.
+
+    Args:
+        deadline: Wall-clock time (time.time()) past which requests fail with
+            RateLimited instead of waiting (None: BATCH_MAX_WAIT only)
+    """
+    priority_token = _priority.set(BATCH)
+    deadline_token = _deadline.set(deadline)
+    try:
+        yield
+    finally:
+        _deadline.reset(deadline_token)
+        _priority.reset(priority_token)
+
+
+def current_priority() -> str:
+    """Priority of GitHub requests made from the current context."""
+    return _priority.get()
+
+
+class RateLimited(RuntimeError):
+    """Raised when a request would wait longer than its priority allows."""
+
+    def __init__(self, reset_in: float):
+        super().__init__(f"GitHub API rate limit exhausted; resets in {reset_in:.0f}s")
+        self.reset_in = reset_in
+
+
+def is_rate_limited(response: httpx.Response) -> bool:
+    """Whether GitHub refused the request for rate limiting (primary or secondary)."""
+    if response.status_code not in (403, 429):
+        return False
+    return response.headers.get("x-ratelimit-remaining") == "0" or "retry-after" in response.headers
+
+
+class RateLimitScheduler:
+    """
+    Shared GitHub request budget.
+
+    Args:
+        limit: Requests per window assumed before any response is seen
+        window: Window length (seconds) assumed before any response is seen
+        reserve: Requests batch work leaves for interactive work
+        burst: Batch token bucket capacity
+    """
+
+    def __init__(
+        self,
+        limit: int = DEFAULT_LIMIT,
+        window: float = DEFAULT_WINDOW_SECONDS,
+        reserve: int = INTERACTIVE_RESERVE,
+        burst: int = BATCH_BURST,
+    ):
+        self.limit = limit
+        self.window = window
+        self.reserve = reserve
+        self.burst = burst
+        self.remaining = limit
+        self.reset_at = time.time() + window
+        self.batch_waits = 0
+        self.rejected = 0
+        self._tokens = float(burst)
+        self._refilled_at = time.time()
+        self._in_flight = 0
+        self._lock = threading.Lock()
+
+    async def send(self, client: httpx.AsyncClient, request: httpx.Request) -> httpx.Response:
+        """
+        Send request once the budget allows it.
+
+        Batch requests that GitHub rejects for rate limiting are retried
+        after the reset, if it is close enough; interactive ones return the
+        rejection.
+
+        Raises:
+            RateLimited: If the request would wait past INTERACTIVE_MAX_WAIT
+                (interactive) or BATCH_MAX_WAIT or the batch deadline (batch)
+        """
+        priority = _priority.get()
+        while True:
+            await self.acquire(priority)
+            try:
+                response = await client.send(request)
+            except BaseException:
+                with self._lock:
+                    self._in_flight -= 1
+                raise
+            self.observe(response)
+            if priority == INTERACTIVE or not is_rate_limited(response):
+                return response
+
+    async def acquire(self, priority: str = INTERACTIVE) -> None:
+        """Wait until a request of the given priority may go out, and count it."""
+        while True:
+            delay = self._try_acquire(priority)
+            if delay <= 0:
+                return
+            if delay > self._max_wait(priority):
+                with self._lock:
+                    self.rejected += 1
+                raise RateLimited(delay)
+            await asyncio.sleep(delay)
+
+    @staticmethod
+    def _max_wait(priority: str) -> float:
+        if priority == INTERACTIVE:
+            return INTERACTIVE_MAX_WAIT
+        deadline = _deadline.get()
+        if deadline is None:
+            return BATCH_MAX_WAIT
+        return min(BATCH_MAX_WAIT, deadline - time.time())
+
+    def _try_acquire(self, priority: str) -> float:
+        """Take a request from the budget; return 0, or the seconds to wait first."""
+        with self._lock:
+            now = time.time()
+            if now >= self.reset_at + RESET_MARGIN:
+                # Assume a fresh window until a response reports the real one
+                self.remaining = self.limit
+                self.reset_at = now + self.window
+            self._refill(now)
+
+            until_reset = self.reset_at + RESET_MARGIN - now
+            if priority == INTERACTIVE:
+                if self.remaining <= 0:
+                    return until_reset
+            else:
+                if self.remaining <= self.reserve:
+                    self.batch_waits += 1
+                    return until_reset
+                if self._tokens < 1:
+                    self.batch_waits += 1
+                    return (1 - self._tokens) / self._batch_rate(now)
+                self._tokens -= 1
+
+            self.remaining -= 1
+            self._in_flight += 1
+            return 0.0
+
+    def _batch_rate(self, now: float) -> float:
+        """Batch requests per second that spend the unreserved budget by the reset."""
+        return max(self.remaining - self.reserve, 0) / max(self.reset_at - now, 1.0)
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.burst, self._tokens + (now - self._refilled_at) * self._batch_rate(now))
+        self._refilled_at = now
+
+    def observe(self, response: httpx.Response) -> None:
+        """Finish an acquired request and update the budget from its headers."""
+        headers = response.headers
+        with self._lock:
+            self._in_flight -= 1
+            if "x-ratelimit-remaining" in headers:
+                self.limit = int(headers.get("x-ratelimit-limit", self.limit))
+                # Other requests in flight have been counted here but not yet there
+                self.remaining = max(int(headers["x-ratelimit-remaining"]) - self._in_flight, 0)
+                self.reset_at = float(headers.get("x-ratelimit-reset", self.reset_at))
+            if is_rate_limited(response):
+                self.remaining = 0
+                if "retry-after" in headers:
+                    self.reset_at = max(self.reset_at, time.time() + float(headers["retry-after"]))
+
+    def info(self) -> dict:
+        """Budget and counters, for diagnostics endpoints."""
+        with self._lock:
+            return {
+                "limit": self.limit,
+                "remaining": self.remaining,
+                "reset_in": round(max(self.reset_at - time.time(), 0.0), 1),
+                "reserve": self.reserve,
+                "batch_waits": self.batch_waits,
+                "rejected": self.rejected,
+            }
+
+
+# Process-wide scheduler used for every GitHub API request
+scheduler = RateLimitScheduler()
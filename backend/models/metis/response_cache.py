@@ -0,0 +1,209 @@
+"""
+GitHub Response Cache
+
+Conditional-request cache for GitHub API GET responses, keyed by the full
+request URL. An entry younger than fresh_seconds is served with no request
+at all; an older one is revalidated with If-None-Match / If-Modified-Since,
+and a 304 answer (which GitHub does not count against the rate limit) serves
+the stored body again and restarts its freshness window.
+
+Two tiers, like the parse cache:
+- In-process LRU (always on, per worker)
+- MongoDB collection (optional, shared across workers and restarts)
+"""
+
+import asyncio
+import threading
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from datetime import datetime, timezone
+
+import httpx
+
+
+DEFAULT_MAX_ENTRIES = 4096
+
+# Entries younger than this are served without contacting GitHub
+DEFAULT_FRESH_SECONDS = 3600
+
+# Mongo entries expire after this many seconds (TTL index on storedAt)
+MONGO_TTL_SECONDS = 7 * 24 * 3600
+
+# Response headers kept with the body (validators plus pagination)
+STORED_HEADERS = ("content-type", "etag", "last-modified", "link")
+
+
+def _as_utc(value: datetime) -> datetime:
+    """PyMongo hands back naive datetimes that are in UTC; make them comparable."""
+    return value if value.tzinfo is not None else value.replace(tzinfo=timezone.utc)
+
+
+@dataclass
+class CacheStats:
+    """Counters for the response cache."""
+    fresh_hits: int = 0
+    revalidated: int = 0
+    misses: int = 0
+
+    @property
+    def requests_saved(self) -> int:
+        """Lookups that did not count against the rate limit."""
+        return self.fresh_hits + self.revalidated
+
+    def to_dict(self) -> dict:
+        lookups = self.requests_saved + self.misses
+        return {
+            "fresh_hits": self.fresh_hits,
+            "revalidated": self.revalidated,
+            "misses": self.misses,
+            "hit_rate": round(self.requests_saved / lookups, 4) if lookups else 0.0,
+        }
+
+
+class ResponseCache:
+    """
+    Two-tier cache of successful GitHub API responses.
+
+    Only 200 responses that carry an ETag or Last-Modified header are
+    stored, so every entry can be revalidated once it goes stale.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        fresh_seconds: float = DEFAULT_FRESH_SECONDS,
+        collection=None,
+    ):
+        self.max_entries = max_entries
+        self.fresh_seconds = fresh_seconds
+        self.collection = collection
+        self.stats = CacheStats()
+        self._entries: OrderedDict[str, dict] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def attach_collection(self, collection) -> None:
+        """Enable the MongoDB tier using the given collection."""
+        self.collection = collection
+        try:
+            collection.create_index("storedAt", expireAfterSeconds=MONGO_TTL_SECONDS)
+        except Exception as e:
+            print(f"Response cache index creation failed: {e}")
+
+    async def get(
+        self,
+        client: httpx.AsyncClient,
+        url: str,
+        params: dict | None = None,
+        send: Callable[[httpx.AsyncClient, httpx.Request], Awaitable[httpx.Response]] | None = None,
+    ) -> httpx.Response:
+        """
+        GET url through the cache.
+
+        Args:
+            client: Client that builds and sends the request
+            url: Request URL
+            params: Query parameters
+            send: Sends a request that reaches the network (default: client.send)
+
+        Returns:
+            A live response on a miss, or one rebuilt from the stored entry
+            on a hit; either way callers use it like client.get's result
+        """
+        request = client.build_request("GET", url, params=params)
+        key = str(request.url)
+        entry = await self._lookup(key)
+
+        if entry is not None:
+            age = (datetime.now(timezone.utc) - entry["storedAt"]).total_seconds()
+            if age < self.fresh_seconds:
+                with self._lock:
+                    self.stats.fresh_hits += 1
+                return self._rebuild(request, entry)
+            if entry["headers"].get("etag"):
+                request.headers["If-None-Match"] = entry["headers"]["etag"]
+            if entry["headers"].get("last-modified"):
+                request.headers["If-Modified-Since"] = entry["headers"]["last-modified"]
+
+        response = await send(client, request) if send is not None else await client.send(request)
+
+        if response.status_code == 304 and entry is not None:
+            with self._lock:
+                self.stats.revalidated += 1
+            entry = {**entry, "storedAt": datetime.now(timezone.utc)}
+            await self._store(key, entry)
+            return self._rebuild(request, entry)
+
+        with self._lock:
+            self.stats.misses += 1
+        if response.status_code == 200 and ("etag" in response.headers or "last-modified" in response.headers):
+            await self._store(key, {
+                "body": response.text,
+                "headers": {name: response.headers[name] for name in STORED_HEADERS if name in response.headers},
+                "storedAt": datetime.now(timezone.utc),
+            })
+        return response
+
+    @staticmethod
+    def _rebuild(request: httpx.Request, entry: dict) -> httpx.Response:
+        return httpx.Response(200, headers=entry["headers"], text=entry["body"], request=request)
+
+    async def _lookup(self, key: str) -> dict | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                return entry
+
+        if self.collection is None:
+            return None
+        try:
+            doc = await asyncio.to_thread(self.collection.find_one, {"_id": key})
+        except Exception as e:
+            print(f"Response cache lookup failed: {e}")
+            return None
+        if not doc:
+            return None
+        entry = {"body": doc["body"], "headers": doc["headers"], "storedAt": _as_utc(doc["storedAt"])}
+        self._remember(key, entry)
+        return entry
+
+    async def _store(self, key: str, entry: dict) -> None:
+        self._remember(key, entry)
+
+        if self.collection is not None:
+            try:
+                await asyncio.to_thread(
+                    self.collection.update_one, {"_id": key}, {"$set": entry}, upsert=True
+                )
+            except Exception as e:
+                print(f"Response cache write failed: {e}")
+
+    def _remember(self, key: str, entry: dict) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop the memory tier and reset counters (Mongo entries are kept)."""
+        with self._lock:
+            self._entries.clear()
+            self.stats = CacheStats()
+
+    def info(self) -> dict:
+        """Counters plus tier sizes, for diagnostics endpoints."""
+        with self._lock:
+            size = len(self._entries)
+        return {
+            **self.stats.to_dict(),
+            "entries": size,
+            "max_entries": self.max_entries,
+            "fresh_seconds": self.fresh_seconds,
+            "mongo_enabled": self.collection is not None,
+        }
+
+
+# Process-wide cache used by github_analyzer
+cache = ResponseCache()
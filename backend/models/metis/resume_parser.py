@@ -5,10 +5,29 @@ Extracts structured data from resume text including education, experience,
 skills, projects, certifications, and contact information without losing data.
 """
 
+import atexit
+import hashlib
+import io
+import logging
 import re
 import os
+import threading
+import time
+import multiprocessing
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from collections.abc import Mapping
+from contextlib import contextmanager
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional, Tuple
+from xml.etree import ElementTree
+from typing import BinaryIO, Callable, List, Dict, Iterable, Iterator, Optional, Tuple, Union
+
+from . import parse_cache
+from .keyword_matcher import KeywordMatcher
+
+
+logger = logging.getLogger(__name__)
 
 try:
     import pdfplumber
@@ -21,17 +40,325 @@ except ImportError:
     PdfReader = None
 
 
-@dataclass
+# Bump whenever a change alters parse() output; cached results are keyed on it
+PARSER_VERSION = "5"
+
+
+# ---------------------------------------------------------------------------
+# Parsing budget
+#
+# Bounds the work a single resume can cause. Raw input past MAX_RAW_CHARS
+# is dropped before normalization, whitespace is collapsed and overlong
+# lines are wrapped before any pattern runs, normalized input past
+# MAX_RESUME_CHARS is dropped, and each section parser checks a deadline
+# between entries. A section that runs out of time keeps what it parsed so
+# far and the result is flagged partial.
+# ---------------------------------------------------------------------------
+
+# Longest resume text parsed; the rest is dropped (4 dense pages is ~20k)
+MAX_RESUME_CHARS = 30000
+
+# Raw text normalized; only normalization sees input this long. Whitespace
+# collapsing would have to remove nine characters in ten for the text kept
+# to fall under MAX_RESUME_CHARS, so in practice input cut here is still
+# flagged partial by the MAX_RESUME_CHARS cut.
+MAX_RAW_CHARS = 10 * MAX_RESUME_CHARS
+
+# Lines are wrapped to this length so no pattern ever scans an unbounded line
+MAX_LINE_CHARS = 1000
+
+# Seconds each section parser may spend before returning what it has
+SECTION_TIME_BUDGET = 0.25
+
+# Marker in partial_sections when the input itself was cut
+TRUNCATED_INPUT = "input"
+
+HORIZONTAL_SPACE_RE = re.compile(r"[^\S\n]+")
+BLANK_LINES_RE = re.compile(r"\n{3,}")
+
+
+# ---------------------------------------------------------------------------
+# Compiled pattern registry
+#
+# Every pattern used by the parser is compiled once at import time. Order
+# inside each list matters: callers return on the first match.
+# ---------------------------------------------------------------------------
+
+_MONTHS = r"(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)"
+
+EMAIL_PATTERNS = [
+    re.compile(r"\b[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}\b"),
+    re.compile(r"[Ee]mail\s*:\s*([a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})"),
+    re.compile(r"[Ee]-?mail\s*:\s*([a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})"),
+]
+
+PHONE_PATTERNS = [
+    re.compile(r"\+91[-\s]?\d{10}"),  # Indian format with +91
+    re.compile(r"\+91[-\s]?\d{5}[-\s]?\d{5}"),  # Indian format with space
+    re.compile(r"\+1[-\s]?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}"),  # US format
+    re.compile(r"\+\d{1,3}[-.\s]?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}"),  # International
+    re.compile(r"\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}"),  # Standard format
+    re.compile(r"\d{10}"),  # Simple 10-digit
+    re.compile(r"\d{3}[-.\s]\d{3}[-.\s]\d{4}"),  # Formatted
+]
+
+NON_DIGIT_RE = re.compile(r"\D")
+NON_ALPHA_RE = re.compile(r"[^a-zA-Z]")
+YEAR_RE = re.compile(r"\d{4}")
+
+NAME_HEADER_SKIP_RE = re.compile(r"(resume|curriculum vitae|cv|portfolio|profile)", re.IGNORECASE)
+NAME_CONTACT_SKIP_RE = re.compile(r"[@+\(\)\d]|email|phone|linkedin|github", re.IGNORECASE)
+NAME_SPECIAL_SKIP_RE = re.compile(r"[#$%^&*(){}[\]\\|<>]|\d{2,}")
+
+LOCATION_PATTERNS = [
+    re.compile(r"(?:Location|Address|City)\s*:\s*([^\n]+)", re.IGNORECASE),
+    re.compile(r"\b([A-Z][a-z]+),\s*([A-Z]{2})\s*\d{5}\b", re.IGNORECASE),  # City, State ZIP
+    re.compile(r"\b([A-Z][a-z]+),\s*([A-Z][a-z]+),\s*([A-Z][a-z]+)\b", re.IGNORECASE),  # City, State, Country
+]
+
+LINKEDIN_PATTERNS = [
+    re.compile(r"https?://(?:www\.)?linkedin\.com/in/[^\s<>\"\']+", re.IGNORECASE),
+    re.compile(r"linkedin\.com/in/[^\s<>\"\']+", re.IGNORECASE),
+    re.compile(r"(?:LinkedIn|Linkedin)\s*:\s*(https?://[^\s]+|[^\s]+linkedin[^\s]+)", re.IGNORECASE),
+]
+
+GITHUB_PATTERNS = [
+    re.compile(r"https?://(?:www\.)?github\.com/[^\s<>\"\']+", re.IGNORECASE),
+    re.compile(r"github\.com/[^\s<>\"\']+", re.IGNORECASE),
+    re.compile(r"(?:GitHub|Github)\s*:\s*(https?://[^\s]+|[^\s]+github[^\s]+)", re.IGNORECASE),
+]
+
+# Portfolio/Website - comprehensive TLD list
+PORTFOLIO_RE = re.compile(
+    r"https?://[a-zA-Z0-9.-]+\.(?:dev|app|com|in|io|net|org|xyz|co|me|tech|online|site|vercel\.app|github\.io|netlify\.app|herokuapp\.com|web\.app|firebaseapp\.com|repl\.co|glitch\.me|now\.sh|surge\.sh)(?:/[^\s<>\"\']*)?(?=\s|$|<|>|\"|\|)",
+    re.IGNORECASE,
+)
+
+SKILLS_SECTION_PATTERNS = [
+    re.compile(
+        r"(?:technical\s+)?(?:skills?|competencies|expertise|technologies)\s*[:\-]?\s*\n?(.*?)(?=\n\s*(?:experience|education|projects?|certifications?|work\s+history|employment|academic|background|awards?|languages?|interests?)\s*[:\-]?\s*\n|\Z)",
+        re.IGNORECASE | re.DOTALL,
+    ),
+    re.compile(
+        r"(?:skills?\s+and\s+)?(?:abilities|proficiencies)\s*[:\-]?\s*\n?(.*?)(?=\n\s*(?:experience|education|projects?)\s*[:\-]?\s*\n|\Z)",
+        re.IGNORECASE | re.DOTALL,
+    ),
+]
+
+# Subsection headers inside the skills block, replaced by a delimiter.
+# Every header must be followed by ':', so a single alternation is
+# equivalent to substituting each header in turn.
+SKILLS_SUBSECTION_RE = re.compile(
+    "(?:" + "|".join([
+        r"(?:AI\s*&\s*ML|Machine\s+Learning|Deep\s+Learning)",
+        r"(?:Languages?\s*(?:&|and)?\s*Frameworks?|Programming\s+Languages?)",
+        r"(?:Tools?\s*(?:&|and)?\s*(?:Data|Technologies|Platforms))",
+        r"(?:Computer\s+Vision|Natural\s+Language\s+Processing|NLP)",
+        r"(?:Web\s+Development|Frontend|Backend|Full[-\s]?Stack)",
+        r"(?:Database|Data\s+Management|Cloud|DevOps)",
+        r"(?:Soft\s+Skills?|Professional\s+Skills?|Core\s+Competencies)",
+        r"(?:Technical|Programming|Development)",
+    ]) + r")\s*:",
+    re.IGNORECASE,
+)
+
+SKILL_DELIMITER_RE = re.compile(r"[,|•·\n]")
+SKILL_LEADING_RE = re.compile(r"^[-•·\-\*\+\s\d\.]+")
+SKILL_TRAILING_RE = re.compile(r"[-•·\-\*\+\s]+$")
+PARENTHETICAL_RE = re.compile(r"\([^)]*\)")
+TRAILING_PERIOD_RE = re.compile(r"\.$")
+DIGITS_ONLY_RE = re.compile(r"^\d+$")
+PUNCTUATION_ONLY_RE = re.compile(r"^[:\-\.\,\;\(\)]+$")
+
+SKILL_SKIP_WORDS = frozenset({
+    'and', 'or', 'the', 'a', 'an', 'in', 'at', 'to', 'for', 'with',
+    'of', 'on', 'as', 'by', 'from', 'into', 'about', 'like', 'through',
+    'over', 'before', 'between', 'under', 'during', 'including',
+})
+
+# Common section names that mark the end of current section
+END_SECTIONS = [
+    "experience", "education", "technical\\s+skills?", "skills?",
+    "projects?", "certifications?", "summary", "objective",
+    "professional\\s+experience", "work\\s+history", "employment",
+    "academic", "background", "awards?", "achievements?", "languages?",
+    "publications?", "volunteer", "interests?", "hobbies", "references?"
+]
+END_SECTIONS_PATTERN = "|".join(END_SECTIONS)
+
+# Section headers understood by the segmenter, keyed by section name
+SECTION_HEADERS = {
+    "summary": r"summary",
+    "objective": r"objective",
+    "about": r"about",
+    "profile": r"profile",
+    "professional_summary": r"professional\s+summary",
+    "experience": r"(?:work\s+)?(?:experience|employment|work\s+history|professional\s+experience)",
+    "education": r"education",
+    "projects": r"projects?",
+    "certifications": r"certifications?",
+    "licenses": r"licenses?",
+    "credentials": r"credentials?",
+    "professional_development": r"professional\s+development",
+}
+
+SUMMARY_SECTIONS = ["summary", "objective", "about", "profile", "professional_summary"]
+CERTIFICATION_SECTIONS = ["certifications", "licenses", "credentials", "professional_development"]
+
+# segment_sections() keys each section parser reads, first non-empty wins
+SECTION_KEYS = {
+    "experience": ["experience"],
+    "education": ["education"],
+    "projects": ["projects"],
+    "certifications": CERTIFICATION_SECTIONS,
+}
+
+# Sections fingerprinted for incremental re-parsing, in parse order
+FINGERPRINTED_SECTIONS = ["skills", "experience", "education", "projects", "certifications"]
+
+# A header line: optional markdown marker, the header text, optional ':' or '-'
+HEADER_LINE_RE = re.compile(r"(?:###\s*)?(?P<name>.+?)\s*[:\-]?")
+# Cheap pre-filter: does a line match any known header at all?
+ANY_HEADER_LINE_RE = re.compile(
+    r"(?:###\s*)?(?:" + "|".join([*SECTION_HEADERS.values(), END_SECTIONS_PATTERN]) + r")\s*[:\-]?",
+    re.IGNORECASE,
+)
+SECTION_HEADER_RES = {
+    key: re.compile(pattern, re.IGNORECASE) for key, pattern in SECTION_HEADERS.items()
+}
+END_HEADER_RE = re.compile(rf"(?:{END_SECTIONS_PATTERN})", re.IGNORECASE)
+# Longest header line worth classifying; anything longer is body text
+MAX_HEADER_LENGTH = 64
+
+EXPERIENCE_SPLIT_RES = [
+    re.compile(r"\n(?=[A-Z][^a-z\n]{5,80}(?:\n|$))"),  # All caps title
+    re.compile(r"\n(?=[A-Z][^\n]{10,80}(?:\||at|@|·|•|-{2,})[^\n]+)"),  # Title with separator and company
+    re.compile(r"\n(?=\d{4}\s*[-–]\s*(?:\d{4}|Present|Current))"),  # Starting with date range
+]
+
+TITLE_COMPANY_RES = [
+    re.compile(r"^(.+?)\s*[\|]\s*(.+?)$", re.IGNORECASE),  # Title | Company
+    re.compile(r"^(.+?)\s+at\s+(.+?)$", re.IGNORECASE),  # Title at Company
+    re.compile(r"^(.+?)\s*[@•·–-]\s*(.+?)$", re.IGNORECASE),  # Title @/•/· Company
+]
+
+# The leading \b stops (\w+\s+\d{4}) from being retried inside every long word
+EXPERIENCE_DURATION_RES = [
+    re.compile(r"\b(\w+\s+\d{4})\s*[-–]\s*(\w+\s+\d{4}|present|current)", re.IGNORECASE),
+    re.compile(r"(\d{1,2}/\d{4})\s*[-–]\s*(\d{1,2}/\d{4}|present|current)", re.IGNORECASE),
+    re.compile(r"(\d{4})\s*[-–]\s*(\d{4}|present|current)", re.IGNORECASE),
+]
+
+ENTRY_LOCATION_RE = re.compile(r"(?:Location|City)\s*:\s*([^\n]+)", re.IGNORECASE)
+DATE_LINE_RE = re.compile(rf"^\d{{4}}|^{_MONTHS}", re.IGNORECASE)
+BULLET_START_RE = re.compile(r"^[•\-\*\+]")
+BULLET_PREFIX_RE = re.compile(r"^[•\-\*\+]\s*")
+
+EDUCATION_INSTITUTION_SPLIT_RE = re.compile(r"\n(?=[A-Z][^\n]{10,}(?:University|College|Institute|School|Academy))")
+EDUCATION_DEGREE_SPLIT_RE = re.compile(
+    r"\n(?=(?:Bachelor|Master|PhD|Ph\.D|B\.Tech|M\.Tech|B\.S\.|M\.S\.|B\.A\.|M\.A\.|Associate|Diploma))",
+    re.IGNORECASE,
+)
+
+DEGREE_RES = [
+    re.compile(r"(Bachelor.*?(?:of|in|degree)|B\.?(?:Tech|S|A|Sc)\.?.*)", re.IGNORECASE),
+    re.compile(r"(Master.*?(?:of|in|degree)|M\.?(?:Tech|S|A|Sc)\.?.*)", re.IGNORECASE),
+    re.compile(r"((?:PhD|Ph\.D|Doctorate).*)", re.IGNORECASE),
+    re.compile(r"(Associate.*?(?:of|in|degree))", re.IGNORECASE),
+    re.compile(r"(Diploma.*)", re.IGNORECASE),
+]
+
+INSTITUTION_KEYWORDS = ["University", "College", "Institute", "School", "Academy", "Polytechnic"]
+
+FIELD_OF_STUDY_RES = [
+    re.compile(r"(?:in|of)\s+([A-Z][^\n,]{10,60})", re.IGNORECASE),
+    re.compile(r"(?:Major|Specialization|Focus|Field|Stream)\s*:\s*([^\n]+)", re.IGNORECASE),
+]
+FIELD_SUFFIX_RE = re.compile(r"\s*\(.*?\).*$")
+
+EDUCATION_YEAR_RES = [
+    re.compile(r"(20\d{2})\s*[-–]\s*(20\d{2}|present|current|expected)", re.IGNORECASE),
+    re.compile(r"(?:Class\s+of|Graduated)\s*:?\s*(20\d{2})", re.IGNORECASE),
+    re.compile(r"\b(20\d{2})\b", re.IGNORECASE),
+]
+
+# (pattern, is_gpa) - GPA/CGPA patterns fill gpa, the rest fill percentage.
+# Number quantifiers are possessive: a plain (\d+\.?\d*)% backtracks
+# cubically over a long digit run that is not followed by '%'.
+GPA_RES = [
+    (re.compile(r"(?:GPA|CGPA)\s*:?\s*(\d+\.?\d*)\s*(?:/\s*(\d+\.?\d*))?", re.IGNORECASE), True),
+    (re.compile(r"(?:Grade|Score)\s*:?\s*(\d++\.?+\d*+)%", re.IGNORECASE), False),
+    (re.compile(r"(?<!\d)(\d++\.?+\d*+)%", re.IGNORECASE), False),
+]
+
+EDUCATION_LOCATION_RE = re.compile(r",\s*([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s*$")
+
+PROJECT_SPLIT_RE = re.compile(r"\n(?=[A-Z][^\n]{5,100}(?:\n|$))")
+URL_RE = re.compile(r"https?://[^\s]+")
+PROJECT_NAME_SEPARATOR_RE = re.compile(r"[•\-–|]")
+PROJECT_NAME_DATES_RE = re.compile(
+    rf"\s*{_MONTHS}[a-z]*+\s+\d{{4}}\s*[-–]\s*(?:Present|Current|{_MONTHS}[a-z]*+\s+\d{{4}})",
+    re.IGNORECASE,
+)
+PROJECT_DURATION_RE = re.compile(r"\b(\w+\s+\d{4})\s*[-–]\s*(\w+\s+\d{4}|Present|Current)", re.IGNORECASE)
+PROJECT_ROLE_RE = re.compile(r"(?:Role|Position)\s*:\s*([^\n]+)", re.IGNORECASE)
+PROJECT_TEAM_RE = re.compile(r"(?:Team\s+Size)\s*:\s*(\d+)", re.IGNORECASE)
+PROJECT_URL_RES = [
+    re.compile(r"(?:GitHub|Repository|Repo|Source)\s*:\s*(https?://[^\s]+)", re.IGNORECASE),
+    re.compile(r"(?:Live|Demo|Link|URL|Website)\s*:\s*(https?://[^\s]+)", re.IGNORECASE),
+    re.compile(r"(https?://github\.com/[^\s]+)", re.IGNORECASE),
+    re.compile(r"(https?://[^\s]+)", re.IGNORECASE),
+]
+
+# Common tech keywords looked up in project entries
+PROJECT_TECH_KEYWORDS = [
+    # Frontend
+    "React", "Next.js", "Vue", "Angular", "Svelte", "HTML", "CSS",
+    "JavaScript", "TypeScript", "Tailwind", "Bootstrap", "SASS",
+    # Backend
+    "Node.js", "Express", "Django", "Flask", "FastAPI", "Spring",
+    "Ruby on Rails", ".NET", "PHP", "Laravel",
+    # Databases
+    "PostgreSQL", "MySQL", "MongoDB", "Redis", "SQLite", "Oracle",
+    "DynamoDB", "Cassandra", "Prisma", "Supabase",
+    # Cloud/DevOps
+    "AWS", "Azure", "GCP", "Docker", "Kubernetes", "Jenkins", "CI/CD",
+    "Terraform", "Ansible", "Vercel", "Netlify", "Heroku",
+    # Languages
+    "Python", "Java", "C++", "C#", "Go", "Rust", "Ruby", "PHP", "Swift", "Kotlin",
+    # ML/AI
+    "TensorFlow", "PyTorch", "Keras", "scikit-learn", "OpenCV",
+    "YOLO", "NumPy", "Pandas", "Matplotlib",
+    # Mobile
+    "React Native", "Flutter", "iOS", "Android", "Kotlin", "Swift",
+    # Other
+    "GraphQL", "REST", "API", "Git", "GitHub", "GitLab", "Firebase",
+    "JWT", "OAuth", "WebSocket", "Microservices",
+]
+PROJECT_TECH_MATCHER = KeywordMatcher.from_keywords(PROJECT_TECH_KEYWORDS)
+
+CERT_SPLIT_RE = re.compile(r"\n(?=[A-Z•\-\*])")
+CERT_BULLET_RE = re.compile(r"^[•\-\*\+\d\.]\s*")
+CERT_NAME_ISSUER_RE = re.compile(r"\s*[-|–]\s*")
+CERT_DATE_RES = [
+    re.compile(r"(?:Issued|Earned|Obtained|Completed)\s*:?\s*(\w+\s+\d{4})", re.IGNORECASE),
+    re.compile(r"(?:Date|Year)\s*:?\s*(\w+\s+\d{4}|\d{4})", re.IGNORECASE),
+    re.compile(r"\b(\w+\s+\d{4})\b", re.IGNORECASE),
+    re.compile(r"\b(20\d{2})\b", re.IGNORECASE),
+]
+CERT_EXPIRY_RE = re.compile(r"(?:Expires|Valid\s+until)\s*:?\s*(\w+\s+\d{4})", re.IGNORECASE)
+CERT_CREDENTIAL_RE = re.compile(
+    r"(?:Credential|Certificate|License)\s*(?:ID|#|Number)\s*:?\s*([A-Z0-9-]+)",
+    re.IGNORECASE,
+)
+
+
+@dataclass(slots=True)
 class Experience:
-    """Work experience entry with comprehensive field support."""
+    """Work experience entry."""
     title: str = ""
-    position: str = ""  # Alias for title
     company: str = ""
-    organization: str = ""  # Alias for company
-    employer: str = ""  # Another alias
     duration: str = ""
-    period: str = ""  # Alias for duration
-    dates: str = ""  # Another alias
     start_date: str = ""
     end_date: str = ""
     location: str = ""
@@ -40,11 +367,8 @@ class Experience:
     achievements: List[str] = field(default_factory=list)
     
     def to_dict(self) -> dict:
-        """Convert to dictionary with normalized field names."""
-        # Normalize: use primary fields, fallback to aliases
-        title_value = self.title or self.position
-        company_value = self.company or self.organization or self.employer
-        duration_value = self.duration or self.period or self.dates
+        """Convert to a compact dictionary (canonical keys only)."""
+        duration_value = self.duration
         
         # If we have start/end dates but no duration, construct it
         if not duration_value and (self.start_date or self.end_date):
@@ -58,10 +382,8 @@ class Experience:
             full_description += "\n" + "\n".join(f"• {a}" for a in self.achievements)
         
         return {
-            "title": title_value,
-            "position": title_value,
-            "company": company_value,
-            "organization": company_value,
+            "title": self.title,
+            "company": self.company,
             "duration": duration_value,
             "start_date": self.start_date,
             "end_date": self.end_date,
@@ -72,112 +394,67 @@ class Experience:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class Education:
-    """Education entry with comprehensive field support."""
+    """Education entry."""
     degree: str = ""
-    qualification: str = ""  # Alias
     institution: str = ""
-    school: str = ""  # Alias
-    university: str = ""  # Alias
-    college: str = ""  # Alias
     field: str = ""
-    field_of_study: str = ""  # Alias
-    major: str = ""  # Alias
-    specialization: str = ""  # Alias
-    stream: str = ""  # Alias
     year: str = ""
-    graduation_year: str = ""  # Alias
     start_date: str = ""
     end_date: str = ""
     gpa: str = ""
-    cgpa: str = ""
     percentage: str = ""
     location: str = ""
     
     def to_dict(self) -> dict:
-        """Convert to dictionary with normalized field names."""
-        degree_value = self.degree or self.qualification
-        institution_value = self.institution or self.school or self.university or self.college
-        field_value = self.field or self.field_of_study or self.major or self.specialization or self.stream
-        year_value = self.year or self.graduation_year
+        """Convert to a compact dictionary (canonical keys only)."""
+        year_value = self.year
         
         # If we have start/end dates but no year, construct it
         if not year_value and (self.start_date or self.end_date):
             year_value = f"{self.start_date} - {self.end_date}".strip(" -")
         
-        gpa_value = self.gpa or self.cgpa or self.percentage
-        
         return {
-            "degree": degree_value,
-            "qualification": degree_value,
-            "institution": institution_value,
-            "school": institution_value,
-            "university": institution_value,
-            "field": field_value,
-            "field_of_study": field_value,
-            "major": field_value,
+            "degree": self.degree,
+            "institution": self.institution,
+            "field": self.field,
             "year": year_value,
-            "graduation_year": year_value,
             "start_date": self.start_date,
             "end_date": self.end_date,
-            "gpa": gpa_value,
-            "cgpa": self.cgpa,
+            "gpa": self.gpa or self.percentage,
             "percentage": self.percentage,
             "location": self.location,
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class Project:
-    """Project entry with comprehensive field support."""
+    """Project entry."""
     name: str = ""
-    title: str = ""  # Alias
-    project_name: str = ""  # Alias
     description: str = ""
-    summary: str = ""  # Alias
-    details: str = ""  # Alias
     technologies: List[str] = field(default_factory=list)
-    tech_stack: List[str] = field(default_factory=list)  # Alias
-    tools: List[str] = field(default_factory=list)  # Alias
     url: str = ""
-    link: str = ""  # Alias
-    project_url: str = ""  # Alias
     github: str = ""
-    repository: str = ""  # Alias
     duration: str = ""
     role: str = ""
     team_size: str = ""
     highlights: List[str] = field(default_factory=list)
     
     def to_dict(self) -> dict:
-        """Convert to dictionary with normalized field names."""
-        name_value = self.name or self.title or self.project_name
-        description_value = self.description or self.summary or self.details
-        
-        # Merge all technology-related lists
-        all_techs = list(set(
-            self.technologies + self.tech_stack + self.tools
-        ))
-        
-        url_value = self.url or self.link or self.project_url or self.github or self.repository
+        """Convert to a compact dictionary (canonical keys only)."""
+        description_value = self.description
         
         # Add highlights to description if present
         if self.highlights:
             description_value += "\n" + "\n".join(f"• {h}" for h in self.highlights)
         
         return {
-            "name": name_value,
-            "title": name_value,
+            "name": self.name,
             "description": description_value.strip(),
-            "summary": description_value.strip(),
-            "technologies": all_techs,
-            "tech_stack": all_techs,
-            "tools": all_techs,
-            "url": url_value,
-            "link": url_value,
+            "technologies": list(dict.fromkeys(self.technologies)),
+            "url": self.url or self.github,
             "github": self.github,
-            "repository": self.repository,
             "duration": self.duration,
             "role": self.role,
             "team_size": self.team_size,
@@ -185,121 +462,90 @@ class Project:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class Certification:
-    """Certification entry with comprehensive field support."""
+    """Certification entry."""
     name: str = ""
-    title: str = ""  # Alias
-    certification_name: str = ""  # Alias
     issuer: str = ""
-    organization: str = ""  # Alias
-    issued_by: str = ""  # Alias
-    provider: str = ""  # Alias
     date: str = ""
-    issue_date: str = ""  # Alias
-    issued_date: str = ""  # Alias
-    year: str = ""  # Alias
-    issued: str = ""  # Alias
     expiry_date: str = ""
     credential_id: str = ""
     credential_url: str = ""
     
     def to_dict(self) -> dict:
-        """Convert to dictionary with normalized field names."""
-        name_value = self.name or self.title or self.certification_name
-        issuer_value = self.issuer or self.organization or self.issued_by or self.provider
-        date_value = self.date or self.issue_date or self.issued_date or self.year or self.issued
-        
+        """Convert to a compact dictionary (canonical keys only)."""
         return {
-            "name": name_value,
-            "title": name_value,
-            "issuer": issuer_value,
-            "organization": issuer_value,
-            "date": date_value,
-            "issue_date": date_value,
-            "year": date_value,
+            "name": self.name,
+            "issuer": self.issuer,
+            "date": self.date,
             "expiry_date": self.expiry_date,
             "credential_id": self.credential_id,
             "credential_url": self.credential_url,
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class ParsedResume:
-    """Comprehensive structured representation of a parsed resume."""
+    """Structured representation of a parsed resume."""
     
     raw_text: str
     name: str = ""
-    full_name: str = ""  # Alias
     first_name: str = ""
     last_name: str = ""
     email: str = ""
-    email_address: str = ""  # Alias
     phone: str = ""
-    phone_number: str = ""  # Alias
-    mobile: str = ""  # Alias
-    contact: str = ""  # Alias
     location: str = ""
-    address: str = ""  # Alias
     city: str = ""
     state: str = ""
     country: str = ""
     summary: str = ""
-    objective: str = ""  # Alias
-    profile: str = ""  # Alias
-    about: str = ""  # Alias
     skills: List[str] = field(default_factory=list)
-    technical_skills: List[str] = field(default_factory=list)
     soft_skills: List[str] = field(default_factory=list)
     experience: List[Experience] = field(default_factory=list)
-    work_experience: List[Experience] = field(default_factory=list)  # Alias
     education: List[Education] = field(default_factory=list)
-    academic: List[Education] = field(default_factory=list)  # Alias
     projects: List[Project] = field(default_factory=list)
     certifications: List[Certification] = field(default_factory=list)
-    licenses: List[Certification] = field(default_factory=list)  # Alias
     linkedin: str = ""
-    linkedin_url: str = ""  # Alias
     github: str = ""
-    github_url: str = ""  # Alias
     portfolio: str = ""
-    portfolio_url: str = ""  # Alias
-    website: str = ""  # Alias
     languages: List[str] = field(default_factory=list)
     awards: List[str] = field(default_factory=list)
     publications: List[str] = field(default_factory=list)
     volunteer: List[str] = field(default_factory=list)
+    partial_sections: List[str] = field(default_factory=list)
+    section_fingerprints: Dict[str, str] = field(default_factory=dict)
+    # Serialized entries carried over unchanged from a previous parse
+    reused_sections: Dict[str, list] = field(default_factory=dict)
     
     def to_dict(self) -> dict:
-        """Convert to dictionary with all fields and aliases."""
-        # Merge experience lists
-        all_experience = self.experience + self.work_experience
+        """
+        Convert to the compact (v2) dictionary.
+        
+        Every value appears once under its canonical key; wrap the result
+        in ResumeView for code that still reads the legacy alias keys.
+        """
         # Remove duplicates based on company and title
         seen_exp = set()
         unique_experience = []
-        for exp in all_experience:
-            key = (exp.company or exp.organization, exp.title or exp.position)
+        for exp in self.experience:
+            key = (exp.company, exp.title)
             if key not in seen_exp and key != ("", ""):
                 seen_exp.add(key)
                 unique_experience.append(exp)
         
-        # Merge education lists
-        all_education = self.education + self.academic
         seen_edu = set()
         unique_education = []
-        for edu in all_education:
-            key = (edu.institution or edu.school, edu.degree)
+        for edu in self.education:
+            key = (edu.institution, edu.degree)
             if key not in seen_edu and key != ("", ""):
                 seen_edu.add(key)
                 unique_education.append(edu)
         
-        # Merge certifications
-        all_certs = self.certifications + self.licenses
         seen_certs = set()
         unique_certs = []
-        for cert in all_certs:
+        for cert in self.certifications:
             if isinstance(cert, Certification):
-                key = (cert.name or cert.title, cert.issuer)
+                key = (cert.name, cert.issuer)
                 if key not in seen_certs and key != ("", ""):
                     seen_certs.add(key)
                     unique_certs.append(cert)
@@ -307,79 +553,186 @@ class ParsedResume:
                 seen_certs.add(cert)
                 unique_certs.append(cert)
         
-        # Merge all skills
-        all_skills = list(set(
-            self.skills + self.technical_skills + self.soft_skills
-        ))
-        
-        # Normalize contact info
-        email_value = self.email or self.email_address
-        phone_value = self.phone or self.phone_number or self.mobile or self.contact
-        location_value = self.location or self.address
+        location_value = self.location
         if self.city or self.state or self.country:
             location_parts = [p for p in [self.city, self.state, self.country] if p]
             location_value = location_value or ", ".join(location_parts)
         
-        summary_value = self.summary or self.objective or self.profile or self.about
-        
-        linkedin_value = self.linkedin or self.linkedin_url
-        github_value = self.github or self.github_url
-        portfolio_value = self.portfolio or self.portfolio_url or self.website
-        
-        return {
-            "name": self.name or self.full_name,
-            "full_name": self.name or self.full_name,
+        result = {
+            "name": self.name,
             "first_name": self.first_name,
             "last_name": self.last_name,
-            "email": email_value,
-            "email_address": email_value,
-            "phone": phone_value,
-            "phone_number": phone_value,
-            "mobile": phone_value,
+            "email": self.email,
+            "phone": self.phone,
             "location": location_value,
-            "address": location_value,
             "city": self.city,
             "state": self.state,
             "country": self.country,
-            "summary": summary_value,
-            "objective": summary_value,
-            "skills": all_skills,
-            "technical_skills": self.technical_skills,
+            "summary": self.summary,
+            "skills": list(dict.fromkeys(self.skills + self.soft_skills)),
             "soft_skills": self.soft_skills,
             "experience": [e.to_dict() for e in unique_experience],
-            "work_experience": [e.to_dict() for e in unique_experience],
             "education": [e.to_dict() for e in unique_education],
-            "academic": [e.to_dict() for e in unique_education],
             "projects": [p.to_dict() for p in self.projects],
             "certifications": [c.to_dict() if isinstance(c, Certification) else {"name": c, "issuer": "", "date": ""} for c in unique_certs],
-            "licenses": [c.to_dict() if isinstance(c, Certification) else {"name": c, "issuer": "", "date": ""} for c in unique_certs],
-            "linkedin": linkedin_value,
-            "linkedin_url": linkedin_value,
-            "linkedinUrl": linkedin_value,  # Frontend format
-            "github": github_value,
-            "github_url": github_value,
-            "githubUrl": github_value,  # Frontend format
-            "portfolio": portfolio_value,
-            "portfolio_url": portfolio_value,
-            "portfolioUrl": portfolio_value,  # Frontend format
-            "website": portfolio_value,
+            "linkedin": self.linkedin,
+            "github": self.github,
+            "portfolio": self.portfolio,
             "languages": self.languages,
             "awards": self.awards,
             "publications": self.publications,
             "volunteer": self.volunteer,
+            "partial": bool(self.partial_sections),
+            "partial_sections": self.partial_sections,
+            "section_fingerprints": self.section_fingerprints,
         }
+        result.update(self.reused_sections)
+        return result
+
+
+# Legacy (v1) keys served by ResumeView. A string maps the alias to its
+# canonical key; a callable derives the value from the compact entry.
+RESUME_ALIASES = {
+    "full_name": "name",
+    "email_address": "email",
+    "phone_number": "phone",
+    "mobile": "phone",
+    "address": "location",
+    "objective": "summary",
+    "technical_skills": "skills",
+    "work_experience": "experience",
+    "academic": "education",
+    "licenses": "certifications",
+    "linkedin_url": "linkedin",
+    "linkedinUrl": "linkedin",  # Frontend format
+    "github_url": "github",
+    "githubUrl": "github",  # Frontend format
+    "portfolio_url": "portfolio",
+    "portfolioUrl": "portfolio",  # Frontend format
+    "website": "portfolio",
+}
+
+ENTRY_ALIASES = {
+    "experience": {
+        "position": "title",
+        "organization": "company",
+    },
+    "education": {
+        "qualification": "degree",
+        "school": "institution",
+        "university": "institution",
+        "field_of_study": "field",
+        "major": "field",
+        "graduation_year": "year",
+        # cgpa only ever held a GPA, never a percentage
+        "cgpa": lambda entry: "" if entry.get("percentage") else entry.get("gpa", ""),
+    },
+    "projects": {
+        "title": "name",
+        "summary": "description",
+        "tech_stack": "technologies",
+        "tools": "technologies",
+        "link": "url",
+        "repository": "github",
+    },
+    "certifications": {
+        "title": "name",
+        "organization": "issuer",
+        "issue_date": "date",
+        "year": "date",
+    },
+}
+
+
+class ResumeView(Mapping):
+    """
+    Read-only view of a compact parse result that also answers legacy keys.
+    
+    Alias keys (``work_experience``, ``linkedinUrl``, ``position``, ...) are
+    resolved on access instead of being stored, and entry lists are wrapped
+    the first time they are read. Use to_dict() when a plain dictionary with
+    every legacy key is needed (e.g. for JSON).
+    """
+    
+    __slots__ = ("_data", "_aliases", "_entry_aliases", "_wrapped")
+    
+    def __init__(self, data: dict, aliases: Optional[dict] = None, entry_aliases: Optional[dict] = None):
+        self._data = data
+        self._aliases = RESUME_ALIASES if aliases is None else aliases
+        self._entry_aliases = ENTRY_ALIASES if entry_aliases is None else entry_aliases
+        self._wrapped: Dict[str, list] = {}
+    
+    def _resolve(self, key: str):
+        alias = self._aliases.get(key)
+        if alias is None:
+            return key, self._data[key]
+        if callable(alias):
+            return key, alias(self._data)
+        return alias, self._data[alias]
+    
+    def __getitem__(self, key: str):
+        canonical, value = self._resolve(key)
+        entry_aliases = self._entry_aliases.get(canonical)
+        if entry_aliases is None or not isinstance(value, list):
+            return value
+        
+        wrapped = self._wrapped.get(canonical)
+        if wrapped is None:
+            wrapped = [
+                ResumeView(entry, entry_aliases, {}) if isinstance(entry, dict) else entry
+                for entry in value
+            ]
+            self._wrapped[canonical] = wrapped
+        return wrapped
+    
+    def __iter__(self) -> Iterator[str]:
+        yield from self._data
+        for alias, target in self._aliases.items():
+            if alias not in self._data and (callable(target) or target in self._data):
+                yield alias
+    
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+    
+    def __contains__(self, key) -> bool:
+        if key in self._data:
+            return True
+        target = self._aliases.get(key)
+        return target is not None and (callable(target) or target in self._data)
+    
+    def to_dict(self) -> dict:
+        """Materialize every canonical and legacy key as a plain dictionary."""
+        result = {}
+        for key in self:
+            value = self[key]
+            if isinstance(value, list):
+                value = [v.to_dict() if isinstance(v, ResumeView) else v for v in value]
+            result[key] = value
+        return result
+
+
+class SectionBudgetExceeded(Exception):
+    """Raised by a section parser that ran past its deadline."""
+    
+    def __init__(self, partial: list):
+        super().__init__("section time budget exceeded")
+        self.partial = partial  # Entries parsed before the deadline
+
+
+def _check_deadline(deadline: Optional[float], partial: list) -> None:
+    """Abort the current section parser once its deadline has passed."""
+    if deadline is not None and time.perf_counter() > deadline:
+        raise SectionBudgetExceeded(partial)
 
 
 def extract_email(text: str) -> str:
     """Extract email address from text with multiple patterns."""
-    patterns = [
-        r"\b[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}\b",
-        r"[Ee]mail\s*:\s*([a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})",
-        r"[Ee]-?mail\s*:\s*([a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})",
-    ]
+    # Every pattern needs an "@"; without one, skip scanning each line from every offset
+    if "@" not in text:
+        return ""
     
-    for pattern in patterns:
-        matches = re.findall(pattern, text)
+    for pattern in EMAIL_PATTERNS:
+        matches = pattern.findall(text)
         for email in matches:
             # Skip generic/placeholder emails
             if not any(skip in email.lower() for skip in ['example.com', 'test.com', 'email.com', 'sample.com']):
@@ -390,22 +743,12 @@ def extract_email(text: str) -> str:
 
 def extract_phone(text: str) -> str:
     """Extract phone number from text with comprehensive patterns."""
-    patterns = [
-        r"\+91[-\s]?\d{10}",  # Indian format with +91
-        r"\+91[-\s]?\d{5}[-\s]?\d{5}",  # Indian format with space
-        r"\+1[-\s]?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}",  # US format
-        r"\+\d{1,3}[-.\s]?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}",  # International
-        r"\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}",  # Standard format
-        r"\d{10}",  # Simple 10-digit
-        r"\d{3}[-.\s]\d{3}[-.\s]\d{4}",  # Formatted
-    ]
-    
-    for pattern in patterns:
-        match = re.search(pattern, text)
+    for pattern in PHONE_PATTERNS:
+        match = pattern.search(text)
         if match:
             phone = match.group(0)
             # Validate it looks like a phone number
-            digits = re.sub(r'\D', '', phone)
+            digits = NON_DIGIT_RE.sub('', phone)
             if 10 <= len(digits) <= 15:
                 return phone
     
@@ -418,11 +761,11 @@ def extract_name(text: str) -> str:
     
     for i, line in enumerate(lines[:10]):  # Check first 10 lines
         # Skip common header keywords
-        if re.search(r"(resume|curriculum vitae|cv|portfolio|profile)", line, re.IGNORECASE):
+        if NAME_HEADER_SKIP_RE.search(line):
             continue
         
         # Skip lines with contact info patterns
-        if re.search(r"[@+\(\)\d]|email|phone|linkedin|github", line, re.IGNORECASE):
+        if NAME_CONTACT_SKIP_RE.search(line):
             continue
         
         # Skip lines that are too short or too long
@@ -430,7 +773,7 @@ def extract_name(text: str) -> str:
             continue
         
         # Skip lines with special characters or numbers
-        if re.search(r"[#$%^&*(){}[\]\\|<>]|\d{2,}", line):
+        if NAME_SPECIAL_SKIP_RE.search(line):
             continue
         
         # Look for name pattern: 2-4 capitalized words
@@ -439,7 +782,7 @@ def extract_name(text: str) -> str:
             # Check if words look like names (capitalized, mostly letters)
             if all(
                 word[0].isupper() and 
-                len(re.sub(r'[^a-zA-Z]', '', word)) >= 2
+                len(NON_ALPHA_RE.sub('', word)) >= 2
                 for word in words if word
             ):
                 return line
@@ -476,14 +819,8 @@ def extract_location(text: str) -> Dict[str, str]:
     }
     
     # Look for location patterns
-    patterns = [
-        r"(?:Location|Address|City)\s*:\s*([^\n]+)",
-        r"\b([A-Z][a-z]+),\s*([A-Z]{2})\s*\d{5}\b",  # City, State ZIP
-        r"\b([A-Z][a-z]+),\s*([A-Z][a-z]+),\s*([A-Z][a-z]+)\b",  # City, State, Country
-    ]
-    
-    for pattern in patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
+    for pattern in LOCATION_PATTERNS:
+        match = pattern.search(text)
         if match:
             location_info["full"] = match.group(0)
             break
@@ -504,13 +841,8 @@ def extract_links(text: str) -> Dict[str, str]:
     }
 
     # LinkedIn patterns
-    linkedin_patterns = [
-        r"https?://(?:www\.)?linkedin\.com/in/[^\s<>\"\']+",
-        r"linkedin\.com/in/[^\s<>\"\']+",
-        r"(?:LinkedIn|Linkedin)\s*:\s*(https?://[^\s]+|[^\s]+linkedin[^\s]+)",
-    ]
-    for pattern in linkedin_patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
+    for pattern in LINKEDIN_PATTERNS:
+        match = pattern.search(text)
         if match:
             url = match.group(0) if match.group(0).startswith('http') else f"https://{match.group(0)}"
             links["linkedin"] = url
@@ -518,22 +850,16 @@ def extract_links(text: str) -> Dict[str, str]:
             break
 
     # GitHub patterns
-    github_patterns = [
-        r"https?://(?:www\.)?github\.com/[^\s<>\"\']+",
-        r"github\.com/[^\s<>\"\']+",
-        r"(?:GitHub|Github)\s*:\s*(https?://[^\s]+|[^\s]+github[^\s]+)",
-    ]
-    for pattern in github_patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
+    for pattern in GITHUB_PATTERNS:
+        match = pattern.search(text)
         if match:
             url = match.group(0) if match.group(0).startswith('http') else f"https://{match.group(0)}"
             links["github"] = url
             links["github_url"] = url
             break
 
-    # Portfolio/Website - comprehensive TLD list
-    portfolio_pattern = r"https?://[a-zA-Z0-9.-]+\.(?:dev|app|com|in|io|net|org|xyz|co|me|tech|online|site|vercel\.app|github\.io|netlify\.app|herokuapp\.com|web\.app|firebaseapp\.com|repl\.co|glitch\.me|now\.sh|surge\.sh)(?:/[^\s<>\"\']*)?(?=\s|$|<|>|\"|\|)"
-    all_urls = re.findall(portfolio_pattern, text, re.IGNORECASE)
+    # Portfolio/Website
+    all_urls = PORTFOLIO_RE.findall(text)
     
     for url in all_urls:
         url_lower = url.lower()
@@ -547,69 +873,56 @@ def extract_links(text: str) -> Dict[str, str]:
     return links
 
 
-def extract_skills_section(text: str) -> List[str]:
+def find_skills_text(text: str) -> str:
+    """Return the raw skills block extract_skills_section() parses."""
+    for pattern in SKILLS_SECTION_PATTERNS:
+        match = pattern.search(text)
+        if match:
+            return match.group(1)
+    return ""
+
+
+def extract_skills_section(
+    text: str,
+    deadline: Optional[float] = None,
+    skills_text: Optional[str] = None,
+) -> List[str]:
     """Extract skills with improved pattern matching and cleaning."""
     skills = []
     
-    # Multiple section header patterns
-    section_patterns = [
-        r"(?:technical\s+)?(?:skills?|competencies|expertise|technologies)\s*[:\-]?\s*\n?(.*?)(?=\n\s*(?:experience|education|projects?|certifications?|work\s+history|employment|academic|background|awards?|languages?|interests?)\s*[:\-]?\s*\n|\Z)",
-        r"(?:skills?\s+and\s+)?(?:abilities|proficiencies)\s*[:\-]?\s*\n?(.*?)(?=\n\s*(?:experience|education|projects?)\s*[:\-]?\s*\n|\Z)",
-    ]
-    
-    skills_text = ""
-    for pattern in section_patterns:
-        match = re.search(pattern, text, re.IGNORECASE | re.DOTALL)
-        if match:
-            skills_text = match.group(1)
-            break
+    if skills_text is None:
+        skills_text = find_skills_text(text)
     
     if not skills_text:
         return skills
     
     # Remove subsection headers
-    subsection_headers = [
-        r"(?:AI\s*&\s*ML|Machine\s+Learning|Deep\s+Learning)",
-        r"(?:Languages?\s*(?:&|and)?\s*Frameworks?|Programming\s+Languages?)",
-        r"(?:Tools?\s*(?:&|and)?\s*(?:Data|Technologies|Platforms))",
-        r"(?:Computer\s+Vision|Natural\s+Language\s+Processing|NLP)",
-        r"(?:Web\s+Development|Frontend|Backend|Full[-\s]?Stack)",
-        r"(?:Database|Data\s+Management|Cloud|DevOps)",
-        r"(?:Soft\s+Skills?|Professional\s+Skills?|Core\s+Competencies)",
-        r"(?:Technical|Programming|Development)",
-    ]
-    
-    for header in subsection_headers:
-        skills_text = re.sub(f"{header}\\s*:", ",", skills_text, flags=re.IGNORECASE)
+    skills_text = SKILLS_SUBSECTION_RE.sub(",", skills_text)
     
     # Split by various delimiters
-    raw_skills = re.split(r"[,|•·\n]", skills_text)
+    raw_skills = SKILL_DELIMITER_RE.split(skills_text)
     
     seen = set()
     for skill in raw_skills:
+        _check_deadline(deadline, skills)
+        
         # Clean up skill text
         skill = skill.strip()
-        skill = re.sub(r"^[-•·\-\*\+\s\d\.]+", "", skill)  # Remove leading bullets/numbers
-        skill = re.sub(r"[-•·\-\*\+\s]+$", "", skill)  # Remove trailing bullets
-        skill = re.sub(r"\([^)]*\)", "", skill)  # Remove parenthetical info
-        skill = re.sub(r"\.$", "", skill)  # Remove trailing periods
+        skill = SKILL_LEADING_RE.sub("", skill)  # Remove leading bullets/numbers
+        skill = SKILL_TRAILING_RE.sub("", skill)  # Remove trailing bullets
+        skill = PARENTHETICAL_RE.sub("", skill)  # Remove parenthetical info
+        skill = TRAILING_PERIOD_RE.sub("", skill)  # Remove trailing periods
         skill = " ".join(skill.split())  # Clean whitespace
         
         # Validation criteria
-        skip_words = {
-            'and', 'or', 'the', 'a', 'an', 'in', 'at', 'to', 'for', 'with', 
-            'of', 'on', 'as', 'by', 'from', 'into', 'about', 'like', 'through',
-            'over', 'before', 'between', 'under', 'during', 'including',
-        }
-        
         if (skill and 
             2 <= len(skill) <= 80 and
             skill.lower() not in seen and
-            skill.lower() not in skip_words and
-            not re.match(r'^\d+$', skill) and  # Skip pure numbers
-            not re.match(r'^[:\-\.\,\;\(\)]+$', skill) and  # Skip pure punctuation
+            skill.lower() not in SKILL_SKIP_WORDS and
+            not DIGITS_ONLY_RE.match(skill) and  # Skip pure numbers
+            not PUNCTUATION_ONLY_RE.match(skill) and  # Skip pure punctuation
             not skill.lower().startswith(('http', 'www')) and  # Skip URLs
-            len(re.sub(r'[^a-zA-Z]', '', skill)) >= 2):  # At least 2 letters
+            len(NON_ALPHA_RE.sub('', skill)) >= 2):  # At least 2 letters
             seen.add(skill.lower())
             skills.append(skill)
     
@@ -618,19 +931,8 @@ def extract_skills_section(text: str) -> List[str]:
 
 def extract_section(text: str, section_pattern: str) -> str:
     """Extract content of a named section with improved pattern matching."""
-    # Common section names that mark the end of current section
-    end_sections = [
-        "experience", "education", "technical\\s+skills?", "skills?", 
-        "projects?", "certifications?", "summary", "objective", 
-        "professional\\s+experience", "work\\s+history", "employment",
-        "academic", "background", "awards?", "achievements?", "languages?",
-        "publications?", "volunteer", "interests?", "hobbies", "references?"
-    ]
-    
-    end_pattern = "|".join(end_sections)
-    
     # Try with markdown headers (###)
-    pattern = rf"(?:^|\n)\s*(?:###\s*)?{section_pattern}\s*[:\-]?\s*\n(.*?)(?=\n\s*(?:###\s*)?(?:{end_pattern})\s*[:\-]?\s*\n|\Z)"
+    pattern = rf"(?:^|\n)\s*(?:###\s*)?{section_pattern}\s*[:\-]?\s*\n(.*?)(?=\n\s*(?:###\s*)?(?:{END_SECTIONS_PATTERN})\s*[:\-]?\s*\n|\Z)"
     
     match = re.search(pattern, text, re.IGNORECASE | re.DOTALL | re.MULTILINE)
     if match:
@@ -639,30 +941,91 @@ def extract_section(text: str, section_pattern: str) -> str:
     return ""
 
 
-def parse_experience_section(text: str) -> List[Experience]:
+def segment_sections(text: str) -> Dict[str, str]:
+    """
+    Split resume text into its known sections in a single pass.
+    
+    Locates every header line once and slices each section body out of the
+    text, returning the same content extract_section() would return for the
+    patterns in SECTION_HEADERS.
+    
+    Args:
+        text: Raw resume text
+        
+    Returns:
+        Dict mapping section name (SECTION_HEADERS key) to section body.
+        Sections that are absent are omitted.
+    """
+    lines = text.split("\n")
+    # A header needs a line break after it, so the last line never qualifies
+    last = len(lines) - 1
+    
+    starts: Dict[str, int] = {}
+    end_lines: List[int] = []
+    for idx in range(last):
+        stripped = lines[idx].strip()
+        if not stripped or len(stripped) > MAX_HEADER_LENGTH:
+            continue
+        if not ANY_HEADER_LINE_RE.fullmatch(stripped):
+            continue
+        name = HEADER_LINE_RE.fullmatch(stripped).group("name")
+        if END_HEADER_RE.fullmatch(name):
+            end_lines.append(idx)
+        for key, header_re in SECTION_HEADER_RES.items():
+            if key not in starts and header_re.fullmatch(name):
+                starts[key] = idx
+    
+    sections: Dict[str, str] = {}
+    for key, header_idx in starts.items():
+        # Body begins at the first non-blank line after the header; that line
+        # is never treated as the end of the section, even if it is a header.
+        first = header_idx + 1
+        while first <= last and not lines[first].strip():
+            first += 1
+        if first > last:
+            continue
+        end = next((i for i in end_lines if i > first), last + 1)
+        body = "\n".join(lines[first:end]).strip()
+        if body:
+            sections[key] = body
+    
+    return sections
+
+
+def _section(text: str, sections: Optional[Dict[str, str]], keys: List[str]) -> str:
+    """Return the first non-empty section for keys, segmenting text if needed."""
+    if sections is None:
+        sections = segment_sections(text)
+    for key in keys:
+        if sections.get(key):
+            return sections[key]
+    return ""
+
+
+def parse_experience_section(
+    text: str,
+    sections: Optional[Dict[str, str]] = None,
+    deadline: Optional[float] = None,
+) -> List[Experience]:
     """Parse experience section with comprehensive field extraction."""
     experiences = []
-    section = extract_section(text, r"(?:work\s+)?(?:experience|employment|work\s+history|professional\s+experience)")
+    section = _section(text, sections, SECTION_KEYS["experience"])
     
     if not section:
         return experiences
     
     # Split by patterns that typically indicate new job entry
     # Look for capitalized titles followed by company indicators
-    split_patterns = [
-        r"\n(?=[A-Z][^a-z\n]{5,80}(?:\n|$))",  # All caps title
-        r"\n(?=[A-Z][^\n]{10,80}(?:\||at|@|·|•|-{2,})[^\n]+)",  # Title with separator and company
-        r"\n(?=\d{4}\s*[-–]\s*(?:\d{4}|Present|Current))",  # Starting with date range
-    ]
-    
     entries = [section]
-    for pattern in split_patterns:
+    for pattern in EXPERIENCE_SPLIT_RES:
+        _check_deadline(deadline, experiences)
         new_entries = []
         for entry in entries:
-            new_entries.extend(re.split(pattern, entry))
+            new_entries.extend(pattern.split(entry))
         entries = new_entries
     
     for entry in entries:
+        _check_deadline(deadline, experiences)
         entry = entry.strip()
         if len(entry) < 20:  # Too short to be a real experience
             continue
@@ -677,54 +1040,35 @@ def parse_experience_section(text: str) -> List[Experience]:
         first_line = lines[0]
         
         # Try various patterns for title | company
-        patterns = [
-            r"^(.+?)\s*[\|]\s*(.+?)$",  # Title | Company
-            r"^(.+?)\s+at\s+(.+?)$",  # Title at Company
-            r"^(.+?)\s*[@•·–-]\s*(.+?)$",  # Title @/•/· Company
-        ]
-        
         title_company_found = False
-        for pattern in patterns:
-            match = re.match(pattern, first_line, re.IGNORECASE)
+        for pattern in TITLE_COMPANY_RES:
+            match = pattern.match(first_line)
             if match:
                 exp.title = match.group(1).strip()
-                exp.position = exp.title
                 exp.company = match.group(2).strip()
-                exp.organization = exp.company
-                exp.employer = exp.company
                 title_company_found = True
                 break
         
         if not title_company_found:
             exp.title = first_line.strip()
-            exp.position = exp.title
             # Try to find company in second line
             if len(lines) > 1:
                 second_line = lines[1].strip()
                 # If second line doesn't look like a date, it might be company
-                if not re.search(r"\d{4}", second_line):
+                if not YEAR_RE.search(second_line):
                     exp.company = second_line
-                    exp.organization = exp.company
         
         # Look for duration/dates anywhere in the entry
-        duration_patterns = [
-            r"(\w+\s+\d{4})\s*[-–]\s*(\w+\s+\d{4}|present|current)",
-            r"(\d{1,2}/\d{4})\s*[-–]\s*(\d{1,2}/\d{4}|present|current)",
-            r"(\d{4})\s*[-–]\s*(\d{4}|present|current)",
-        ]
-        
-        for pattern in duration_patterns:
-            match = re.search(pattern, entry, re.IGNORECASE)
+        for pattern in EXPERIENCE_DURATION_RES:
+            match = pattern.search(entry)
             if match:
                 exp.start_date = match.group(1)
                 exp.end_date = match.group(2)
                 exp.duration = f"{exp.start_date} - {exp.end_date}"
-                exp.period = exp.duration
-                exp.dates = exp.duration
                 break
         
         # Look for location
-        location_match = re.search(r"(?:Location|City)\s*:\s*([^\n]+)", entry, re.IGNORECASE)
+        location_match = ENTRY_LOCATION_RE.search(entry)
         if location_match:
             exp.location = location_match.group(1).strip()
         
@@ -736,14 +1080,14 @@ def parse_experience_section(text: str) -> List[Experience]:
             line = line.strip()
             
             # Skip if it's just the duration or company line
-            if re.search(r"^\d{4}|^(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)", line, re.IGNORECASE):
+            if DATE_LINE_RE.search(line):
                 continue
             if line == exp.company:
                 continue
             
             # Check if it's a bullet point
-            if re.match(r"^[•\-\*\+]", line) or line.startswith("- "):
-                bullet = re.sub(r"^[•\-\*\+]\s*", "", line)
+            if BULLET_START_RE.match(line) or line.startswith("- "):
+                bullet = BULLET_PREFIX_RE.sub("", line)
                 bullets.append(bullet)
                 exp.responsibilities.append(bullet)
             else:
@@ -759,23 +1103,27 @@ def parse_experience_section(text: str) -> List[Experience]:
     return experiences
 
 
-def parse_education_section(text: str) -> List[Education]:
+def parse_education_section(
+    text: str,
+    sections: Optional[Dict[str, str]] = None,
+    deadline: Optional[float] = None,
+) -> List[Education]:
     """Parse education section with comprehensive field extraction."""
     education_list = []
-    section = extract_section(text, "education")
+    section = _section(text, sections, SECTION_KEYS["education"])
     
     if not section:
         return education_list
     
     # Split by degree patterns or institution patterns
-    entries = re.split(r"\n(?=[A-Z][^\n]{10,}(?:University|College|Institute|School|Academy))", section)
+    entries = EDUCATION_INSTITUTION_SPLIT_RE.split(section)
     
     # If that didn't work, try splitting by degree keywords
     if len(entries) <= 1:
-        degree_pattern = r"\n(?=(?:Bachelor|Master|PhD|Ph\.D|B\.Tech|M\.Tech|B\.S\.|M\.S\.|B\.A\.|M\.A\.|Associate|Diploma))"
-        entries = re.split(degree_pattern, section, flags=re.IGNORECASE)
+        entries = EDUCATION_DEGREE_SPLIT_RE.split(section)
     
     for entry in entries:
+        _check_deadline(deadline, education_list)
         entry = entry.strip()
         if len(entry) < 10:
             continue
@@ -784,57 +1132,31 @@ def parse_education_section(text: str) -> List[Education]:
         lines = [l.strip() for l in entry.split('\n') if l.strip()]
         
         # Extract degree
-        degree_patterns = [
-            r"(Bachelor.*?(?:of|in|degree)|B\.?(?:Tech|S|A|Sc)\.?.*)",
-            r"(Master.*?(?:of|in|degree)|M\.?(?:Tech|S|A|Sc)\.?.*)",
-            r"((?:PhD|Ph\.D|Doctorate).*)",
-            r"(Associate.*?(?:of|in|degree))",
-            r"(Diploma.*)",
-        ]
-        
-        for pattern in degree_patterns:
-            match = re.search(pattern, entry, re.IGNORECASE)
+        for pattern in DEGREE_RES:
+            match = pattern.search(entry)
             if match:
                 edu.degree = match.group(1).strip()
-                edu.qualification = edu.degree
                 break
         
         # Extract institution
-        institution_keywords = ["University", "College", "Institute", "School", "Academy", "Polytechnic"]
         for line in lines:
-            if any(keyword in line for keyword in institution_keywords):
+            if any(keyword in line for keyword in INSTITUTION_KEYWORDS):
                 edu.institution = line[:150]
-                edu.school = edu.institution
-                edu.university = edu.institution
-                edu.college = edu.institution
                 break
         
         # Extract field of study
-        field_patterns = [
-            r"(?:in|of)\s+([A-Z][^\n,]{10,60})",
-            r"(?:Major|Specialization|Focus|Field|Stream)\s*:\s*([^\n]+)",
-        ]
-        for pattern in field_patterns:
-            match = re.search(pattern, entry, re.IGNORECASE)
+        for pattern in FIELD_OF_STUDY_RES:
+            match = pattern.search(entry)
             if match:
                 field = match.group(1).strip()
                 # Clean up common suffixes
-                field = re.sub(r"\s*\(.*?\).*$", "", field)
+                field = FIELD_SUFFIX_RE.sub("", field)
                 edu.field = field
-                edu.field_of_study = field
-                edu.major = field
-                edu.specialization = field
-                edu.stream = field
                 break
         
         # Extract year/date range
-        year_patterns = [
-            r"(20\d{2})\s*[-–]\s*(20\d{2}|present|current|expected)",
-            r"(?:Class\s+of|Graduated)\s*:?\s*(20\d{2})",
-            r"\b(20\d{2})\b",
-        ]
-        for pattern in year_patterns:
-            match = re.search(pattern, entry, re.IGNORECASE)
+        for pattern in EDUCATION_YEAR_RES:
+            match = pattern.search(entry)
             if match:
                 if match.lastindex == 2:
                     edu.start_date = match.group(1)
@@ -842,27 +1164,20 @@ def parse_education_section(text: str) -> List[Education]:
                     edu.year = f"{edu.start_date} - {edu.end_date}"
                 else:
                     edu.year = match.group(1)
-                edu.graduation_year = edu.year
                 break
         
         # Extract GPA/CGPA/Percentage
-        gpa_patterns = [
-            r"(?:GPA|CGPA)\s*:?\s*(\d+\.?\d*)\s*(?:/\s*(\d+\.?\d*))?",
-            r"(?:Grade|Score)\s*:?\s*(\d+\.?\d*)%",
-            r"(\d+\.?\d*)%",
-        ]
-        for pattern in gpa_patterns:
-            match = re.search(pattern, entry, re.IGNORECASE)
+        for pattern, is_gpa in GPA_RES:
+            match = pattern.search(entry)
             if match:
-                if 'cgpa' in pattern.lower() or 'gpa' in pattern.lower():
+                if is_gpa:
                     edu.gpa = match.group(1)
-                    edu.cgpa = match.group(1)
                 else:
                     edu.percentage = match.group(1)
                 break
         
         # Extract location
-        location_match = re.search(r",\s*([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s*$", entry)
+        location_match = EDUCATION_LOCATION_RE.search(entry)
         if location_match:
             edu.location = location_match.group(1)
         
@@ -873,18 +1188,23 @@ def parse_education_section(text: str) -> List[Education]:
     return education_list
 
 
-def parse_projects_section(text: str) -> List[Project]:
+def parse_projects_section(
+    text: str,
+    sections: Optional[Dict[str, str]] = None,
+    deadline: Optional[float] = None,
+) -> List[Project]:
     """Parse projects section with comprehensive field extraction."""
     projects = []
-    section = extract_section(text, "projects?")
+    section = _section(text, sections, SECTION_KEYS["projects"])
     
     if not section:
         return projects
     
     # Split by project headers
-    entries = re.split(r"\n(?=[A-Z][^\n]{5,100}(?:\n|$))", section)
+    entries = PROJECT_SPLIT_RE.split(section)
     
     for entry in entries:
+        _check_deadline(deadline, projects)
         entry = entry.strip()
         if len(entry) < 15:
             continue
@@ -899,58 +1219,43 @@ def parse_projects_section(text: str) -> List[Project]:
         first_line = lines[0]
         
         # Extract URL from name line if present
-        url_in_name = re.search(r"https?://[^\s]+", first_line)
+        url_in_name = URL_RE.search(first_line)
         if url_in_name:
             proj.url = url_in_name.group(0)
-            proj.link = proj.url
-            proj.project_url = proj.url
             first_line = first_line.replace(proj.url, "").strip()
         
         # Clean name
-        name = re.sub(r"[•\-–|]", " ", first_line)
-        name = re.sub(r"\s*(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{4}\s*[-–]\s*(?:Present|Current|(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{4})", "", name, flags=re.IGNORECASE)
+        name = PROJECT_NAME_SEPARATOR_RE.sub(" ", first_line)
+        name = PROJECT_NAME_DATES_RE.sub("", name)
         proj.name = " ".join(name.split()).strip()
-        proj.title = proj.name
-        proj.project_name = proj.name
         
         # Extract duration
-        duration_match = re.search(r"(\w+\s+\d{4})\s*[-–]\s*(\w+\s+\d{4}|Present|Current)", entry, re.IGNORECASE)
+        duration_match = PROJECT_DURATION_RE.search(entry)
         if duration_match:
             proj.duration = f"{duration_match.group(1)} - {duration_match.group(2)}"
         
         # Extract role
-        role_match = re.search(r"(?:Role|Position)\s*:\s*([^\n]+)", entry, re.IGNORECASE)
+        role_match = PROJECT_ROLE_RE.search(entry)
         if role_match:
             proj.role = role_match.group(1).strip()
         
         # Extract team size
-        team_match = re.search(r"(?:Team\s+Size)\s*:\s*(\d+)", entry, re.IGNORECASE)
+        team_match = PROJECT_TEAM_RE.search(entry)
         if team_match:
             proj.team_size = team_match.group(1)
         
         # Extract URLs
-        url_patterns = [
-            r"(?:GitHub|Repository|Repo|Source)\s*:\s*(https?://[^\s]+)",
-            r"(?:Live|Demo|Link|URL|Website)\s*:\s*(https?://[^\s]+)",
-            r"(https?://github\.com/[^\s]+)",
-            r"(https?://[^\s]+)",
-        ]
-        
-        for pattern in url_patterns:
-            match = re.search(pattern, entry, re.IGNORECASE)
+        for pattern in PROJECT_URL_RES:
+            match = pattern.search(entry)
             if match:
                 url = match.group(1)
                 if 'github' in url.lower():
                     proj.github = url
-                    proj.repository = url
                     if not proj.url:
                         proj.url = url
-                        proj.link = url
                 else:
                     if not proj.url:
                         proj.url = url
-                        proj.link = url
-                        proj.project_url = url
         
         # Extract bullet points and description
         bullets = []
@@ -962,8 +1267,8 @@ def parse_projects_section(text: str) -> List[Project]:
                 continue
             
             # Check for bullet points
-            if re.match(r"^[•\-\*\+]", line):
-                bullet = re.sub(r"^[•\-\*\+]\s*", "", line)
+            if BULLET_START_RE.match(line):
+                bullet = BULLET_PREFIX_RE.sub("", line)
                 bullets.append(bullet)
                 proj.highlights.append(bullet)
             else:
@@ -973,45 +1278,9 @@ def parse_projects_section(text: str) -> List[Project]:
         # Combine description
         all_text = " ".join(description_parts + bullets)
         proj.description = all_text[:600]
-        proj.summary = proj.description
-        proj.details = proj.description
-        
-        # Extract technologies
-        # Common tech keywords
-        tech_keywords = [
-            # Frontend
-            "React", "Next.js", "Vue", "Angular", "Svelte", "HTML", "CSS", 
-            "JavaScript", "TypeScript", "Tailwind", "Bootstrap", "SASS",
-            # Backend
-            "Node.js", "Express", "Django", "Flask", "FastAPI", "Spring", 
-            "Ruby on Rails", ".NET", "PHP", "Laravel",
-            # Databases
-            "PostgreSQL", "MySQL", "MongoDB", "Redis", "SQLite", "Oracle",
-            "DynamoDB", "Cassandra", "Prisma", "Supabase",
-            # Cloud/DevOps
-            "AWS", "Azure", "GCP", "Docker", "Kubernetes", "Jenkins", "CI/CD",
-            "Terraform", "Ansible", "Vercel", "Netlify", "Heroku",
-            # Languages
-            "Python", "Java", "C++", "C#", "Go", "Rust", "Ruby", "PHP", "Swift", "Kotlin",
-            # ML/AI
-            "TensorFlow", "PyTorch", "Keras", "scikit-learn", "OpenCV", 
-            "YOLO", "NumPy", "Pandas", "Matplotlib",
-            # Mobile
-            "React Native", "Flutter", "iOS", "Android", "Kotlin", "Swift",
-            # Other
-            "GraphQL", "REST", "API", "Git", "GitHub", "GitLab", "Firebase",
-            "JWT", "OAuth", "WebSocket", "Microservices",
-        ]
-        
-        entry_lower = entry.lower()
-        found_techs = []
-        for tech in tech_keywords:
-            if tech.lower() in entry_lower:
-                found_techs.append(tech)
-        
-        proj.technologies = list(set(found_techs))
-        proj.tech_stack = proj.technologies
-        proj.tools = proj.technologies
+        
+        # Extract technologies (whole words only, so "Go" no longer hits "Google")
+        proj.technologies = PROJECT_TECH_MATCHER.find_all(entry)
         
         # Only add if we have a name
         if proj.name:
@@ -1020,23 +1289,24 @@ def parse_projects_section(text: str) -> List[Project]:
     return projects
 
 
-def parse_certifications_section(text: str) -> List[Certification]:
+def parse_certifications_section(
+    text: str,
+    sections: Optional[Dict[str, str]] = None,
+    deadline: Optional[float] = None,
+) -> List[Certification]:
     """Parse certifications section with comprehensive field extraction."""
     certifications = []
     
-    section = None
-    for pattern in [r"certifications?", r"licenses?", r"credentials?", r"professional\s+development"]:
-        section = extract_section(text, pattern)
-        if section:
-            break
+    section = _section(text, sections, SECTION_KEYS["certifications"])
     
     if not section:
         return certifications
     
     # Split by common patterns
-    entries = re.split(r"\n(?=[A-Z•\-\*])", section)
+    entries = CERT_SPLIT_RE.split(section)
     
     for entry in entries:
+        _check_deadline(deadline, certifications)
         entry = entry.strip()
         if len(entry) < 5:
             continue
@@ -1044,7 +1314,7 @@ def parse_certifications_section(text: str) -> List[Certification]:
         cert = Certification()
         
         # Clean up bullet points
-        entry = re.sub(r"^[•\-\*\+\d\.]\s*", "", entry)
+        entry = CERT_BULLET_RE.sub("", entry)
         
         lines = [l.strip() for l in entry.split("\n") if l.strip()]
         if not lines:
@@ -1054,57 +1324,38 @@ def parse_certifications_section(text: str) -> List[Certification]:
         first_line = lines[0]
         
         # Try to extract issuer from first line if it's in format "Cert Name - Issuer"
-        parts = re.split(r"\s*[-|–]\s*", first_line)
+        parts = CERT_NAME_ISSUER_RE.split(first_line)
         if len(parts) >= 2:
             cert.name = parts[0].strip()
-            cert.title = cert.name
-            cert.certification_name = cert.name
             cert.issuer = parts[1].strip()
-            cert.organization = cert.issuer
-            cert.issued_by = cert.issuer
-            cert.provider = cert.issuer
         else:
             cert.name = first_line
-            cert.title = cert.name
-            cert.certification_name = cert.name
             
             # Look for issuer in next line or in parentheses
             if len(lines) > 1:
                 second_line = lines[1]
-                if not re.search(r"\d{4}", second_line):  # Not a date
+                if not YEAR_RE.search(second_line):  # Not a date
                     cert.issuer = second_line
-                    cert.organization = cert.issuer
         
         # Extract dates
-        date_patterns = [
-            r"(?:Issued|Earned|Obtained|Completed)\s*:?\s*(\w+\s+\d{4})",
-            r"(?:Date|Year)\s*:?\s*(\w+\s+\d{4}|\d{4})",
-            r"\b(\w+\s+\d{4})\b",
-            r"\b(20\d{2})\b",
-        ]
-        
-        for pattern in date_patterns:
-            match = re.search(pattern, entry, re.IGNORECASE)
+        for pattern in CERT_DATE_RES:
+            match = pattern.search(entry)
             if match:
                 cert.date = match.group(1)
-                cert.issue_date = cert.date
-                cert.issued_date = cert.date
-                cert.year = cert.date
-                cert.issued = cert.date
                 break
         
         # Extract expiry date
-        expiry_match = re.search(r"(?:Expires|Valid\s+until)\s*:?\s*(\w+\s+\d{4})", entry, re.IGNORECASE)
+        expiry_match = CERT_EXPIRY_RE.search(entry)
         if expiry_match:
             cert.expiry_date = expiry_match.group(1)
         
         # Extract credential ID
-        cred_match = re.search(r"(?:Credential|Certificate|License)\s*(?:ID|#|Number)\s*:?\s*([A-Z0-9-]+)", entry, re.IGNORECASE)
+        cred_match = CERT_CREDENTIAL_RE.search(entry)
         if cred_match:
             cert.credential_id = cred_match.group(1)
         
         # Extract credential URL
-        url_match = re.search(r"https?://[^\s]+", entry)
+        url_match = URL_RE.search(entry)
         if url_match:
             cert.credential_url = url_match.group(0)
         
@@ -1114,75 +1365,321 @@ def parse_certifications_section(text: str) -> List[Certification]:
     return certifications
 
 
-def extract_text_from_pdf(file_path: str) -> str:
-    """Extract text from PDF using best available library."""
+# Resumes past page 4 are noise; some uploads are 200-page PDFs
+MAX_PDF_PAGES = 4
+MAX_PDF_CHARS = 20000
+
+# Engines tried in order; pdfplumber takes over when pypdf fails or finds no
+# text. This is a fixed preference, not a measured result: pypdf does plain
+# text extraction while pdfplumber runs full pdfminer layout analysis, so
+# pypdf is expected to be the cheaper first attempt. Check it on real
+# resumes with benchmarks/bench_pdf_extraction.py before reordering.
+PDF_ENGINE_ORDER = ("pypdf", "pdfplumber")
+
+PdfSource = Union[str, bytes, BinaryIO]
+
+
+def _binary_input(source: PdfSource):
+    """Return something PDF libraries and zipfile can open: a path or a rewound stream."""
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return io.BytesIO(source)
+    if isinstance(source, (str, os.PathLike)):
+        return os.fspath(source)
+    source.seek(0)
+    return source
+
+
+def _pypdf_pages(source: PdfSource, start: int) -> Iterator[str]:
+    reader = PdfReader(_binary_input(source))
+    for index in range(start, len(reader.pages)):
+        yield reader.pages[index].extract_text() or ""
+
+
+def _pdfplumber_pages(source: PdfSource, start: int) -> Iterator[str]:
+    with pdfplumber.open(_binary_input(source)) as pdf:
+        for page in pdf.pages[start:]:
+            yield page.extract_text() or ""
+            # Drop the parsed layout objects before moving on
+            if hasattr(page, "close"):
+                page.close()
+
+
+def _pdf_engines() -> List[Tuple[str, Callable[[PdfSource, int], Iterator[str]]]]:
+    available = {}
+    if PdfReader is not None:
+        available["pypdf"] = _pypdf_pages
     if pdfplumber is not None:
-        try:
-            text = []
-            with pdfplumber.open(file_path) as pdf:
-                for page in pdf.pages:
-                    content = page.extract_text()
-                    if content:
-                        text.append(content)
-            if text:
-                return "\n".join(text)
-        except Exception as e:
-            print(f"pdfplumber extraction failed: {e}")
+        available["pdfplumber"] = _pdfplumber_pages
+    return [(name, available[name]) for name in PDF_ENGINE_ORDER if name in available]
+
+
+def iter_pdf_pages(
+    source: PdfSource,
+    max_pages: Optional[int] = MAX_PDF_PAGES,
+    max_chars: Optional[int] = MAX_PDF_CHARS,
+) -> Iterator[str]:
+    """
+    Yield PDF page text incrementally, within a page and character budget.
     
-    if PdfReader is not None:
+    If an engine fails part-way through, the next engine continues from the
+    failing page instead of starting over. If an engine finishes without
+    finding any text, the next one gets a full attempt.
+    
+    Args:
+        source: File path, raw PDF bytes, or a seekable binary stream
+        max_pages: Stop after this many pages (None for no limit)
+        max_chars: Stop after this many characters (None for no limit);
+            the last page is truncated to fit
+        
+    Yields:
+        Text of each non-empty page
+    """
+    engines = _pdf_engines()
+    if not engines:
+        raise ImportError("No PDF library available. Install pdfplumber or pypdf")
+    
+    page_index = 0
+    chars = 0
+    failed = []
+    for name, engine in engines:
         try:
-            text = []
-            reader = PdfReader(file_path)
-            for page in reader.pages:
-                content = page.extract_text()
-                if content:
-                    text.append(content)
-            return "\n".join(text)
+            for text in engine(source, page_index):
+                if max_pages is not None and page_index >= max_pages:
+                    break
+                page_index += 1
+                if not text:
+                    continue
+                if max_chars is not None and chars + len(text) >= max_chars:
+                    yield text[:max_chars - chars]
+                    return
+                chars += len(text)
+                yield text
+            if chars:
+                return
+            # No text within the budget: give the next engine a full pass
+            page_index = 0
         except Exception as e:
-            print(f"pypdf extraction failed: {e}")
-            return ""
+            logger.warning("%s extraction failed at page %d: %s", name, page_index + 1, e)
+            failed.append(name)
+    
+    if failed and not chars:
+        logger.error("PDF text extraction failed (%s); no text extracted", ", ".join(failed))
+
+
+def extract_text_from_pdf(
+    source: PdfSource,
+    max_pages: Optional[int] = MAX_PDF_PAGES,
+    max_chars: Optional[int] = MAX_PDF_CHARS,
+) -> str:
+    """Extract text from a PDF path, bytes or stream using the best available library."""
+    return "\n".join(iter_pdf_pages(source, max_pages=max_pages, max_chars=max_chars))
+
+
+# DOCX text lives in WordprocessingML parts inside a zip. Headers come first
+# because resumes often keep the name and contact line there.
+DOCX_DOCUMENT_PART = "word/document.xml"
+DOCX_HEADER_PART_RE = re.compile(r"word/header\d*\.xml")
+WORD_NS = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+
+# Uncompressed XML read per DOCX upload (guards against zip bombs). Real
+# resumes have 50-300 KB of document.xml; reading the whole cap takes ~1.5s.
+MAX_DOCX_XML_BYTES = 2 * 1024 * 1024
+MAX_DOCX_CHARS = MAX_PDF_CHARS
+DOCX_READ_CHUNK = 64 * 1024
+
+DocxSource = PdfSource
+
+
+def _docx_part_paragraphs(stream: BinaryIO, byte_budget: List[int]) -> Iterator[str]:
+    """
+    Yield paragraph text from one WordprocessingML part as it is read.
+    
+    Only the open element path is kept: each finished paragraph is detached
+    from its parent, so memory stays flat however long the document is.
+    byte_budget is a one-item list of bytes still allowed, shared across parts.
+    """
+    parser = ElementTree.XMLPullParser(events=("start", "end"))
+    open_elements = []
+    parts: List[str] = []
+    
+    while byte_budget[0] > 0:
+        chunk = stream.read(min(DOCX_READ_CHUNK, byte_budget[0]))
+        if not chunk:
+            break
+        byte_budget[0] -= len(chunk)
+        parser.feed(chunk)
+        
+        for event, elem in parser.read_events():
+            if event == "start":
+                open_elements.append(elem)
+                continue
+            
+            open_elements.pop()
+            tag = elem.tag
+            # Tabs and breaks are content only inside a run; w:tab also
+            # names the tab stops under w:pPr/w:tabs
+            in_run = bool(open_elements) and open_elements[-1].tag == WORD_NS + "r"
+            if tag == WORD_NS + "t":
+                parts.append(elem.text or "")
+            elif tag == WORD_NS + "tab" and in_run:
+                parts.append("\t")
+            elif tag in (WORD_NS + "br", WORD_NS + "cr") and in_run:
+                parts.append("\n")
+            elif tag == WORD_NS + "p":
+                yield "".join(parts)
+                parts = []
+                if open_elements:
+                    open_elements[-1].remove(elem)
+    
+    if parts:
+        yield "".join(parts)
+
+
+def iter_docx_paragraphs(
+    source: DocxSource,
+    max_chars: Optional[int] = MAX_DOCX_CHARS,
+    max_xml_bytes: Optional[int] = MAX_DOCX_XML_BYTES,
+) -> Iterator[str]:
+    """
+    Yield DOCX paragraph text incrementally, within a character budget.
+    
+    Header parts and word/document.xml are streamed straight out of the zip
+    through an incremental XML parser; nothing is written to disk and no
+    document tree is built.
     
-    raise ImportError("No PDF library available. Install pdfplumber or pypdf")
+    Args:
+        source: File path, raw DOCX bytes, or a seekable binary stream
+        max_chars: Stop after this many characters (None for no limit);
+            the last paragraph is truncated to fit
+        max_xml_bytes: Stop after reading this much uncompressed XML
+            (None for no limit)
+        
+    Yields:
+        Text of each paragraph, empty strings included (they separate sections)
+    """
+    try:
+        archive = zipfile.ZipFile(_binary_input(source))
+    except zipfile.BadZipFile as e:
+        raise ValueError(f"Not a DOCX file: {e}") from e
+    
+    with archive:
+        names = archive.namelist()
+        if DOCX_DOCUMENT_PART not in names:
+            raise ValueError(f"Not a DOCX file: {DOCX_DOCUMENT_PART} missing")
+        part_names = sorted(n for n in names if DOCX_HEADER_PART_RE.fullmatch(n))
+        part_names.append(DOCX_DOCUMENT_PART)
+        
+        byte_budget = [float("inf") if max_xml_bytes is None else max_xml_bytes]
+        chars = 0
+        for name in part_names:
+            with archive.open(name) as stream:
+                for text in _docx_part_paragraphs(stream, byte_budget):
+                    if max_chars is not None and chars + len(text) >= max_chars:
+                        yield text[:max_chars - chars]
+                        return
+                    chars += len(text) + 1
+                    yield text
+
+
+def extract_text_from_docx(
+    source: DocxSource,
+    max_chars: Optional[int] = MAX_DOCX_CHARS,
+) -> str:
+    """Extract text from a DOCX path, bytes or stream without a temp file."""
+    return "\n".join(iter_docx_paragraphs(source, max_chars=max_chars))
 
 
 def read_resume_file(file_path: str) -> str:
     """Read resume content from file."""
-    if str(file_path).lower().endswith('.pdf'):
+    suffix = str(file_path).lower()
+    if suffix.endswith('.pdf'):
         return extract_text_from_pdf(file_path)
+    if suffix.endswith('.docx'):
+        return extract_text_from_docx(file_path)
     
     with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
         return f.read()
 
 
-def parse_resume(resume_text: str) -> ParsedResume:
+def parse_resume(resume_text: str, section_budget: Optional[float] = SECTION_TIME_BUDGET) -> ParsedResume:
     """
     Parse resume text and extract ALL structured information.
     
     Args:
         resume_text: Raw resume text
+        section_budget: Seconds each section parser may run (None for no limit)
         
     Returns:
-        ParsedResume object with comprehensive extracted information
+        ParsedResume object with comprehensive extracted information;
+        partial_sections names anything cut short by the parsing budget
+    """
+    return _parse_normalized(normalize_text(resume_text), section_budget)
+
+
+def _run_section(parsed: ParsedResume, name: str, section_budget: Optional[float], parser, *args, **kwargs) -> list:
+    """Run a section parser under its deadline, keeping partial results on timeout."""
+    deadline = None if section_budget is None else time.perf_counter() + section_budget
+    try:
+        return parser(*args, deadline=deadline, **kwargs)
+    except SectionBudgetExceeded as e:
+        parsed.partial_sections.append(name)
+        return e.partial
+
+
+def section_fingerprint(section_text: str) -> str:
+    """Fingerprint of the text a section parser reads, tied to PARSER_VERSION."""
+    digest = hashlib.sha256(f"{PARSER_VERSION}\n{section_text}".encode("utf-8"))
+    return digest.hexdigest()[:16]
+
+
+def changed_sections(result: Mapping, previous_fingerprints: Optional[Mapping[str, str]]) -> List[str]:
+    """
+    Sections whose input differs from the parse that produced previous_fingerprints.
+    
+    A section without a fingerprint on either side (never parsed, or cut
+    short by the parsing budget) counts as changed.
     """
+    current = result.get("section_fingerprints") or {}
+    previous = previous_fingerprints or {}
+    return [
+        name for name in FINGERPRINTED_SECTIONS
+        if name not in current or current[name] != previous.get(name)
+    ]
+
+
+def _parse_normalized(
+    resume_text: str,
+    section_budget: Optional[float] = SECTION_TIME_BUDGET,
+    previous: Optional[Mapping] = None,
+    previous_fingerprints: Optional[Mapping[str, str]] = None,
+) -> ParsedResume:
+    """
+    Parse text that has already been through normalize_text.
+    
+    When previous (an earlier parse result) and its section_fingerprints are
+    given, sections whose text is unchanged keep their previous entries
+    instead of being parsed again.
+    """
+    truncated = len(resume_text) > MAX_RESUME_CHARS
+    if truncated:
+        # Lines are at most MAX_LINE_CHARS long, so a line break is always in reach
+        resume_text = resume_text[:resume_text.rfind("\n", 0, MAX_RESUME_CHARS) + 1]
+    
     parsed = ParsedResume(raw_text=resume_text)
+    if truncated:
+        parsed.partial_sections.append(TRUNCATED_INPUT)
     
     # Extract contact info
     parsed.name = extract_name(resume_text)
-    parsed.full_name = parsed.name
     parsed.first_name, parsed.last_name = split_name(parsed.name)
     
     parsed.email = extract_email(resume_text)
-    parsed.email_address = parsed.email
     
     parsed.phone = extract_phone(resume_text)
-    parsed.phone_number = parsed.phone
-    parsed.mobile = parsed.phone
-    parsed.contact = parsed.phone
     
     # Extract location
     location_info = extract_location(resume_text)
     parsed.location = location_info["full"]
-    parsed.address = location_info["full"]
     parsed.city = location_info.get("city", "")
     parsed.state = location_info.get("state", "")
     parsed.country = location_info.get("country", "")
@@ -1190,48 +1687,361 @@ def parse_resume(resume_text: str) -> ParsedResume:
     # Extract social links
     links = extract_links(resume_text)
     parsed.linkedin = links["linkedin"]
-    parsed.linkedin_url = links["linkedin_url"]
     parsed.github = links["github"]
-    parsed.github_url = links["github_url"]
     parsed.portfolio = links["portfolio"]
-    parsed.portfolio_url = links["portfolio_url"]
-    parsed.website = links["website"]
+    
+    # Locate every section once; the section parsers work on their slice
+    sections = segment_sections(resume_text)
     
     # Extract summary/objective
-    for section_name in [r"summary", r"objective", r"about", r"profile", r"professional\s+summary"]:
-        summary_section = extract_section(resume_text, section_name)
-        if summary_section:
-            parsed.summary = summary_section[:800]
-            parsed.objective = parsed.summary
-            parsed.profile = parsed.summary
-            parsed.about = parsed.summary
-            break
+    summary_section = _section(resume_text, sections, SUMMARY_SECTIONS)
+    if summary_section:
+        parsed.summary = summary_section[:800]
+    
+    # The exact text each section parser reads, for fingerprinting
+    section_texts = {"skills": find_skills_text(resume_text)}
+    for name, keys in SECTION_KEYS.items():
+        section_texts[name] = _section(resume_text, sections, keys)
+    
+    previous = previous or {}
+    previous_fingerprints = previous_fingerprints or {}
+    for name in FINGERPRINTED_SECTIONS:
+        fingerprint = section_fingerprint(section_texts[name])
+        if previous_fingerprints.get(name) == fingerprint and isinstance(previous.get(name), list):
+            parsed.reused_sections[name] = previous[name]
+        parsed.section_fingerprints[name] = fingerprint
     
     # Extract skills
-    parsed.skills = extract_skills_section(resume_text)
-    parsed.technical_skills = parsed.skills  # Alias
+    if "skills" not in parsed.reused_sections:
+        parsed.skills = _run_section(
+            parsed, "skills", section_budget, extract_skills_section, resume_text,
+            skills_text=section_texts["skills"],
+        )
     
     # Extract experience
-    parsed.experience = parse_experience_section(resume_text)
-    parsed.work_experience = parsed.experience  # Alias
+    if "experience" not in parsed.reused_sections:
+        parsed.experience = _run_section(
+            parsed, "experience", section_budget, parse_experience_section, resume_text, sections
+        )
     
     # Extract education
-    parsed.education = parse_education_section(resume_text)
-    parsed.academic = parsed.education  # Alias
+    if "education" not in parsed.reused_sections:
+        parsed.education = _run_section(
+            parsed, "education", section_budget, parse_education_section, resume_text, sections
+        )
     
     # Extract projects
-    parsed.projects = parse_projects_section(resume_text)
+    if "projects" not in parsed.reused_sections:
+        parsed.projects = _run_section(
+            parsed, "projects", section_budget, parse_projects_section, resume_text, sections
+        )
     
     # Extract certifications
-    parsed.certifications = parse_certifications_section(resume_text)
-    parsed.licenses = parsed.certifications  # Alias
+    if "certifications" not in parsed.reused_sections:
+        parsed.certifications = _run_section(
+            parsed, "certifications", section_budget, parse_certifications_section, resume_text, sections
+        )
+    
+    # A section cut short by the clock must be parsed again next time
+    for name in parsed.partial_sections:
+        parsed.section_fingerprints.pop(name, None)
     
     return parsed
 
 
-def parse(resume_text: str) -> dict:
-    """Parse resume and return as comprehensive dictionary."""
-    return parse_resume(resume_text).to_dict()
+def _wrap_line(line: str) -> Iterator[str]:
+    """Split a line into pieces of at most MAX_LINE_CHARS, breaking at spaces."""
+    # Offsets rather than slicing off the rest, so a long line is copied once
+    start = 0
+    while len(line) - start > MAX_LINE_CHARS:
+        cut = line.rfind(" ", start + 1, start + MAX_LINE_CHARS + 1)
+        if cut <= start:
+            cut = start + MAX_LINE_CHARS
+        yield line[start:cut]
+        start = cut
+        while start < len(line) and line[start] == " ":
+            start += 1
+    yield line[start:]
+
+
+def normalize_text(resume_text: str) -> str:
+    """
+    Normalize resume text before parsing and cache lookup.
+    
+    Unifies line endings, collapses runs of spaces/tabs and of blank lines,
+    and wraps lines longer than MAX_LINE_CHARS. The same resume pasted or
+    extracted on different platforms maps to one cache entry, and no pattern
+    ever sees an unbounded whitespace run or line. Input past MAX_RAW_CHARS
+    is dropped first, so normalization itself is bounded too.
+    """
+    text = resume_text[:MAX_RAW_CHARS].replace("\r\n", "\n").replace("\r", "\n")
+    text = HORIZONTAL_SPACE_RE.sub(" ", text).replace(" \n", "\n")
+    text = BLANK_LINES_RE.sub("\n\n", text).strip()
+    
+    lines = text.split("\n")
+    if any(len(line) > MAX_LINE_CHARS for line in lines):
+        text = "\n".join(piece for line in lines for piece in _wrap_line(line))
+    return text + "\n"
+
+
+def _cacheable(result: dict) -> bool:
+    """Sections cut short by the clock depend on machine load; don't cache those."""
+    return all(name == TRUNCATED_INPUT for name in result.get("partial_sections", []))
+
+
+def parse(resume_text: str, use_cache: bool = True) -> dict:
+    """
+    Parse resume and return the compact (v2) dictionary.
+    
+    Each value is stored once under its canonical key; callers that read
+    legacy alias keys should wrap the result in ResumeView. Results are
+    served from the content-addressed parse cache when the normalized text
+    has been parsed before by the same PARSER_VERSION.
+    """
+    text = normalize_text(resume_text)
+    if not use_cache:
+        return _parse_normalized(text).to_dict()
+    
+    key = parse_cache.make_key(text, PARSER_VERSION)
+    cached = parse_cache.cache.get(key)
+    if cached is not None:
+        return cached
+    
+    result = _parse_normalized(text).to_dict()
+    if _cacheable(result):
+        parse_cache.cache.put(key, result)
+    return result
+
+
+def parse_incremental(
+    resume_text: str,
+    previous: Mapping,
+    previous_fingerprints: Optional[Mapping[str, str]] = None,
+    use_cache: bool = True,
+) -> Tuple[dict, List[str]]:
+    """
+    Re-parse an edited resume, reusing sections whose text did not change.
+    
+    Contact details and the summary are always extracted again (they are
+    cheap); each fingerprinted section is parsed only when its text differs
+    from the parse that produced previous_fingerprints.
+    
+    Args:
+        resume_text: New raw resume text
+        previous: Earlier result holding the section lists under their
+            canonical keys (skills, experience, education, ...)
+        previous_fingerprints: That result's section_fingerprints; defaults
+            to previous["section_fingerprints"]
+        use_cache: Serve and store results through the parse cache
+        
+    Returns:
+        Tuple of (compact result dict, names of the sections that changed)
+    """
+    if previous_fingerprints is None:
+        previous_fingerprints = previous.get("section_fingerprints")
+    
+    text = normalize_text(resume_text)
+    key = parse_cache.make_key(text, PARSER_VERSION)
+    result = parse_cache.cache.get(key) if use_cache else None
+    if result is None:
+        result = _parse_normalized(
+            text, previous=previous, previous_fingerprints=previous_fingerprints
+        ).to_dict()
+        if use_cache and _cacheable(result):
+            parse_cache.cache.put(key, result)
+    
+    return result, changed_sections(result, previous_fingerprints)
+
+
+# Below this many uncached resumes per worker, a process pool costs more
+# than it saves and parse_many parses inline.
+MIN_RESUMES_PER_WORKER = 8
+
+# Chunks per worker: enough to balance uneven resume sizes without paying
+# a round trip per resume.
+CHUNKS_PER_WORKER = 4
+
+
+def _parse_text_chunk(texts: List[str]) -> List[Tuple[Optional[dict], Optional[str]]]:
+    """Process-pool task: parse a chunk of normalized texts into (result, error) pairs."""
+    results = []
+    for text in texts:
+        try:
+            results.append((_parse_normalized(text).to_dict(), None))
+        except Exception as e:
+            results.append((None, f"{type(e).__name__}: {e}"))
+    return results
+
+
+def _parse_file_chunk(paths: List[str]) -> List[Tuple[Optional[str], Optional[dict], Optional[str]]]:
+    """Process-pool task: read and parse a chunk of resume files into (text, result, error) triples."""
+    results = []
+    for path in paths:
+        try:
+            text = normalize_text(read_resume_file(path))
+            results.append((text, _parse_normalized(text).to_dict(), None))
+        except Exception as e:
+            results.append((None, None, f"{type(e).__name__}: {e}"))
+    return results
+
+
+# One pool per process, started on first use and reused by every batch
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_workers = 0
+_pool_users = 0
+_pool_lock = threading.Lock()
+
+
+@contextmanager
+def _leased_pool(workers: int) -> Iterator[ProcessPoolExecutor]:
+    """
+    Use the process's parsing pool for the duration of the block.
+    
+    Uses the spawn start method: gunicorn workers are multi-threaded and
+    forking a threaded process can deadlock the child. Spawned workers
+    re-import the parser (and, under `python app.py`, the app module), so
+    the pool is kept for the life of the process rather than per batch.
+    A call asking for more workers than the pool has replaces it only when
+    no other thread is using it; otherwise it shares the smaller pool.
+    """
+    global _pool, _pool_workers, _pool_users
+    with _pool_lock:
+        if _pool is None or (workers > _pool_workers and _pool_users == 0):
+            if _pool is not None:
+                _pool.shutdown(wait=False)
+            else:
+                atexit.register(shutdown_pool)
+            context = multiprocessing.get_context("spawn")
+            _pool = ProcessPoolExecutor(max_workers=workers, mp_context=context)
+            _pool_workers = workers
+        pool = _pool
+        _pool_users += 1
+    try:
+        yield pool
+    finally:
+        with _pool_lock:
+            _pool_users -= 1
+
+
+def _discard_pool(pool: ProcessPoolExecutor) -> None:
+    global _pool, _pool_workers
+    with _pool_lock:
+        if _pool is pool:
+            _pool = None
+            _pool_workers = 0
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def shutdown_pool() -> None:
+    """Stop the parsing pool's worker processes (registered with atexit)."""
+    global _pool, _pool_workers
+    with _pool_lock:
+        pool, _pool, _pool_workers = _pool, None, 0
+    if pool is not None:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+def _run_chunked(task, items: List, workers: int) -> List:
+    """
+    Fan items out to the process pool in chunks and return results in order.
+    
+    If a worker dies (the pool breaks), the pool is discarded so the next
+    batch starts a fresh one, and this batch is finished inline.
+    """
+    chunk_size = max(1, -(-len(items) // (workers * CHUNKS_PER_WORKER)))
+    chunks = [items[i:i + chunk_size] for i in range(0, len(items), chunk_size)]
+    
+    results = []
+    with _leased_pool(workers) as pool:
+        try:
+            futures = [pool.submit(task, chunk) for chunk in chunks]
+            for future in futures:
+                results.extend(future.result())
+        except BrokenProcessPool as e:
+            logger.error("Resume parsing pool broke, parsing %d items inline: %s", len(items), e)
+            _discard_pool(pool)
+            return task(items)
+    return results
+
+
+def parse_many(texts: Iterable[str], workers: Optional[int] = None) -> List[Optional[dict]]:
+    """
+    Parse many resumes across a process pool.
+    
+    Parsing is CPU-bound regex work that holds the GIL, so threads do not
+    help; worker processes do. Cached resumes are answered in-process and
+    only the misses are shipped to the pool. Fresh results are added to the
+    parse cache.
+    
+    Args:
+        texts: Resume texts
+        workers: Worker processes (defaults to the CPU count)
+        
+    Returns:
+        Parsed dicts in input order; None where parsing failed
+    """
+    normalized = [normalize_text(t or "") for t in texts]
+    workers = workers or os.cpu_count() or 1
+    
+    results: List[Optional[dict]] = [None] * len(normalized)
+    keys = [parse_cache.make_key(t, PARSER_VERSION) for t in normalized]
+    pending = []
+    for i, key in enumerate(keys):
+        cached = parse_cache.cache.get(key)
+        if cached is not None:
+            results[i] = cached
+        else:
+            pending.append(i)
+    
+    if not pending:
+        return results
+    
+    pending_texts = [normalized[i] for i in pending]
+    if workers <= 1 or len(pending) < workers * MIN_RESUMES_PER_WORKER:
+        parsed = _parse_text_chunk(pending_texts)
+    else:
+        parsed = _run_chunked(_parse_text_chunk, pending_texts, workers)
+    
+    for i, (result, error) in zip(pending, parsed):
+        if error is not None:
+            logger.error("Resume parsing failed for input %d: %s", i, error)
+        results[i] = result
+        if result is not None and _cacheable(result):
+            parse_cache.cache.put(keys[i], result)
+    
+    return results
+
+
+def parse_files(file_paths: Iterable[str], workers: Optional[int] = None) -> List[Optional[dict]]:
+    """
+    Read and parse many resume files across a process pool.
+    
+    File reading (including PDF text extraction) happens in the workers
+    too, since it is as CPU-heavy as parsing.
+    
+    Args:
+        file_paths: Paths accepted by read_resume_file
+        workers: Worker processes (defaults to the CPU count)
+        
+    Returns:
+        Parsed dicts in input order; None where reading or parsing failed
+    """
+    paths = [str(p) for p in file_paths]
+    workers = workers or os.cpu_count() or 1
+    
+    if workers <= 1 or len(paths) < workers * MIN_RESUMES_PER_WORKER:
+        pairs = _parse_file_chunk(paths)
+    else:
+        pairs = _run_chunked(_parse_file_chunk, paths, workers)
+    
+    results = []
+    for path, (text, result, error) in zip(paths, pairs):
+        if error is not None:
+            logger.error("Resume parsing failed for %s: %s", path, error)
+        if result is not None and _cacheable(result):
+            parse_cache.cache.put(parse_cache.make_key(text, PARSER_VERSION), result)
+        results.append(result)
+    return results
 
 
 # For testing
@@ -1246,4 +2056,4 @@ if __name__ == "__main__":
         import json
         print(json.dumps(result, indent=2))
     else:
-        print("Usage: python resume_parser_improved.py <resume_file.pdf|txt>")
\ No newline at end of file
+        print("Usage: python -m models.metis.resume_parser <resume_file.pdf|txt>")
\ No newline at end of file
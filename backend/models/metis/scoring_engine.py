@@ -20,6 +20,264 @@ Categories (100 points total):
 import re
 from dataclasses import dataclass, field
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+# Skills penalized when no GitHub language backs them
+PROGRAMMING_SKILLS = frozenset({"python", "java", "javascript", "typescript", "go", "rust", "c++", "ruby", "php", "c#"})
+
+# Signal pattern families, matched against lowercased text by SignalScanner.
+# A match must not consume text where another pattern of its family could
+# start, so trailing context goes in a lookahead ("reduced latency by 40%"
+# reports the reduction and the percentage). Alternatives that open with a
+# single character or literal (\d\d* rather than \d+) let re skip
+# positions that cannot match.
+QUANTIFIED_PATTERNS = [
+    (r"\d\d*%", "percentage metric"),
+    (r"\$(?=[\d,])", "revenue/cost metric"),
+    (r"\d\d*\+?\s*users?", "user count"),
+    (r"\d\d*x(?=\s+\w)", "multiplier claim"),
+    (r"reduced(?=\s+\w+\s+by\s+\d)", "reduction metric"),
+    (r"increased(?=\s+\w+\s+by\s+\d)", "increase metric"),
+    (r"saved(?=\s+\$?\d)", "savings metric"),
+]
+
+# Action verbs and clear impact language, one point per group present
+IMPACT_PATTERNS = [
+    (r"\b(?:built|developed|designed|implemented|created|launched)\b", "delivery"),
+    (r"\b(?:led|managed|coordinated|mentored)\b", "leadership"),
+    (r"\b(?:improved|optimized|reduced|increased|scaled)\b", "improvement"),
+]
+
+VAGUE_PATTERNS = [
+    (r"\bvarious(?=\s+\w)", "various"),
+    (r"\bmultiple\s+projects?\b", "multiple projects"),
+    (r"\bseveral(?=\s+\w)", "several"),
+    (r"\betc\.?\b", "etc"),
+]
+
+DEGREE_KEYWORDS = ["bachelor", "master", "b.tech", "m.tech", "phd", "diploma"]
+SENIOR_TITLES = ["senior", "lead", "principal", "architect", "staff", "director", "head"]
+
+SECTION_NAMES = [
+    "skill_evidence",
+    "project_authenticity",
+    "professional_signals",
+    "impact_outcomes",
+    "resume_integrity",
+]
+
+SECTION_MAX_SCORES = {
+    "skill_evidence": 30,
+    "project_authenticity": 25,
+    "professional_signals": 15,
+    "impact_outcomes": 15,
+    "resume_integrity": 15,
+}
+
+# Every threshold and point value the sections apply. Ladders are
+# [minimum, points] rungs checked in order; the first rung reached wins.
+# Stored feature records can be re-scored under a modified copy (see
+# rubric_with) without re-parsing resumes or re-fetching GitHub/portfolios.
+DEFAULT_RUBRIC = {
+    "section_max": SECTION_MAX_SCORES,
+    # A. Skill evidence; the ratio ladder applies once any skill is evidenced
+    "evidence_ratio": [[0.7, 20], [0.5, 15], [0.3, 10], [0.0, 5]],
+    "github_languages": [[3, 5], [1, 3]],
+    "detailed_projects": [[2, 5], [1, 3]],
+    # B. Project & work authenticity
+    "documented_roles": 12,     # 2+ roles with title, company and description
+    "clear_role": 8,            # 1+ role with title and company
+    "any_role": 4,
+    "original_repos": [[5, 8], [3, 6], [1, 4]],
+    "projects_with_tech": [[2, 5], [1, 3]],
+    "portfolio_projects": [[5, 5], [3, 4], [1, 2]],
+    # C. Professional signals
+    "experience_count": [[3, 8], [2, 6], [1, 4]],
+    "degree": 4,
+    "education_without_degree": 2,
+    "followers": [[50, 3], [10, 2], [1, 1]],
+    # D. Impact & outcomes
+    "quantified_hits": [[4, 10], [2, 6], [1, 3]],
+    "impact_verb_groups": [[3, 5], [2, 3], [1, 1]],
+    # E. Resume integrity penalties
+    "skill_count_penalty": [[36, 5], [26, 3]],
+    "vague_hits_penalty": [[3, 3], [1, 1]],
+    "unverified_skills_penalty": [[3, 4], [1, 2]],
+    "inflated_title_penalty": 3,
+}
+
+# Bump when extract_feature_record changes what a feature means; stored
+# records from another version must be re-extracted, not re-scored
+FEATURES_VERSION = 2
+
+
+@dataclass
+class EvidenceIndex:
+    """
+    Normalized evidence for one candidate, built once per evaluation.
+    
+    Every text is lowercased and joined a single time and every list that is
+    probed per skill becomes a set, so the scoring sections answer "is this
+    skill evidenced?" with set lookups or one substring search instead of
+    re-lowercasing the resume for each skill. Mentions keep the engine's
+    substring semantics ("java" is found in "javascript").
+    """
+    skills: list[str] = field(default_factory=list)
+    skill_keys: set[str] = field(default_factory=set)
+    project_text: str = ""
+    experience_text: str = ""
+    github_languages: set[str] = field(default_factory=set)
+    # PROGRAMMING_SKILLS that appear inside some GitHub language name
+    github_programming_skills: set[str] = field(default_factory=set)
+    portfolio_skills: set[str] = field(default_factory=set)
+    portfolio_technologies: list[str] = field(default_factory=list)
+    
+    @classmethod
+    def build(
+        cls,
+        resume_data: dict,
+        github_data: dict | None = None,
+        portfolio_data: dict | None = None
+    ) -> "EvidenceIndex":
+        """Index a candidate's resume, GitHub and portfolio data."""
+        skills = resume_data.get("skills", [])
+        projects = resume_data.get("projects", [])
+        experience = resume_data.get("experience", [])
+        
+        # Same concatenation the per-skill checks used, lowercased once
+        project_text = " ".join(p.get("description", "") + p.get("name", "") for p in projects).lower()
+        experience_text = " ".join(e.get("description", "") for e in experience).lower()
+        
+        index = cls(
+            skills=skills,
+            skill_keys={s.lower() for s in skills},
+            project_text=project_text,
+            experience_text=experience_text,
+        )
+        
+        if github_data:
+            index.github_languages = {l.lower() for l in github_data.get("languages", {}).keys()}
+            index.github_programming_skills = {
+                skill for skill in PROGRAMMING_SKILLS
+                if any(skill in lang for lang in index.github_languages)
+            }
+        
+        if portfolio_data:
+            index.portfolio_skills = {s.lower() for s in portfolio_data.get("skills", [])}
+            index.portfolio_technologies = [
+                tech.lower()
+                for proj in portfolio_data.get("projects", [])
+                for tech in proj.get("technologies", [])
+            ]
+        
+        return index
+    
+    def in_projects(self, key: str) -> bool:
+        """Whether a lowercased skill is mentioned in the resume projects."""
+        return key in self.project_text
+    
+    def in_experience(self, key: str) -> bool:
+        """Whether a lowercased skill is mentioned in the work experience."""
+        return key in self.experience_text
+
+
+def _count_evidenced_skills(index: EvidenceIndex) -> tuple[int, list[str]]:
+    """Count skills with actual evidence (projects, roles, GitHub, portfolio)."""
+    keys = [(skill, skill.lower()) for skill in index.skills]
+    
+    evidenced_skills = set()
+    evidence_details = []
+    
+    # Skills mentioned in project descriptions or used in work experience
+    for _, key in keys:
+        if index.in_projects(key) or index.in_experience(key):
+            evidenced_skills.add(key)
+    
+    # GitHub language verification
+    for skill, key in keys:
+        if key in index.github_languages:
+            evidenced_skills.add(key)
+            evidence_details.append(f"{skill} verified via GitHub")
+    
+    # Portfolio verification
+    for skill, key in keys:
+        if key in index.portfolio_skills:
+            evidenced_skills.add(key)
+            evidence_details.append(f"{skill} shown on portfolio")
+    
+    # Check skills in portfolio project descriptions
+    for tech in index.portfolio_technologies:
+        if tech in index.skill_keys:
+            evidenced_skills.add(tech)
+    
+    return len(evidenced_skills), evidence_details
+
+
+def _impact_text(resume_data: dict) -> str:
+    """Summary, experience and project descriptions as scanned for impact."""
+    all_text = resume_data.get("summary", "")
+    all_text += " ".join(e.get("description", "") for e in resume_data.get("experience", []))
+    all_text += " ".join(p.get("description", "") for p in resume_data.get("projects", []))
+    return all_text
+
+
+class SignalScanner:
+    """
+    Labelled pattern family matched in one compiled pass.
+    
+    The patterns are joined into a single alternation; an empty group at
+    the end of each alternative tells which one matched. Text must already
+    be lowercased: case-insensitive matching is far slower in re than
+    lowering the text once.
+    """
+    
+    def __init__(self, patterns: list[tuple[str, str]]):
+        self.labels = [label for _, label in patterns]
+        self._regex = re.compile("|".join(f"(?:{pattern}())" for pattern, _ in patterns))
+    
+    def scan(self, text: str) -> dict[str, int]:
+        """Hit count per label, in pattern order; labels without hits are omitted."""
+        counts = [0] * len(self.labels)
+        for match in self._regex.finditer(text):
+            counts[match.lastindex - 1] += 1
+        return {label: n for label, n in zip(self.labels, counts) if n}
+
+
+def _fold(text: str) -> str:
+    """Lowercase for SignalScanner; "İ" maps to "i" as re.IGNORECASE treats it, not to two characters."""
+    return text.replace("\u0130", "i").lower()
+
+
+QUANTIFIED_SCANNER = SignalScanner(QUANTIFIED_PATTERNS)
+IMPACT_SCANNER = SignalScanner(IMPACT_PATTERNS)
+VAGUE_SCANNER = SignalScanner(VAGUE_PATTERNS)
+
+
+def _has_degree(education: list[dict]) -> bool:
+    return any(
+        any(deg in e.get("degree", "").lower() for deg in DEGREE_KEYWORDS)
+        for e in education
+    )
+
+
+def _has_senior_title(experience: list[dict]) -> bool:
+    return any(
+        any(t in e.get("title", "").lower() for t in SENIOR_TITLES)
+        for e in experience
+    )
+
+
+def _unverified_skills(skills: list[str], index: EvidenceIndex) -> list[str]:
+    """Programming skills among the first 15 that no GitHub language backs."""
+    return [
+        skill for skill in skills[:15]
+        if skill.lower() in PROGRAMMING_SKILLS and skill.lower() not in index.github_programming_skills
+    ]
+
 
 @dataclass
 class SectionScores:
@@ -76,6 +334,65 @@ class MetisEvaluation:
         }
 
 
+def _ladder(value: float, rungs: list) -> tuple[int, int | None]:
+    """Points and index of the first rung value reaches, or (0, None)."""
+    for rung, (minimum, points) in enumerate(rungs):
+        if value >= minimum:
+            return points, rung
+    return 0, None
+
+
+def rubric_with(overrides: dict | None = None) -> dict:
+    """
+    Copy of DEFAULT_RUBRIC with overrides applied.
+    
+    section_max overrides are merged per section. Unknown keys and values
+    of the wrong shape (points must be integers, ladders lists of
+    [threshold, points] pairs) raise ValueError, so a typo can neither
+    silently leave the default in place nor break scoring later.
+    """
+    if overrides is not None and not isinstance(overrides, dict):
+        raise ValueError("Rubric overrides must be an object")
+    rubric = dict(DEFAULT_RUBRIC, section_max=dict(SECTION_MAX_SCORES))
+    for key, value in (overrides or {}).items():
+        if key not in rubric:
+            raise ValueError(f"Unknown rubric key: {key}")
+        if key == "section_max":
+            if not isinstance(value, dict):
+                raise ValueError("section_max must map sections to points")
+            unknown = set(value) - set(SECTION_MAX_SCORES)
+            if unknown:
+                raise ValueError(f"Unknown section: {', '.join(sorted(unknown))}")
+            for section, points in value.items():
+                if not _is_points(points):
+                    raise ValueError(f"section_max.{section} must be an integer")
+            rubric["section_max"].update(value)
+        elif isinstance(DEFAULT_RUBRIC[key], list):
+            if not _is_ladder(value):
+                raise ValueError(f"{key} must be a list of [threshold, points] pairs")
+            rubric[key] = value
+        else:
+            if not _is_points(value):
+                raise ValueError(f"{key} must be an integer")
+            rubric[key] = value
+    return rubric
+
+
+def _is_points(value) -> bool:
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def _is_ladder(value) -> bool:
+    return isinstance(value, list) and all(
+        isinstance(rung, list | tuple)
+        and len(rung) == 2
+        and isinstance(rung[0], int | float)
+        and not isinstance(rung[0], bool)
+        and _is_points(rung[1])
+        for rung in value
+    )
+
+
 class MetisCoreEngine:
     """
     METIS-CORE Evaluation Engine
@@ -85,89 +402,19 @@ class MetisCoreEngine:
     - Evidence of execution, not buzzwords
     - Clarity of impact, not verbosity
     - Conservative scoring, skeptical by default
+    
+    Sections score a feature record (extract_feature_record) under a rubric
+    (DEFAULT_RUBRIC); they never look at the raw resume, GitHub or portfolio
+    data, so stored records can be re-scored after a rubric change.
     """
     
-    def __init__(self):
+    def __init__(self, rubric: dict | None = None):
+        self.rubric = rubric or DEFAULT_RUBRIC
         self.result = MetisEvaluation()
         self.result.section_scores = SectionScores()
         self._evidence_count = 0
     
-    def _has_quantified_evidence(self, text: str) -> list[str]:
-        """Find quantified achievements in text."""
-        patterns = [
-            (r"\d+%", "percentage metric"),
-            (r"\$[\d,]+[KMB]?", "revenue/cost metric"),
-            (r"\d+\+?\s*users?", "user count"),
-            (r"\d+x\s+\w+", "multiplier claim"),
-            (r"reduced\s+\w+\s+by\s+\d+", "reduction metric"),
-            (r"increased\s+\w+\s+by\s+\d+", "increase metric"),
-            (r"saved\s+\$?\d+", "savings metric"),
-        ]
-        
-        found = []
-        for pattern, label in patterns:
-            if re.search(pattern, text, re.IGNORECASE):
-                found.append(label)
-        return found
-    
-    def _count_skill_evidence(
-        self,
-        resume_data: dict,
-        github_data: dict | None,
-        portfolio_data: dict | None = None
-    ) -> tuple[int, list[str]]:
-        """Count skills with actual evidence (projects, roles, GitHub, portfolio)."""
-        skills = resume_data.get("skills", [])
-        projects = resume_data.get("projects", [])
-        experience = resume_data.get("experience", [])
-        
-        evidenced_skills = set()
-        evidence_details = []
-        
-        # Skills mentioned in project descriptions
-        project_text = " ".join(p.get("description", "") + p.get("name", "") for p in projects)
-        for skill in skills:
-            if skill.lower() in project_text.lower():
-                evidenced_skills.add(skill.lower())
-        
-        # Skills used in work experience
-        exp_text = " ".join(e.get("description", "") for e in experience)
-        for skill in skills:
-            if skill.lower() in exp_text.lower():
-                evidenced_skills.add(skill.lower())
-        
-        # GitHub language verification
-        if github_data:
-            github_langs = {l.lower() for l in github_data.get("languages", {}).keys()}
-            for skill in skills:
-                if skill.lower() in github_langs:
-                    evidenced_skills.add(skill.lower())
-                    evidence_details.append(f"{skill} verified via GitHub")
-        
-        # Portfolio verification
-        if portfolio_data:
-            portfolio_skills = {s.lower() for s in portfolio_data.get("skills", [])}
-            portfolio_projects = portfolio_data.get("projects", [])
-            
-            for skill in skills:
-                if skill.lower() in portfolio_skills:
-                    evidenced_skills.add(skill.lower())
-                    evidence_details.append(f"{skill} shown on portfolio")
-            
-            # Check skills in portfolio project descriptions
-            for proj in portfolio_projects:
-                for tech in proj.get("technologies", []):
-                    if tech.lower() in {s.lower() for s in skills}:
-                        evidenced_skills.add(tech.lower())
-        
-        return len(evidenced_skills), evidence_details
-    
-    def score_skill_evidence(
-        self,
-        resume_data: dict,
-        github_data: dict | None = None,
-        portfolio_data: dict | None = None
-    ) -> int:
+    def score_skill_evidence(self, features: dict) -> int:
         """
         A. Skill Evidence Quality (0-30)
         
@@ -176,66 +423,46 @@ class MetisCoreEngine:
         - Is there depth, not just mentions?
         - Portfolio and GitHub verification
         """
+        rubric = self.rubric
         score = 0
-        skills = resume_data.get("skills", [])
+        total_skills = features["skill_count"]
         
-        if not skills:
+        if not total_skills:
             self.result.risk_signals.append("No skills listed in resume")
             self.result.section_scores.skill_evidence = 0
             return 0
         
-        # Count evidenced skills (now includes portfolio)
-        evidenced_count, evidence_details = self._count_skill_evidence(
-            resume_data, github_data, portfolio_data
-        )
-        total_skills = len(skills)
-        evidence_ratio = evidenced_count / total_skills if total_skills > 0 else 0
-        
-        # Score based on evidence ratio (max 20)
-        if evidence_ratio >= 0.7:
-            score += 20
-            self.result.strength_signals.append(
-                f"{evidenced_count}/{total_skills} skills backed by project/work evidence"
-            )
-        elif evidence_ratio >= 0.5:
-            score += 15
-        elif evidence_ratio >= 0.3:
-            score += 10
-        elif evidence_ratio > 0:
-            score += 5
+        # Skills backed by projects, roles, GitHub or portfolio (max 20)
+        evidenced_count = features["evidenced_skills"]
+        if evidenced_count:
+            points, rung = _ladder(evidenced_count / total_skills, rubric["evidence_ratio"])
+            score += points
+            if rung == 0:
+                self.result.strength_signals.append(
+                    f"{evidenced_count}/{total_skills} skills backed by project/work evidence"
+                )
         else:
             self.result.risk_signals.append("Skills listed without supporting evidence")
         
         # GitHub verification bonus (max 5)
-        if github_data:
-            github_langs = github_data.get("languages", {})
-            if len(github_langs) >= 3:
-                score += 5
+        if features["has_github"]:
+            languages = features["github_languages"]
+            points, rung = _ladder(languages, rubric["github_languages"])
+            score += points
+            if rung == 0:
                 self.result.strength_signals.append(
-                    f"GitHub shows {len(github_langs)} languages with real code"
+                    f"GitHub shows {languages} languages with real code"
                 )
-            elif len(github_langs) >= 1:
-                score += 3
         
         # Depth check - detailed project descriptions (max 5)
-        projects = resume_data.get("projects", [])
-        detailed_projects = sum(1 for p in projects if len(p.get("description", "")) > 50)
-        if detailed_projects >= 2:
-            score += 5
-        elif detailed_projects >= 1:
-            score += 3
+        score += _ladder(features["detailed_projects"], rubric["detailed_projects"])[0]
         
         self._evidence_count = evidenced_count
-        score = min(30, score)
+        score = min(rubric["section_max"]["skill_evidence"], score)
         self.result.section_scores.skill_evidence = score
         return score
     
-    def score_project_authenticity(
-        self,
-        resume_data: dict,
-        github_data: dict | None = None,
-        portfolio_data: dict | None = None
-    ) -> int:
+    def score_project_authenticity(self, features: dict) -> int:
         """
         B. Project & Work Authenticity (0-25)
         
@@ -245,41 +472,34 @@ class MetisCoreEngine:
         - Portfolio project evidence
         - Clear scope of work
         """
+        rubric = self.rubric
         score = 0
-        projects = resume_data.get("projects", [])
-        experience = resume_data.get("experience", [])
         
         # Work experience authenticity (max 12)
-        if experience:
-            has_clear_roles = sum(1 for e in experience if e.get("title") and e.get("company"))
-            has_descriptions = sum(1 for e in experience if len(e.get("description", "")) > 30)
-            
-            if has_clear_roles >= 2 and has_descriptions >= 2:
-                score += 12
+        experience_count = features["experience_count"]
+        if experience_count:
+            if features["clear_roles"] >= 2 and features["described_roles"] >= 2:
+                score += rubric["documented_roles"]
                 self.result.strength_signals.append(
-                    f"{len(experience)} work experiences with clear role definitions"
+                    f"{experience_count} work experiences with clear role definitions"
                 )
-            elif has_clear_roles >= 1:
-                score += 8
+            elif features["clear_roles"] >= 1:
+                score += rubric["clear_role"]
             else:
-                score += 4
+                score += rubric["any_role"]
         
         # GitHub authenticity (max 8)
-        if github_data:
-            original_repos = github_data.get("original_repos", 0)
-            forked_repos = github_data.get("forked_repos", 0)
-            repos = github_data.get("repositories", [])
+        if features["has_github"]:
+            original_repos = features["original_repos"]
+            forked_repos = features["forked_repos"]
             
             # Original work is valued
-            if original_repos >= 5:
-                score += 8
+            points, rung = _ladder(original_repos, rubric["original_repos"])
+            score += points
+            if rung == 0:
                 self.result.strength_signals.append(
                     f"{original_repos} original repositories showing ownership"
                 )
-            elif original_repos >= 3:
-                score += 6
-            elif original_repos >= 1:
-                score += 4
             
             # Flag fork-heavy profiles
             if forked_repos > original_repos * 2 and forked_repos > 5:
@@ -288,7 +508,7 @@ class MetisCoreEngine:
                 )
             
             # Check for substantial repos
-            substantial = sum(1 for r in repos if r.get("size_kb", 0) > 100 and not r.get("is_fork"))
+            substantial = features["substantial_repos"]
             if substantial >= 2:
                 self.result.strength_signals.append(f"{substantial} substantial codebases")
         else:
@@ -296,47 +516,34 @@ class MetisCoreEngine:
             self.result.risk_signals.append("No GitHub profile to verify project claims")
         
         # Resume projects (max 5)
-        if projects:
-            with_tech = sum(1 for p in projects if p.get("technologies"))
-            if with_tech >= 2:
-                score += 5
-            elif with_tech >= 1:
-                score += 3
+        score += _ladder(features["projects_with_tech"], rubric["projects_with_tech"])[0]
         
         # Portfolio projects bonus (max 5 additional)
-        if portfolio_data:
-            portfolio_projects = portfolio_data.get("projects", [])
-            portfolio_count = len(portfolio_projects)
-            
-            if portfolio_count >= 5:
-                score += 5
+        if features["has_portfolio"]:
+            portfolio_count = features["portfolio_projects"]
+            points, rung = _ladder(portfolio_count, rubric["portfolio_projects"])
+            score += points
+            if rung == 0:
                 self.result.strength_signals.append(
                     f"Portfolio shows {portfolio_count} projects with details"
                 )
-            elif portfolio_count >= 3:
-                score += 4
+            elif rung == 1:
                 self.result.strength_signals.append(
                     f"{portfolio_count} projects documented on portfolio"
                 )
-            elif portfolio_count >= 1:
-                score += 2
             
             # Check for demo links in portfolio
-            has_demos = sum(1 for p in portfolio_projects if p.get("links"))
+            has_demos = features["portfolio_demos"]
             if has_demos >= 2:
                 self.result.strength_signals.append(
                     f"{has_demos} portfolio projects with live demos/links"
                 )
         
-        score = min(25, score)
+        score = min(rubric["section_max"]["project_authenticity"], score)
         self.result.section_scores.project_authenticity = score
         return score
     
-    def score_professional_signals(
-        self,
-        resume_data: dict,
-        github_data: dict | None = None
-    ) -> int:
+    def score_professional_signals(self, features: dict) -> int:
         """
         C. Professional Signal Strength (0-15)
         
@@ -345,52 +552,33 @@ class MetisCoreEngine:
         - Role-to-role consistency
         - Responsibility growth
         """
-        score = 0
-        experience = resume_data.get("experience", [])
-        education = resume_data.get("education", [])
+        rubric = self.rubric
         
         # Career progression (max 8)
-        if len(experience) >= 3:
-            score += 8
+        experience_count = features["experience_count"]
+        score, rung = _ladder(experience_count, rubric["experience_count"])
+        if rung == 0:
             self.result.strength_signals.append("Clear career progression with multiple roles")
-        elif len(experience) >= 2:
-            score += 6
-        elif len(experience) >= 1:
-            score += 4
-        else:
+        elif not experience_count:
             self.result.risk_signals.append("No work experience documented")
         
         # Education (max 4)
-        if education:
-            has_degree = any(
-                any(deg in e.get("degree", "").lower() 
-                    for deg in ["bachelor", "master", "b.tech", "m.tech", "phd", "diploma"])
-                for e in education
-            )
-            if has_degree:
-                score += 4
-            else:
-                score += 2
+        if features["education_count"]:
+            score += rubric["degree"] if features["has_degree"] else rubric["education_without_degree"]
         
         # GitHub community signals (max 3)
-        if github_data:
-            followers = github_data.get("followers", 0)
-            if followers >= 50:
-                score += 3
+        if features["has_github"]:
+            followers = features["followers"]
+            points, rung = _ladder(followers, rubric["followers"])
+            score += points
+            if rung == 0:
                 self.result.strength_signals.append(f"{followers} GitHub followers")
-            elif followers >= 10:
-                score += 2
-            elif followers >= 1:
-                score += 1
         
-        score = min(15, score)
+        score = min(rubric["section_max"]["professional_signals"], score)
         self.result.section_scores.professional_signals = score
         return score
     
-    def score_impact_outcomes(
-        self,
-        resume_data: dict
-    ) -> int:
+    def score_impact_outcomes(self, features: dict) -> int:
         """
         D. Impact & Outcomes (0-15)
         
@@ -399,59 +587,26 @@ class MetisCoreEngine:
         - Business / technical impact
         - Problem → Action → Result clarity
         """
-        score = 0
-        experience = resume_data.get("experience", [])
-        summary = resume_data.get("summary", "")
-        projects = resume_data.get("projects", [])
-        
-        # Combine all text for analysis
-        all_text = summary
-        all_text += " ".join(e.get("description", "") for e in experience)
-        all_text += " ".join(p.get("description", "") for p in projects)
+        rubric = self.rubric
         
         # Check for quantified achievements (max 10)
-        evidence = self._has_quantified_evidence(all_text)
-        
-        if len(evidence) >= 4:
-            score += 10
+        evidence = features["quantified_labels"]
+        score, rung = _ladder(features["quantified_hits"], rubric["quantified_hits"])
+        if rung == 0:
             self.result.strength_signals.append(
                 f"Quantified impact: {', '.join(evidence[:3])}"
             )
-        elif len(evidence) >= 2:
-            score += 6
-        elif len(evidence) >= 1:
-            score += 3
-        else:
+        elif not evidence:
             self.result.risk_signals.append("No quantified achievements or metrics")
         
         # Action verbs and clear impact language (max 5)
-        impact_patterns = [
-            r"\b(built|developed|designed|implemented|created|launched)\b",
-            r"\b(led|managed|coordinated|mentored)\b",
-            r"\b(improved|optimized|reduced|increased|scaled)\b",
-        ]
-        
-        impact_score = 0
-        for pattern in impact_patterns:
-            if re.search(pattern, all_text, re.IGNORECASE):
-                impact_score += 1
-        
-        if impact_score >= 3:
-            score += 5
-        elif impact_score >= 2:
-            score += 3
-        elif impact_score >= 1:
-            score += 1
-        
-        score = min(15, score)
+        score += _ladder(features["impact_verb_groups"], rubric["impact_verb_groups"])[0]
+        
+        score = min(rubric["section_max"]["impact_outcomes"], score)
         self.result.section_scores.impact_outcomes = score
         return score
     
-    def score_resume_integrity(
-        self,
-        resume_data: dict,
-        github_data: dict | None = None
-    ) -> int:
+    def score_resume_integrity(self, features: dict) -> int:
         """
         E. Resume Integrity & ATS Risk (0-15)
         
@@ -461,62 +616,35 @@ class MetisCoreEngine:
         - Inflated titles
         - Irrelevant skill noise
         """
-        score = 15
-        skills = resume_data.get("skills", [])
-        experience = resume_data.get("experience", [])
+        rubric = self.rubric
+        score = rubric["section_max"]["resume_integrity"]
         
         # Keyword stuffing check (penalty: -3 to -5)
-        if len(skills) > 35:
-            score -= 5
-            self.result.ats_flags.append(f"keyword stuffing ({len(skills)} skills listed)")
-        elif len(skills) > 25:
-            score -= 3
-            self.result.ats_flags.append(f"excessive skills ({len(skills)} listed)")
+        skill_count = features["skill_count"]
+        penalty, rung = _ladder(skill_count, rubric["skill_count_penalty"])
+        score -= penalty
+        if rung == 0:
+            self.result.ats_flags.append(f"keyword stuffing ({skill_count} skills listed)")
+        elif rung is not None:
+            self.result.ats_flags.append(f"excessive skills ({skill_count} listed)")
         
         # Vague claims check
-        vague_patterns = [
-            r"\bvarious\s+\w+\b",
-            r"\bmultiple\s+projects?\b",
-            r"\bseveral\s+\w+\b",
-            r"\betc\.?\b",
-        ]
-        
-        all_text = " ".join(e.get("description", "") for e in experience)
-        vague_count = sum(1 for p in vague_patterns if re.search(p, all_text, re.IGNORECASE))
-        
-        if vague_count >= 3:
-            score -= 3
+        penalty, rung = _ladder(features["vague_hits"], rubric["vague_hits_penalty"])
+        score -= penalty
+        if rung == 0:
             self.result.ats_flags.append("vague achievements")
-        elif vague_count >= 1:
-            score -= 1
         
         # Skills without GitHub evidence (penalty: -2 to -4)
-        if github_data:
-            github_langs = {l.lower() for l in github_data.get("languages", {}).keys()}
-            programming_skills = {"python", "java", "javascript", "typescript", "go", "rust", "c++", "ruby", "php", "c#"}
-            
-            unverified = []
-            for skill in skills[:15]:
-                skill_lower = skill.lower()
-                if skill_lower in programming_skills:
-                    if not any(skill_lower in lang.lower() for lang in github_langs):
-                        unverified.append(skill)
-            
-            if len(unverified) >= 3:
-                score -= 4
+        if features["has_github"]:
+            unverified = features["unverified_skill_names"]
+            penalty, rung = _ladder(features["unverified_skills"], rubric["unverified_skills_penalty"])
+            score -= penalty
+            if rung == 0:
                 self.result.ats_flags.append(f"unverified skills: {', '.join(unverified[:3])}")
-            elif len(unverified) >= 1:
-                score -= 2
         
         # Inflated title check
-        senior_titles = ["senior", "lead", "principal", "architect", "staff", "director", "head"]
-        has_senior = any(
-            any(t in e.get("title", "").lower() for t in senior_titles)
-            for e in experience
-        )
-        
-        if has_senior and len(experience) <= 1:
-            score -= 3
+        if features["senior_title"] and features["experience_count"] <= 1:
+            score -= rubric["inflated_title_penalty"]
             self.result.ats_flags.append("inflated titles (senior role with minimal experience)")
         
         score = max(0, score)
@@ -573,29 +701,22 @@ class MetisCoreEngine:
         
         return " ".join(parts)
     
-    def evaluate(
-        self,
-        resume_data: dict,
-        github_data: dict | None = None,
-        portfolio_data: dict | None = None
-    ) -> dict:
+    def apply(self, features: dict) -> dict:
         """
-        Run full METIS-CORE evaluation.
+        Score a feature record under this engine's rubric.
         
         Args:
-            resume_data: Parsed resume data
-            github_data: Analyzed GitHub profile (optional)
-            portfolio_data: Analyzed portfolio website (optional)
-            
+            features: Record from extract_feature_record (or stored metisFeatures)
+        
         Returns:
             Strict JSON output matching METIS contract
         """
         # Score each category
-        self.score_skill_evidence(resume_data, github_data, portfolio_data)
-        self.score_project_authenticity(resume_data, github_data, portfolio_data)
-        self.score_professional_signals(resume_data, github_data)
-        self.score_impact_outcomes(resume_data)
-        self.score_resume_integrity(resume_data, github_data)
+        self.score_skill_evidence(features)
+        self.score_project_authenticity(features)
+        self.score_professional_signals(features)
+        self.score_impact_outcomes(features)
+        self.score_resume_integrity(features)
         
         # Calculate total
         self.result.overall_score = self.result.section_scores.total
@@ -605,6 +726,91 @@ class MetisCoreEngine:
         self.result.final_reasoning = self._generate_reasoning()
         
         return self.result.to_dict()
+    
+    def evaluate(
+        self,
+        resume_data: dict,
+        github_data: dict | None = None,
+        portfolio_data: dict | None = None
+    ) -> dict:
+        """
+        Run full METIS-CORE evaluation.
+        
+        Args:
+            resume_data: Parsed resume data
+            github_data: Analyzed GitHub profile (optional)
+            portfolio_data: Analyzed portfolio website (optional)
+        
+        Returns:
+            Strict JSON output matching METIS contract
+        """
+        return self.apply(extract_feature_record(resume_data, github_data, portfolio_data))
+
+
+def extract_feature_record(
+    resume_data: dict,
+    github_data: dict | None = None,
+    portfolio_data: dict | None = None
+) -> dict:
+    """
+    Reduce one candidate to everything the rubric reads.
+    
+    The record is plain JSON, stored on the application as metisFeatures:
+    the FEATURE_NAMES counts plus the labels and skill names quoted in
+    signals, tagged with FEATURES_VERSION.
+    """
+    index = EvidenceIndex.build(resume_data, github_data, portfolio_data)
+    skills = resume_data.get("skills", [])
+    projects = resume_data.get("projects", [])
+    experience = resume_data.get("experience", [])
+    education = resume_data.get("education", [])
+    github = github_data or {}
+    portfolio = portfolio_data or {}
+    repos = github.get("repositories", [])
+    portfolio_projects = portfolio.get("projects", [])
+    
+    impact_text = _fold(_impact_text(resume_data))
+    quantified = QUANTIFIED_SCANNER.scan(impact_text)
+    impact_verbs = IMPACT_SCANNER.scan(impact_text)
+    vague = VAGUE_SCANNER.scan(_fold(" ".join(e.get("description", "") for e in experience)))
+    unverified = _unverified_skills(skills, index) if github_data else []
+    
+    return {
+        "version": FEATURES_VERSION,
+        "skill_count": len(skills),
+        "evidenced_skills": _count_evidenced_skills(index)[0],
+        "has_github": int(bool(github_data)),
+        "github_languages": len(github.get("languages", {})),
+        "detailed_projects": sum(1 for p in projects if len(p.get("description", "")) > 50),
+        "experience_count": len(experience),
+        "clear_roles": sum(1 for e in experience if e.get("title") and e.get("company")),
+        "described_roles": sum(1 for e in experience if len(e.get("description", "")) > 30),
+        "original_repos": github.get("original_repos", 0),
+        "forked_repos": github.get("forked_repos", 0),
+        "substantial_repos": sum(1 for r in repos if r.get("size_kb", 0) > 100 and not r.get("is_fork")),
+        "projects_with_tech": sum(1 for p in projects if p.get("technologies")),
+        "has_portfolio": int(bool(portfolio_data)),
+        "portfolio_projects": len(portfolio_projects),
+        "portfolio_demos": sum(1 for p in portfolio_projects if p.get("links")),
+        "education_count": len(education),
+        "has_degree": int(_has_degree(education)),
+        "followers": github.get("followers", 0),
+        "quantified_hits": len(quantified),
+        "quantified_matches": sum(quantified.values()),
+        "impact_verb_groups": len(impact_verbs),
+        "impact_verb_matches": sum(impact_verbs.values()),
+        "vague_hits": len(vague),
+        "vague_matches": sum(vague.values()),
+        "unverified_skills": len(unverified),
+        "senior_title": int(_has_senior_title(experience)),
+        "quantified_labels": list(quantified),
+        "unverified_skill_names": unverified,
+    }
+
+
+def apply_rubric(features: dict, rubric: dict | None = None) -> dict:
+    """Score a stored feature record; pure, no resume or network access."""
+    return MetisCoreEngine(rubric).apply(features)
 
 
 def evaluate(
@@ -617,3 +823,258 @@ def evaluate(
     engine = MetisCoreEngine()
     return engine.evaluate(resume_data, github_data, portfolio_data)
 
+
+def evaluate_with_features(
+    resume_data: dict,
+    github_data: dict | None = None,
+    portfolio_data: dict | None = None,
+    rubric: dict | None = None
+) -> tuple[dict, dict]:
+    """
+    Run METIS-CORE evaluation and also return the feature record it scored.
+    
+    Args:
+        rubric: Thresholds and points (default: DEFAULT_RUBRIC)
+    
+    Returns:
+        (strict JSON result, feature record to store for later re-scoring)
+    """
+    features = extract_feature_record(resume_data, github_data, portfolio_data)
+    return apply_rubric(features, rubric), features
+
+
+
+# ---------------------------------------------------------------------------
+# Batch scoring
+#
+# Re-scoring a whole applicant pool one MetisCoreEngine at a time spends most
+# of its time building signal strings nobody reads. evaluate_batch reduces
+# each candidate to a feature record, scores every row at once with NumPy,
+# and only builds signals and reasoning for the rows that are actually
+# displayed. rescore_batch does the same from stored records, so a rubric
+# change re-scores a job's applicants without touching resumes or the network.
+# ---------------------------------------------------------------------------
+
+# Column order of the feature matrix (the numeric fields of a feature record)
+FEATURE_NAMES = [
+    "skill_count",          # skills listed
+    "evidenced_skills",     # skills backed by projects, roles, GitHub or portfolio
+    "has_github",
+    "github_languages",
+    "detailed_projects",    # resume projects with a >50 char description
+    "experience_count",
+    "clear_roles",          # roles with both title and company
+    "described_roles",      # roles with a >30 char description
+    "original_repos",
+    "forked_repos",
+    "substantial_repos",    # non-fork repos over 100 KB
+    "projects_with_tech",
+    "has_portfolio",
+    "portfolio_projects",
+    "portfolio_demos",      # portfolio projects with links
+    "education_count",
+    "has_degree",
+    "followers",
+    "quantified_hits",      # quantified-achievement patterns matched
+    "quantified_matches",   # total quantified-achievement matches
+    "impact_verb_groups",
+    "impact_verb_matches",
+    "vague_hits",
+    "vague_matches",
+    "unverified_skills",    # programming skills no GitHub language backs
+    "senior_title",
+]
+FEATURE_INDEX = {name: i for i, name in enumerate(FEATURE_NAMES)}
+
+
+def feature_vector(record: dict) -> list[int]:
+    """Numeric fields of a feature record in FEATURE_NAMES order."""
+    return [record[name] for name in FEATURE_NAMES]
+
+
+def extract_features(
+    resume_data: dict,
+    github_data: dict | None = None,
+    portfolio_data: dict | None = None
+) -> list[int]:
+    """
+    Reduce one candidate to the numbers the section scores depend on.
+    
+    Returns:
+        Feature values in FEATURE_NAMES order
+    """
+    return feature_vector(extract_feature_record(resume_data, github_data, portfolio_data))
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise ImportError("NumPy is required for batch scoring. Install numpy")
+
+
+def _tiers(values, rungs: list, default: int = 0):
+    """Vectorized _ladder: points of the first rung values reach."""
+    if not rungs:
+        return np.zeros(len(values), dtype=np.int64)
+    return np.select([values >= minimum for minimum, _ in rungs], [points for _, points in rungs], default)
+
+
+def score_features(features, rubric: dict | None = None) -> "np.ndarray":
+    """
+    Section scores for a feature matrix, with the same rules as MetisCoreEngine.
+    
+    Args:
+        features: (n, len(FEATURE_NAMES)) array-like from extract_features
+        rubric: Thresholds and points (default: DEFAULT_RUBRIC)
+    
+    Returns:
+        (n, 5) int array of section scores in SECTION_NAMES order
+    """
+    _require_numpy()
+    rubric = rubric or DEFAULT_RUBRIC
+    section_max = rubric["section_max"]
+    X = np.asarray(features, dtype=np.int64).reshape(-1, len(FEATURE_NAMES))
+    f = {name: X[:, i] for name, i in FEATURE_INDEX.items()}
+    has_github = f["has_github"].astype(bool)
+    has_portfolio = f["has_portfolio"].astype(bool)
+    
+    # A. Skill evidence (0-30)
+    skill_count = f["skill_count"]
+    ratio = np.divide(f["evidenced_skills"], skill_count, out=np.zeros(len(X)), where=skill_count > 0)
+    skill = np.where(f["evidenced_skills"] > 0, _tiers(ratio, rubric["evidence_ratio"]), 0)
+    skill += np.where(has_github, _tiers(f["github_languages"], rubric["github_languages"]), 0)
+    skill += _tiers(f["detailed_projects"], rubric["detailed_projects"])
+    skill = np.where(skill_count > 0, np.minimum(section_max["skill_evidence"], skill), 0)
+    
+    # B. Project & work authenticity (0-25)
+    roles = np.select(
+        [(f["clear_roles"] >= 2) & (f["described_roles"] >= 2), f["clear_roles"] >= 1],
+        [rubric["documented_roles"], rubric["clear_role"]],
+        rubric["any_role"],
+    )
+    project = np.where(f["experience_count"] > 0, roles, 0)
+    project += np.where(has_github, _tiers(f["original_repos"], rubric["original_repos"]), 0)
+    project += _tiers(f["projects_with_tech"], rubric["projects_with_tech"])
+    project += np.where(has_portfolio, _tiers(f["portfolio_projects"], rubric["portfolio_projects"]), 0)
+    project = np.minimum(section_max["project_authenticity"], project)
+    
+    # C. Professional signals (0-15)
+    professional = _tiers(f["experience_count"], rubric["experience_count"])
+    professional += np.where(
+        f["education_count"] > 0,
+        np.where(f["has_degree"] > 0, rubric["degree"], rubric["education_without_degree"]),
+        0,
+    )
+    professional += np.where(has_github, _tiers(f["followers"], rubric["followers"]), 0)
+    professional = np.minimum(section_max["professional_signals"], professional)
+    
+    # D. Impact & outcomes (0-15)
+    impact = _tiers(f["quantified_hits"], rubric["quantified_hits"])
+    impact += _tiers(f["impact_verb_groups"], rubric["impact_verb_groups"])
+    impact = np.minimum(section_max["impact_outcomes"], impact)
+    
+    # E. Resume integrity (0-15, penalized)
+    integrity = section_max["resume_integrity"] - _tiers(skill_count, rubric["skill_count_penalty"])
+    integrity -= _tiers(f["vague_hits"], rubric["vague_hits_penalty"])
+    integrity -= np.where(has_github, _tiers(f["unverified_skills"], rubric["unverified_skills_penalty"]), 0)
+    integrity -= np.where(
+        (f["senior_title"] > 0) & (f["experience_count"] <= 1), rubric["inflated_title_penalty"], 0
+    )
+    integrity = np.maximum(0, integrity)
+    
+    return np.stack([skill, project, professional, impact, integrity], axis=1).astype(np.int64)
+
+
+class BatchEvaluation:
+    """
+    Scores for a batch of candidates; full results are built per row on demand.
+    
+    Attributes:
+        records: Feature record per row (as stored in metisFeatures)
+        features: (n, len(FEATURE_NAMES)) feature matrix
+        section_scores: (n, 5) section scores in SECTION_NAMES order
+        overall_scores: (n,) total scores
+    """
+    
+    def __init__(self, records: list[dict], features, section_scores, rubric: dict | None = None):
+        self.records = records
+        self.rubric = rubric
+        self._results: dict[int, dict] = {}
+        self.features = features
+        self.section_scores = section_scores
+        self.overall_scores = section_scores.sum(axis=1)
+    
+    def __len__(self) -> int:
+        return len(self.records)
+    
+    def ranking(self) -> list[int]:
+        """Row indices by overall score, best first (ties keep input order)."""
+        return np.argsort(-self.overall_scores, kind="stable").tolist()
+    
+    def scores(self, row: int) -> dict:
+        """Overall and section scores of one row, without signals."""
+        return {
+            "overall_score": int(self.overall_scores[row]),
+            "section_scores": dict(zip(SECTION_NAMES, self.section_scores[row].tolist())),
+        }
+    
+    def result(self, row: int) -> dict:
+        """Full METIS-CORE output (signals, confidence, reasoning) for one row."""
+        if row not in self._results:
+            self._results[row] = apply_rubric(self.records[row], self.rubric)
+        return self._results[row]
+
+
+def rescore_batch(records: list[dict], rubric: dict | None = None) -> BatchEvaluation:
+    """
+    Score stored feature records under a rubric.
+    
+    Args:
+        records: Feature records from extract_feature_record; all must be
+            FEATURES_VERSION
+        rubric: Thresholds and points (default: DEFAULT_RUBRIC, see rubric_with)
+    
+    Returns:
+        BatchEvaluation over the records
+    """
+    _require_numpy()
+    stale = sum(1 for r in records if r.get("version") != FEATURES_VERSION)
+    if stale:
+        raise ValueError(f"{stale} feature record(s) are not version {FEATURES_VERSION}; re-extract them")
+    
+    features = np.array(
+        [feature_vector(record) for record in records], dtype=np.int64
+    ).reshape(len(records), len(FEATURE_NAMES))
+    return BatchEvaluation(records, features, score_features(features, rubric), rubric)
+
+
+def evaluate_batch(
+    resume_datas: list[dict],
+    github_datas: list[dict | None] | None = None,
+    portfolio_datas: list[dict | None] | None = None,
+    rubric: dict | None = None
+) -> BatchEvaluation:
+    """
+    Score many candidates at once.
+    
+    Args:
+        resume_datas: Parsed resume data per candidate
+        github_datas: Analyzed GitHub profile per candidate (None entries allowed)
+        portfolio_datas: Analyzed portfolio per candidate (None entries allowed)
+        rubric: Thresholds and points (default: DEFAULT_RUBRIC)
+    
+    Returns:
+        BatchEvaluation with vectorized scores; call .result(row) for the
+        signals and reasoning of the rows being displayed
+    """
+    _require_numpy()
+    count = len(resume_datas)
+    github_datas = github_datas if github_datas is not None else [None] * count
+    portfolio_datas = portfolio_datas if portfolio_datas is not None else [None] * count
+    if not len(github_datas) == len(portfolio_datas) == count:
+        raise ValueError("resume_datas, github_datas and portfolio_datas must have the same length")
+    
+    records = [
+        extract_feature_record(*candidate)
+        for candidate in zip(resume_datas, github_datas, portfolio_datas)
+    ]
+    return rescore_batch(records, rubric)
@@ -34,7 +34,8 @@ from typing import Dict, List, Optional, Tuple
 from pathlib import Path
 
 
-# Section score maximums for normalization
+# Section score maximums for normalization; mirrors the default
+# metis.scoring_engine.SECTION_MAX_SCORES (this module also runs standalone)
 SECTION_MAX_SCORES = {
     "skill_evidence": 30,
     "project_authenticity": 25,
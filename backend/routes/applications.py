@@ -5,6 +5,10 @@ from datetime import datetime
 
 applications_bp = Blueprint('applications', __name__)
 
+# Statuses a late full evaluation may still reject an application from;
+# past them a recruiter has acted on it, so it is flagged for review instead
+REJECTABLE_STATUSES = ['pending', 'under_review']
+
 @applications_bp.route('/', methods=['POST'])
 def submit_application():
     """Submit a job application"""
@@ -79,40 +83,55 @@ def submit_application():
     # Score resume against job requirements using AI
     resume_score = 0
     resume_evaluation = None
+    resume_features = None
+    resume_fingerprint = None
+    evaluator = None
     is_eligible = False
+    eligibility_pending = False
     rejection_reason = None
     
     try:
-        from models.metis.evaluator import evaluate_candidate
+        from models.metis.evaluator import (
+            MetisEvaluator, CandidateInput, INTERACTIVE_DEADLINE, ENRICHMENT_GRACE, MIN_ELIGIBLE_SCORE,
+            check_eligibility, input_fingerprint, job_rubric
+        )
         
         resume_text = user.get('resume', {}).get('rawText', '')
         github_url = user.get('githubUrl')
         portfolio_url = user.get('portfolioUrl')
         
-        # Run METIS AI evaluation
-        resume_evaluation = evaluate_candidate(
-            resume_text=resume_text,
-            github_url=github_url,
-            portfolio_url=portfolio_url,
-            jd_text=job.get('description', '')
+        # Run METIS AI evaluation under the job's rubric; GitHub and portfolio
+        # analysis get INTERACTIVE_DEADLINE seconds and otherwise finish in
+        # the background (scored under the same rubric)
+        rubric = job_rubric(job)
+        evaluator = MetisEvaluator(rubric)
+        resume_evaluation = evaluator.evaluate(
+            CandidateInput(
+                resume_text=resume_text,
+                github_url=github_url,
+                portfolio_url=portfolio_url
+            ),
+            deadline=INTERACTIVE_DEADLINE
         )
         
+        # Never reject on partial data: a low score waits ENRICHMENT_GRACE
+        # more seconds for the full picture, and if enrichment is still
+        # running then, the application is accepted provisionally and
+        # patch_evaluation below decides eligibility once it lands
+        if evaluator.enrichment_pending and resume_evaluation.get('overall_score', 0) < MIN_ELIGIBLE_SCORE:
+            try:
+                resume_evaluation = evaluator.finish_enrichment(ENRICHMENT_GRACE)
+            except TimeoutError:
+                eligibility_pending = True
+        resume_features = evaluator.context.features
+        resume_fingerprint = input_fingerprint(resume_text, github_url, portfolio_url, rubric)
+        
         resume_score = resume_evaluation.get('overall_score', 0)
         
-        # Check eligibility: score must be >= 20/100
-        if resume_score < 20:
-            rejection_reason = f"Resume score ({resume_score}/100) is below the minimum threshold of 20. Your qualifications do not meet the job requirements."
-            is_eligible = False
-        else:
-            # Additional check: verify relevance through risk signals
-            risk_signals = resume_evaluation.get('risk_signals', [])
-            critical_risks = [r for r in risk_signals if 'irrelevant' in r.lower() or 'mismatch' in r.lower()]
-            
-            if len(critical_risks) > 2:
-                rejection_reason = "Your profile does not align with the job requirements. Please review the job description and apply for positions that better match your experience."
-                is_eligible = False
-            else:
-                is_eligible = True
+        # Check eligibility: score must be >= MIN_ELIGIBLE_SCORE/100 and the
+        # risk signals must not flag the profile as irrelevant
+        rejection_reason = None if eligibility_pending else check_eligibility(resume_evaluation)
+        is_eligible = rejection_reason is None
     
     except Exception as e:
         print(f"Resume scoring error: {str(e)}")
@@ -141,8 +160,11 @@ def submit_application():
         "appliedAt": datetime.now(),
         "resumeScore": resume_score,  # Round 1 score (30% of final)
         "metisEvaluation": resume_evaluation,
+        "metisFeatures": resume_features or None,  # Inputs of the score, for re-scoring
+        "metisInputFingerprint": resume_fingerprint,  # Lets batch evaluation skip unchanged inputs
         "evaluatedAt": datetime.now(),
         "eligible": True,
+        "eligibilityPending": eligibility_pending,  # Accepted before enrichment could decide
         "profileSnapshot": {
             "firstName": user.get('firstName', ''),
             "lastName": user.get('lastName', ''),
@@ -168,6 +190,16 @@ def submit_application():
     
     result = db.applications.insert_one(application)
     
+    # Store the full evaluation once enrichment that missed the deadline
+    # lands, and settle eligibility on it
+    if evaluator is not None and evaluator.enrichment_pending:
+        application_id = result.inserted_id
+        
+        def patch_evaluation(evaluation, features):
+            store_full_evaluation(application_id, evaluation, features, check_eligibility(evaluation))
+        
+        evaluator.when_enriched(patch_evaluation)
+    
     # Increment application count
     db.jobs.update_one(
         {"_id": ObjectId(job_id)},
@@ -209,9 +241,58 @@ def submit_application():
         "status": "under_review",
         "resumeScore": resume_score,
         "eligible": True,
-        "note": "Your resume has been evaluated. You are eligible for the interview round."
+        "eligibilityPending": eligibility_pending,
+        "note": (
+            "Your application was received. Your GitHub and portfolio are still being analyzed; "
+            "eligibility will be confirmed once that finishes."
+            if eligibility_pending else
+            "Your resume has been evaluated. You are eligible for the interview round."
+        )
     }), 201
 
+def store_full_evaluation(application_id, evaluation, features, rejection_reason):
+    """
+    Store the full evaluation of an application accepted before enrichment finished.
+    
+    Whether it was accepted provisionally or on a partial score that the
+    full one no longer reaches, an ineligible result rejects it, as it
+    would have been rejected on submission; one a recruiter has already
+    moved past REJECTABLE_STATUSES is flagged eligibilityReview instead.
+    """
+    score = evaluation.get('overall_score', 0)
+    db.applications.update_one(
+        {"_id": application_id},
+        {
+            "$set": {
+                "resumeScore": score,
+                "metisEvaluation": evaluation,
+                "metisFeatures": features or None,
+                "evaluatedAt": datetime.now(),
+                "eligible": rejection_reason is None,
+                "eligibilityPending": False
+            }
+        }
+    )
+    if rejection_reason is None:
+        return
+    
+    rejected = db.applications.update_one(
+        {"_id": application_id, "status": {"$in": REJECTABLE_STATUSES}},
+        {
+            "$set": {"status": "rejected", "rejectionReason": rejection_reason},
+            "$push": {"timeline": {
+                "event": "Application Rejected",
+                "timestamp": datetime.now(),
+                "description": f"Resume score ({score}/100) after full evaluation"
+            }}
+        }
+    )
+    if rejected.matched_count == 0:
+        db.applications.update_one(
+            {"_id": application_id},
+            {"$set": {"eligibilityReview": True, "rejectionReason": rejection_reason}}
+        )
+
 @applications_bp.route('/job/<job_id>', methods=['GET'])
 def get_job_applications(job_id):
     """Get all applications for a job"""
@@ -6,17 +6,20 @@ Integrates Model 1 (Resume Parser/Evaluator) for advanced candidate analysis.
 
 from flask import Blueprint, request, jsonify
 from bson import ObjectId
+from pymongo import UpdateOne
 from datetime import datetime
-import sys
-import os
-
-# Add models to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'models'))
+import time
 
+# Import through the models package (as routes/users.py and
+# routes/applications.py do) so every route shares one resume_parser
+# module and therefore one parse cache.
 try:
-    from metis.evaluator import evaluate_candidate
-    from metis.resume_parser import parse as parse_resume, read_resume_file
-    from metis.interview_evaluator import evaluate_interview, get_round2_score
+    from models.metis.evaluator import check_eligibility, evaluate_candidate, input_fingerprint, job_rubric
+    from models.metis.resume_parser import parse as parse_resume, parse_many, read_resume_file
+    from models.metis.interview_evaluator import evaluate_interview, get_round2_score
+    from models.metis import github_snapshots, parse_cache, rate_limit, response_cache
+    from models.metis.rate_limit import RateLimited, batch_priority
+    from models.metis.scoring_engine import FEATURES_VERSION, rescore_batch, rubric_with
     METIS_AVAILABLE = True
 except ImportError as e:
     print(f"Warning: METIS models not available: {e}")
@@ -24,6 +27,17 @@ except ImportError as e:
 
 evaluation_bp = Blueprint('evaluation', __name__)
 
+# Applications whose resumes are parsed together across the process pool
+# before being evaluated. Kept below the parse cache size so the parsed
+# results are still cached when the evaluations read them.
+BATCH_PARSE_WINDOW = 512
+
+# Seconds a batch evaluation keeps starting new applications, leaving room
+# under the worker timeout (gunicorn --timeout 120) for the one in flight.
+# Whatever is left is reported as remaining; calling again resumes, since
+# the finished applications are skipped by fingerprint.
+BATCH_TIME_BUDGET = 75.0
+
 def get_db():
     """Get database instance."""
     from app import db
@@ -79,6 +93,56 @@ def parse_resume_endpoint():
         return jsonify({"error": str(e)}), 500
 
 
+@evaluation_bp.route('/parse-cache/stats', methods=['GET'])
+def parse_cache_stats():
+    """
+    Report resume parse cache counters for this worker.
+    
+    Response:
+        {
+            "hits": 12, "memory_hits": 10, "mongo_hits": 2,
+            "misses": 3, "hit_rate": 0.8,
+            "entries": 3, "max_entries": 1024, "mongo_enabled": true
+        }
+    """
+    if not METIS_AVAILABLE:
+        return jsonify({"error": "METIS evaluation service unavailable"}), 503
+    
+    return jsonify(parse_cache.cache.info()), 200
+
+
+@evaluation_bp.route('/github-cache/stats', methods=['GET'])
+def github_cache_stats():
+    """
+    Report GitHub API response cache counters, rate limit budget and
+    profile snapshot counters for this worker.
+    
+    Response:
+        {
+            "fresh_hits": 40, "revalidated": 8, "misses": 12, "hit_rate": 0.8,
+            "entries": 52, "max_entries": 4096, "fresh_seconds": 3600,
+            "mongo_enabled": true,
+            "rate_limit": {
+                "limit": 60, "remaining": 41, "reset_in": 1830.0, "reserve": 10,
+                "batch_waits": 0, "rejected": 0
+            },
+            "snapshots": {
+                "fresh_hits": 9, "stale_hits": 1, "misses": 4, "refreshes": 5,
+                "hit_rate": 0.7143, "entries": 4, "max_entries": 1024,
+                "fresh_seconds": 21600, "mongo_enabled": true
+            }
+        }
+    """
+    if not METIS_AVAILABLE:
+        return jsonify({"error": "METIS evaluation service unavailable"}), 503
+    
+    return jsonify({
+        **response_cache.cache.info(),
+        "rate_limit": rate_limit.scheduler.info(),
+        "snapshots": github_snapshots.store.info(),
+    }), 200
+
+
 @evaluation_bp.route('/evaluate/<application_id>', methods=['POST'])
 def evaluate_application(application_id):
     """
@@ -108,11 +172,16 @@ def evaluate_application(application_id):
         github_url = profile_snapshot.get('githubUrl')
         portfolio_url = profile_snapshot.get('portfolioUrl')
         
+        # Score under the job's rubric (default unless /rescore changed it)
+        rubric = job_rubric(db.jobs.find_one({"_id": application.get('jobId')}, {"metisRubric": 1}))
+        
         # Run METIS evaluation
-        evaluation = evaluate_candidate(
+        evaluation, features = evaluate_candidate(
             resume_text=resume_text,
             github_url=github_url,
-            portfolio_url=portfolio_url
+            portfolio_url=portfolio_url,
+            with_features=True,
+            rubric=rubric
         )
         
         # Update application with evaluation
@@ -121,7 +190,9 @@ def evaluate_application(application_id):
             {
                 "$set": {
                     "metisEvaluation": evaluation,
+                    "metisFeatures": features or None,
                     "metisScore": evaluation.get('overall_score', 0),
+                    "metisInputFingerprint": input_fingerprint(resume_text, github_url, portfolio_url, rubric),
                     "evaluatedAt": datetime.now()
                 }
             }
@@ -141,25 +212,84 @@ def batch_evaluate_applications(job_id):
     """
     Evaluate all applications for a job using METIS.
     
-    Runs METIS evaluation on all pending applications.
+    Runs METIS evaluation on all pending applications under the job's
+    rubric. Applications whose resume, GitHub URL, portfolio URL, engine
+    version and rubric are unchanged since their last evaluation (same
+    metisInputFingerprint) are skipped unless ?force=true is given.
+    
+    A call stops starting evaluations after BATCH_TIME_BUDGET seconds, or
+    when GitHub's rate limit would hold one past the wait the scheduler
+    allows batch work. The response then reports "remaining" (and
+    "retryAfter" seconds when rate limited); calling again picks up where
+    this call stopped. With ?force=true a resumed call starts over.
     """
     if not METIS_AVAILABLE:
         return jsonify({"error": "METIS evaluation service unavailable"}), 503
     
+    force = request.args.get('force', '').lower() == 'true'
+    
     try:
         db = get_db()
         
+        job = db.jobs.find_one({"_id": ObjectId(job_id)}, {"metisRubric": 1})
+        if not job:
+            return jsonify({"error": "Job not found"}), 404
+        rubric = job_rubric(job)
+        
         # Get all applications for this job
-        applications = list(db.applications.find({"jobId": ObjectId(job_id)}))
+        applications = list(db.applications.find(
+            {"jobId": ObjectId(job_id)},
+            {
+                "candidateId": 1,
+                "candidateName": 1,
+                "profileSnapshot.resumeText": 1,
+                "profileSnapshot.githubUrl": 1,
+                "profileSnapshot.portfolioUrl": 1,
+                "metisInputFingerprint": 1,
+                "metisEvaluation.enrichment_pending": 1
+            }
+        ))
         
         if not applications:
             return jsonify({"message": "No applications found"}), 200
         
+        def is_unchanged(app):
+            snapshot = app.get('profileSnapshot', {})
+            # A fingerprint is only stored next to an evaluation; one still
+            # waiting on background enrichment is not final yet
+            return (
+                not force
+                and not (app.get('metisEvaluation') or {}).get('enrichment_pending')
+                and app.get('metisInputFingerprint') == input_fingerprint(
+                    snapshot.get('resumeText', ''),
+                    snapshot.get('githubUrl'),
+                    snapshot.get('portfolioUrl'),
+                    rubric
+                )
+            )
+        
+        stale = [app for app in applications if not is_unchanged(app)]
+        unchanged_count = len(applications) - len(stale)
+        
         evaluated_count = 0
         skipped_count = 0
         errors = []
-        
-        for app in applications:
+        remaining_count = 0
+        retry_after = None
+        deadline = time.time() + BATCH_TIME_BUDGET
+        
+        for index, app in enumerate(stale):
+            if time.time() >= deadline:
+                remaining_count = len(stale) - index
+                break
+            
+            if index % BATCH_PARSE_WINDOW == 0:
+                # Parse the next window of resumes on all cores; the
+                # evaluations below then read them from the parse cache.
+                window = stale[index:index + BATCH_PARSE_WINDOW]
+                snapshot_texts = [a.get('profileSnapshot', {}).get('resumeText', '') for a in window]
+                parse_many([t for t in snapshot_texts if t])
+            
             try:
                 candidate_id = app.get('candidateId')
                 profile_snapshot = app.get('profileSnapshot', {})
@@ -181,12 +311,24 @@ def batch_evaluate_applications(job_id):
                     errors.append(f"No resume text for candidate {app.get('candidateName', 'Unknown')}")
                     continue
                 
-                # Run METIS evaluation
-                evaluation = evaluate_candidate(
-                    resume_text=resume_text,
-                    github_url=profile_snapshot.get('githubUrl'),
-                    portfolio_url=profile_snapshot.get('portfolioUrl')
-                )
+                # Run METIS evaluation; its GitHub requests yield to
+                # interactive ones and wait out short rate limit pauses
+                github_url = profile_snapshot.get('githubUrl')
+                portfolio_url = profile_snapshot.get('portfolioUrl')
+                try:
+                    with batch_priority(deadline):
+                        evaluation, features = evaluate_candidate(
+                            resume_text=resume_text,
+                            github_url=github_url,
+                            portfolio_url=portfolio_url,
+                            with_features=True,
+                            rubric=rubric
+                        )
+                except RateLimited as e:
+                    # Stop before this application; the rest need the next window
+                    remaining_count = len(stale) - index
+                    retry_after = round(e.reset_in)
+                    break
                 
                 # Update application
                 db.applications.update_one(
@@ -194,7 +336,9 @@ def batch_evaluate_applications(job_id):
                     {
                         "$set": {
                             "metisEvaluation": evaluation,
+                            "metisFeatures": features or None,
                             "metisScore": evaluation.get('overall_score', 0),
+                            "metisInputFingerprint": input_fingerprint(resume_text, github_url, portfolio_url, rubric),
                             "evaluatedAt": datetime.now()
                         }
                     }
@@ -205,17 +349,33 @@ def batch_evaluate_applications(job_id):
             except Exception as e:
                 errors.append(f"Error evaluating {app.get('candidateName', 'Unknown')}: {str(e)}")
         
-        if evaluated_count == 0:
+        if evaluated_count == 0 and retry_after is not None:
+            return jsonify({
+                "error": f"GitHub rate limit reached. Try again in {retry_after} seconds.",
+                "remaining": remaining_count,
+                "retryAfter": retry_after
+            }), 429, {"Retry-After": str(retry_after)}
+        
+        if evaluated_count == 0 and unchanged_count == 0 and remaining_count == 0:
             return jsonify({
                 "error": f"No applications could be evaluated. {skipped_count} applications have no resume text.",
                 "details": "Please ensure candidates have uploaded resumes before evaluation.",
                 "errors": errors
             }), 400
         
+        message = f"Evaluated {evaluated_count} of {len(applications)} applications"
+        if retry_after is not None:
+            message += f"; GitHub rate limit reached, run again in {retry_after} seconds to evaluate the remaining {remaining_count}"
+        elif remaining_count:
+            message += f"; run again to evaluate the remaining {remaining_count}"
+        
         return jsonify({
-            "message": f"Evaluated {evaluated_count} of {len(applications)} applications",
+            "message": message,
             "evaluated": evaluated_count,
+            "unchanged": unchanged_count,
             "skipped": skipped_count,
+            "remaining": remaining_count,
+            "retryAfter": retry_after,
             "total": len(applications),
             "errors": errors if errors else None
         }), 200
@@ -224,6 +384,129 @@ def batch_evaluate_applications(job_id):
         return jsonify({"error": str(e)}), 500
 
 
+@evaluation_bp.route('/rescore/<job_id>', methods=['POST'])
+def rescore_applications(job_id):
+    """
+    Re-score a job's applications from their stored METIS feature records.
+    
+    Applies the default rubric with the given overrides to each
+    application's metisFeatures and stores the overrides on the job
+    (metisRubric), so later evaluations of its applications use the same
+    rubric; "rubric": {} goes back to the default. Without "rubric" the
+    job's stored rubric is re-applied. Eligibility is re-checked against
+    the new score. Nothing is re-parsed or re-fetched, and
+    every application is scored in one vectorized pass and written back in
+    one bulk write, so this is cheap enough to run after every rubric
+    change. Applications without current-version features need
+    /batch-evaluate instead. The others get their metisInputFingerprint
+    under the new rubric, so /batch-evaluate keeps skipping them while
+    their inputs stay the same.
+    
+    Only scores are rewritten by default: the stored signals, confidence
+    and reasoning were built under the previous rubric and are marked
+    metisEvaluation.signals_stale. Pass "signals": true to rebuild them too
+    (one full engine run per application).
+    
+    Request JSON (optional):
+        {
+            "rubric": {"section_max": {"skill_evidence": 25}, "degree": 6},
+            "signals": false
+        }
+    
+    Response:
+        {"rescored": 120, "stale": 3, "total": 123}
+    """
+    if not METIS_AVAILABLE:
+        return jsonify({"error": "METIS evaluation service unavailable"}), 503
+    
+    data = request.get_json(silent=True) or {}
+    overrides = data.get('rubric') or {}
+    try:
+        rubric = rubric_with(overrides)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    with_signals = bool(data.get('signals'))
+    
+    try:
+        db = get_db()
+        
+        job = db.jobs.find_one({"_id": ObjectId(job_id)}, {"metisRubric": 1})
+        if not job:
+            return jsonify({"error": "Job not found"}), 404
+        previous_rubric = job_rubric(job)
+        if 'rubric' not in data:
+            rubric = previous_rubric
+        
+        applications = list(db.applications.find(
+            {"jobId": ObjectId(job_id)},
+            {
+                "metisFeatures": 1,
+                "resumeScore": 1,
+                "metisEvaluation.risk_signals": 1,
+                "metisInputFingerprint": 1,
+                "profileSnapshot.resumeText": 1,
+                "profileSnapshot.githubUrl": 1,
+                "profileSnapshot.portfolioUrl": 1
+            }
+        ))
+        
+        current = [
+            app for app in applications
+            if (app.get('metisFeatures') or {}).get('version') == FEATURES_VERSION
+        ]
+        batch = rescore_batch([app['metisFeatures'] for app in current], rubric)
+        
+        # Stored only once it has scored, so a rubric that fails never
+        # becomes the one the job's later evaluations use
+        if 'rubric' in data:
+            db.jobs.update_one({"_id": job['_id']}, {"$set": {"metisRubric": overrides or None}})
+        if not applications:
+            return jsonify({"message": "No applications found"}), 200
+        
+        rescored_at = datetime.now()
+        updates = []
+        for row, app in enumerate(current):
+            if with_signals:
+                evaluation = batch.result(row)
+                update = {"metisEvaluation": evaluation}
+            else:
+                # The relevance risks check_eligibility counts don't come from rubric points
+                evaluation = batch.scores(row)
+                evaluation['risk_signals'] = (app.get('metisEvaluation') or {}).get('risk_signals', [])
+                update = {
+                    "metisEvaluation.overall_score": evaluation['overall_score'],
+                    "metisEvaluation.section_scores": evaluation['section_scores'],
+                    "metisEvaluation.signals_stale": True,
+                }
+            update["metisScore"] = evaluation['overall_score']
+            update["eligible"] = check_eligibility(evaluation) is None
+            update["rescoredAt"] = rescored_at
+            # Round 1 score is read from resumeScore when present
+            if 'resumeScore' in app:
+                update["resumeScore"] = evaluation['overall_score']
+            # The fingerprint covers the rubric; move it along so
+            # /batch-evaluate does not redo the work this replaced, unless
+            # the inputs changed since the last evaluation anyway
+            snapshot = app.get('profileSnapshot', {})
+            inputs = (snapshot.get('resumeText', ''), snapshot.get('githubUrl'), snapshot.get('portfolioUrl'))
+            if app.get('metisInputFingerprint') == input_fingerprint(*inputs, previous_rubric):
+                update["metisInputFingerprint"] = input_fingerprint(*inputs, rubric)
+            updates.append(UpdateOne({"_id": app['_id']}, {"$set": update}))
+        
+        if updates:
+            db.applications.bulk_write(updates, ordered=False)
+        
+        return jsonify({
+            "message": f"Re-scored {len(current)} of {len(applications)} applications",
+            "rescored": len(current),
+            "stale": len(applications) - len(current),
+            "total": len(applications)
+        }), 200
+        
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+
 @evaluation_bp.route('/evaluate-interview/<application_id>', methods=['POST'])
 def evaluate_interview_endpoint(application_id):
     """
@@ -143,24 +143,20 @@ def upload_resume():
         # Read file content
         try:
             if file.filename.lower().endswith('.pdf'):
-                # Use METIS PDF extraction
+                # Use METIS PDF extraction straight from the upload buffer
+                # (page and character budgets bound the work)
                 from models.metis.resume_parser import extract_text_from_pdf
-                import tempfile
-                import os
                 
                 print("Extracting text from PDF...")
-                # Save temporarily
-                with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as tmp_file:
-                    file.save(tmp_file.name)
-                    tmp_path = tmp_file.name
+                raw_text = extract_text_from_pdf(file.read())
+                print(f"Extracted {len(raw_text)} characters from PDF")
+            elif file.filename.lower().endswith('.docx'):
+                # DOCX is streamed out of the zip in memory, within the same kind of budget
+                from models.metis.resume_parser import extract_text_from_docx
                 
-                try:
-                    raw_text = extract_text_from_pdf(tmp_path)
-                    print(f"Extracted {len(raw_text)} characters from PDF")
-                finally:
-                    # Clean up temp file
-                    if os.path.exists(tmp_path):
-                        os.remove(tmp_path)
+                print("Extracting text from DOCX...")
+                raw_text = extract_text_from_docx(file.read())
+                print(f"Extracted {len(raw_text)} characters from DOCX")
             else:
                 # Text file
                 print("Reading text file...")
@@ -184,11 +180,15 @@ def upload_resume():
 
     # Parse resume with comprehensive extraction
     try:
-        # Use METIS parser
-        from models.metis.resume_parser import parse as metis_parse
+        # Use METIS parser; on re-upload only sections whose text changed are re-parsed
+        from models.metis.resume_parser import parse_incremental
+        previous = (user.get('resume') or {}).get('parsedData') or {}
         print("Parsing resume with METIS parser...")
-        metis_data = metis_parse(raw_text)
-        print(f"METIS parsing complete. Found {len(metis_data.get('skills', []))} skills")
+        metis_data, changed_sections = parse_incremental(
+            raw_text, previous, previous.get("sectionFingerprints")
+        )
+        print(f"METIS parsing complete. Found {len(metis_data.get('skills', []))} skills, "
+              f"changed sections: {', '.join(changed_sections) or 'none'}")
         
         # Convert METIS format to application format
         parsed_data = {
@@ -203,6 +203,12 @@ def upload_resume():
             "projects": metis_data.get("projects", []),
             "certifications": metis_data.get("certifications", []),
             "experience": metis_data.get("experience", []),
+            # Set when the parsing budget cut the resume or a section short
+            "partial": metis_data.get("partial", False),
+            # Per-section input fingerprints for incremental re-parsing
+            "sectionFingerprints": metis_data.get("section_fingerprints", {}),
+            # Sections that differ from the previous upload, for re-evaluation
+            "changedSections": changed_sections,
         }
                 
     except Exception as e:
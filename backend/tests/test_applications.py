@@ -0,0 +1,64 @@
+"""Late enrichment results on submitted applications (routes.applications)."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from routes import applications
+
+
+class FakeApplications:
+    """The slice of a pymongo collection store_full_evaluation uses."""
+    
+    def __init__(self, docs):
+        self.docs = {doc["_id"]: doc for doc in docs}
+    
+    def update_one(self, query, update):
+        doc = self.docs.get(query["_id"])
+        status = query.get("status")
+        if doc is None or (status is not None and doc.get("status") not in status["$in"]):
+            return SimpleNamespace(matched_count=0)
+        doc.update(update.get("$set", {}))
+        for field, value in update.get("$push", {}).items():
+            doc.setdefault(field, []).append(value)
+        return SimpleNamespace(matched_count=1)
+
+
+@pytest.fixture
+def store(monkeypatch):
+    def make(status):
+        collection = FakeApplications([{"_id": 1, "status": status, "eligible": True, "timeline": []}])
+        monkeypatch.setattr(applications, "db", SimpleNamespace(applications=collection))
+        return collection.docs[1]
+    return make
+
+
+def test_late_ineligible_result_rejects_an_application_accepted_on_a_partial_score(store):
+    doc = store("under_review")
+    
+    applications.store_full_evaluation(1, {"overall_score": 14}, {}, "Resume score too low")
+    
+    assert doc["status"] == "rejected"
+    assert doc["eligible"] is False
+    assert doc["rejectionReason"] == "Resume score too low"
+    assert doc["timeline"][-1]["event"] == "Application Rejected"
+
+
+def test_eligible_result_keeps_the_application(store):
+    doc = store("under_review")
+    
+    applications.store_full_evaluation(1, {"overall_score": 55}, {}, None)
+    
+    assert doc["status"] == "under_review"
+    assert doc["eligible"] is True
+    assert doc["resumeScore"] == 55
+
+
+def test_late_ineligible_result_flags_an_application_a_recruiter_moved_on(store):
+    doc = store("assessment_sent")
+    
+    applications.store_full_evaluation(1, {"overall_score": 14}, {}, "Resume score too low")
+    
+    assert doc["status"] == "assessment_sent"
+    assert doc["eligible"] is False
+    assert doc["eligibilityReview"] is True
@@ -0,0 +1,33 @@
+"""DOCX text extraction (resume_parser.iter_docx_paragraphs)."""
+
+import io
+import zipfile
+
+from models.metis import resume_parser
+
+
+W = 'xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"'
+
+
+def make_docx(body: str) -> bytes:
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w") as z:
+        z.writestr("[Content_Types].xml", "<Types/>")
+        z.writestr("word/document.xml", f"<w:document {W}><w:body>{body}</w:body></w:document>")
+    return buf.getvalue()
+
+
+def test_tab_stop_definitions_are_not_text():
+    tab_stops = '<w:pPr><w:tabs><w:tab w:val="left" w:pos="720"/><w:tab w:val="right" w:pos="9360"/></w:tabs></w:pPr>'
+    body = (
+        f"<w:p>{tab_stops}<w:r><w:t>Jane Doe</w:t></w:r></w:p>"
+        f'<w:p>{tab_stops}<w:r><w:t>Engineer</w:t><w:tab/><w:t xml:space="preserve">2020 - 2023</w:t></w:r></w:p>'
+    )
+    
+    assert resume_parser.extract_text_from_docx(make_docx(body)) == "Jane Doe\nEngineer\t2020 - 2023"
+
+
+def test_breaks_inside_runs_are_kept():
+    body = "<w:p><w:r><w:t>Line one</w:t><w:br/><w:t>Line two</w:t></w:r></w:p>"
+    
+    assert resume_parser.extract_text_from_docx(make_docx(body)) == "Line one\nLine two"
@@ -308,9 +308,13 @@ export default function ProfilePage() {
     if (!file) return;
 
     // Check file type
-    const allowedTypes = ['text/plain', 'application/pdf'];
+    const allowedTypes = [
+      'text/plain',
+      'application/pdf',
+      'application/vnd.openxmlformats-officedocument.wordprocessingml.document',
+    ];
     if (!allowedTypes.includes(file.type)) {
-      toast.error('Please upload a PDF or text file');
+      toast.error('Please upload a PDF, DOCX or text file');
       return;
     }
 
@@ -602,21 +606,21 @@ export default function ProfilePage() {
                     ) : (
                       <>
                         <Upload className="h-4 w-4 mr-2" />
-                        Upload Resume (PDF/TXT)
+                        Upload Resume (PDF/DOCX/TXT)
                       </>
                     )}
                   </Button>
                   <input
                     ref={fileInputRef}
                     type="file"
-                    accept=".pdf,.txt"
+                    accept=".pdf,.docx,.txt"
                     onChange={handleResumeUpload}
                     className="hidden"
                   />
                 </div>
                 <div className="flex items-center gap-2 text-xs text-muted-foreground">
                   <FileText className="h-3 w-3" />
-                  <span>Supported formats: PDF, TXT • Max size: 5MB</span>
+                  <span>Supported formats: PDF, DOCX, TXT • Max size: 5MB</span>
                 </div>
               </div>
             </CardContent>